@@ -1,27 +1,45 @@
 # FunctionsAP/__init__.py
 from .utilities import (
     join_files,
+    iter_join_files,
+    write_join_files,
+    write_dataframe,
     columns_add,
+    columns_add_batch,
     eliminar_valor_columna1,
     procesar_valores,
     handle_missing_data,
     normalize_and_merge_columns,
-    data_base_genetic
+    extract_dates_from_filenames,
+    data_base_genetic,
+    data_base_genetic_batch,
+    optimize_dtypes
 )
 from .statistics import diseño_rcbd, FieldLayout, modific_outlier
 from .graph import barplot_line_grouped_stacked
+# Registra el accesor df.fap
+from .accessor import FapAccessor, FapPipeline
 
 # Lista de símbolos exportados
 __all__ = [
     "join_files",
+    "iter_join_files",
+    "write_join_files",
+    "write_dataframe",
     "columns_add",
+    "columns_add_batch",
     "eliminar_valor_columna1",
     "procesar_valores",
     "handle_missing_data",
     "normalize_and_merge_columns",
+    "extract_dates_from_filenames",
     "data_base_genetic",
+    "data_base_genetic_batch",
+    "optimize_dtypes",
     "diseño_rcbd",
     "FieldLayout",
     "modific_outlier",
-    "barplot_line_grouped_stacked"
+    "barplot_line_grouped_stacked",
+    "FapAccessor",
+    "FapPipeline"
 ]
\ No newline at end of file
@@ -0,0 +1,167 @@
+import inspect
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from .utilities.procesar_valores import procesar_valores
+from .utilities.columns_add import columns_add
+from .utilities.eliminar_valor_columna1 import eliminar_valor_columna1
+from .utilities.handle_missing_data import handle_missing_data
+from .statistics.modific_outlier import modific_outlier
+
+# Funciones que se pueden encadenar con df.fap. Las que admiten 'inplace' trabajan sobre la copia de la
+# cadena; modific_outlier no modifica el DataFrame recibido (eliminar=True devuelve uno nuevo con drop)
+PIPELINE_STEPS: Dict[str, Callable] = {
+    'procesar_valores': procesar_valores,
+    'columns_add': columns_add,
+    'eliminar_valor_columna1': eliminar_valor_columna1,
+    'handle_missing_data': handle_missing_data,
+    'modific_outlier': modific_outlier,
+}
+
+def _supports_inplace(func: Callable) -> bool:
+    return 'inplace' in inspect.signature(func).parameters
+
+def _bound_arguments(func: Callable, args: tuple, kwargs: dict) -> Dict[str, object]:
+    """
+    Argumentos de un paso asociados a los nombres de los parámetros de func (el primero es el DataFrame).
+    """
+    return inspect.signature(func).bind_partial(None, *args, **kwargs).arguments
+
+def _is_terminal(name: str, args: tuple, kwargs: dict) -> bool:
+    """
+    Indica si un paso devuelve un resultado distinto de un DataFrame (informe o índices), por lo que
+    solo puede ser el último de la cadena.
+    """
+    if name == 'handle_missing_data':
+        mode = kwargs.get('mode', args[3] if len(args) > 3 else 'detect')
+        return mode != 'fill'
+    if name == 'modific_outlier':
+        eliminar = kwargs.get('eliminar', args[1] if len(args) > 1 else False)
+        return not eliminar
+    if name == 'eliminar_valor_columna1':
+        return bool(kwargs.get('return_count', args[3] if len(args) > 3 else False))
+    return False
+
+class FapPipeline:
+    """
+    Cadena diferida de funciones de FunctionsAP sobre un DataFrame.
+
+    Cada método registra un paso y devuelve una nueva cadena; nada se ejecuta hasta llamar a collect().
+    Al ejecutar, el DataFrame original no se modifica: el primer paso devuelve un DataFrame nuevo y los
+    siguientes trabajan en el lugar sobre ese resultado (procesar_valores, columns_add,
+    eliminar_valor_columna1 y handle_missing_data en modo 'fill'), sin copias intermedias.
+    Por eso los pasos no aceptan el argumento 'inplace': lo fija la cadena.
+    modific_outlier con eliminar=True sigue creando un DataFrame nuevo sin las filas eliminadas.
+
+    Ejemplo:
+        df_limpio = (
+            df.fap.procesar_valores(convertir_vacios=True, trim_strings=True)
+              .columns_add(["Peso1", "Peso2"], name_column_new="Peso")
+              .handle_missing_data(["Peso"], "Codigo", "Semana", mode="fill", verbose=False)
+              .collect()
+        )
+    """
+
+    def __init__(self, obj: pd.DataFrame, steps: Optional[List[Tuple[str, tuple, dict]]] = None):
+        self._obj = obj
+        self._steps = list(steps or [])
+
+    def _add(self, name: str, args: tuple, kwargs: dict) -> 'FapPipeline':
+        if self._steps and _is_terminal(*self._steps[-1]):
+            raise ValueError(
+                f"El paso '{self._steps[-1][0]}' no devuelve un DataFrame y debe ser el último de la cadena."
+            )
+        func = PIPELINE_STEPS[name]
+        # La cadena decide cuándo se trabaja en el lugar: solo sobre su propia copia, nunca sobre el original
+        if _supports_inplace(func) and 'inplace' in _bound_arguments(func, args, kwargs):
+            raise ValueError(
+                f"El paso '{name}' no admite 'inplace' dentro de una cadena; el DataFrame original nunca se modifica."
+            )
+        return FapPipeline(self._obj, self._steps + [(name, args, kwargs)])
+
+    @property
+    def steps(self) -> List[str]:
+        """
+        Nombres de los pasos registrados, en orden.
+        """
+        return [name for name, _, _ in self._steps]
+
+    def __repr__(self) -> str:
+        return f"FapPipeline({' -> '.join(self.steps) or 'sin pasos'})"
+
+    def procesar_valores(self, *args, **kwargs) -> 'FapPipeline':
+        """Registra un paso de procesar_valores (ver procesar_valores)."""
+        return self._add('procesar_valores', args, kwargs)
+
+    def columns_add(self, *args, **kwargs) -> 'FapPipeline':
+        """Registra un paso de columns_add (ver columns_add)."""
+        return self._add('columns_add', args, kwargs)
+
+    def eliminar_valor_columna1(self, *args, **kwargs) -> 'FapPipeline':
+        """Registra un paso de eliminar_valor_columna1. Con return_count=True debe ser el último paso."""
+        return self._add('eliminar_valor_columna1', args, kwargs)
+
+    def handle_missing_data(self, *args, **kwargs) -> 'FapPipeline':
+        """Registra un paso de handle_missing_data. En modo 'detect' debe ser el último paso."""
+        return self._add('handle_missing_data', args, kwargs)
+
+    def modific_outlier(self, *args, **kwargs) -> 'FapPipeline':
+        """Registra un paso de modific_outlier. Con eliminar=False (índices) debe ser el último paso."""
+        return self._add('modific_outlier', args, kwargs)
+
+    def collect(self):
+        """
+        Ejecuta los pasos registrados en una sola pasada.
+
+        Devuelve:
+            El DataFrame resultante, o el resultado del último paso si este no devuelve un DataFrame
+            (informe de handle_missing_data en modo 'detect', índices de modific_outlier o la tupla con el
+            recuento de eliminar_valor_columna1).
+        """
+        result = self._obj
+        # True cuando result ya es una copia propia y se puede modificar sin afectar al DataFrame original
+        owned = False
+        for name, args, kwargs in self._steps:
+            func = PIPELINE_STEPS[name]
+            if _supports_inplace(func):
+                kwargs = dict(kwargs, inplace=owned)
+            result = func(result, *args, **kwargs)
+            owned = True
+        return result
+
+@pd.api.extensions.register_dataframe_accessor("fap")
+class FapAccessor:
+    """
+    Accesor df.fap para encadenar funciones de FunctionsAP de forma diferida.
+
+    Las cadenas se ejecutan con collect(). Ver FapPipeline.
+
+    Ejemplo:
+        import FunctionsAP
+        df_sin_outliers = df.fap.modific_outlier(["Peso"], eliminar=True).collect()
+    """
+
+    def __init__(self, pandas_obj: pd.DataFrame):
+        self._obj = pandas_obj
+
+    def pipeline(self) -> FapPipeline:
+        """
+        Devuelve una cadena vacía sobre el DataFrame.
+        """
+        return FapPipeline(self._obj)
+
+    def procesar_valores(self, *args, **kwargs) -> FapPipeline:
+        return self.pipeline().procesar_valores(*args, **kwargs)
+
+    def columns_add(self, *args, **kwargs) -> FapPipeline:
+        return self.pipeline().columns_add(*args, **kwargs)
+
+    def eliminar_valor_columna1(self, *args, **kwargs) -> FapPipeline:
+        return self.pipeline().eliminar_valor_columna1(*args, **kwargs)
+
+    def handle_missing_data(self, *args, **kwargs) -> FapPipeline:
+        return self.pipeline().handle_missing_data(*args, **kwargs)
+
+    def modific_outlier(self, *args, **kwargs) -> FapPipeline:
+        return self.pipeline().modific_outlier(*args, **kwargs)
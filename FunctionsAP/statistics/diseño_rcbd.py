@@ -8,9 +8,43 @@ import pandas as pd
 
 
 class FieldLayout:
-    def __init__(self, book, plan):
+    def __init__(self, book, plan=None, matrices=None):
         self.book = book
-        self.plan = plan  # Agregamos el plan al objeto
+        self._plan = dict(plan) if plan is not None else {}
+        # Matrices (bloque, fila, columna) con los genotipos; el plan de cada bloque se arma a partir de ellas al pedirlo
+        self._matrices = matrices
+
+    @property
+    def plan(self):
+        """
+        Diccionario {bloque: DataFrame} con la disposición de genotipos de cada bloque.
+        Los DataFrames se construyen en el primer acceso y quedan guardados en la instancia.
+        """
+        if self._matrices is not None:
+            self._plan = {bloque: self._plan_bloque(bloque) for bloque in range(1, len(self._matrices) + 1)}
+            # Con todos los bloques construidos ya no hacen falta las matrices
+            self._matrices = None
+        return self._plan
+
+    @plan.setter
+    def plan(self, plan):
+        self._plan = dict(plan)
+        self._matrices = None
+
+    def _plan_bloque(self, bloque):
+        """
+        Devuelve el DataFrame del plan de un bloque, construyéndolo solo si aún no existe.
+        """
+        if (bloque not in self._plan and self._matrices is not None
+                and isinstance(bloque, (int, np.integer)) and 1 <= bloque <= len(self._matrices)):
+            matriz = self._matrices[bloque - 1]
+            nr, nc = matriz.shape
+            self._plan[bloque] = pd.DataFrame(
+                matriz,
+                index=[f'Fila {i+1}' for i in range(nr)],
+                columns=[f'Columna {j+1}' for j in range(nc)]
+            )
+        return self._plan.get(bloque)
 
     def plot_book(self):
         plot_data = self.book.copy()
@@ -172,9 +206,10 @@ class FieldLayout:
             bloque (int): Número del bloque a mostrar. Si es None, muestra todos.
         """
         if bloque is not None:
-            if bloque in self.plan:
+            plan_bloque = self._plan_bloque(bloque)
+            if plan_bloque is not None:
                 print(f"Plan del Bloque {bloque}:\n")
-                print(self.plan[bloque])
+                print(plan_bloque)
             else:
                 print(f"El bloque {bloque} no existe en el diseño.")
         else:
@@ -190,9 +225,8 @@ def fp(nr, nc, serpentine):
     # (La función permanece igual)
     plan_id = np.arange(1, nr * nc + 1).reshape(nr, nc, order='F')  # Llenar por columnas
     if serpentine == 'yes':
-        for i in range(nr):
-            if i % 2 != 0:
-                plan_id[i, :] = plan_id[i, ::-1]
+        # Invertir las filas impares en una sola operación
+        plan_id[1::2] = plan_id[1::2, ::-1]
     return plan_id
 
 def diseño_rcbd(geno, nb, nc=None, serpentine='yes', alongside='no'):
@@ -217,61 +251,38 @@ def diseño_rcbd(geno, nb, nc=None, serpentine='yes', alongside='no'):
     # Generar plan_id
     plan_id = fp(nr, nc, serpentine)
 
-    # Crear el plan de campo
-    plan = {}  # Usaremos un diccionario para almacenar el plan de cada bloque
-
-    # Crear el libro de campo
-    records = []
-
+    # Matrices de genotipos de todos los bloques (bloque, fila, columna), rellenas por columnas
+    matrices = np.full((nb, nr * nc), None, dtype=object)
     for k in range(nb):
         # Asignar genotipos aleatoriamente
-        sg = np.random.permutation(geno)
-        # Ajustar el tamaño de sg si es necesario
-        sg_full = np.full(nr * nc, None, dtype=object)
-        sg_full[:len(sg)] = sg
-        # Crear la matriz del plan para este bloque
-        block_plan = sg_full.reshape(nr, nc, order='F')
-
-        # Si se usa orden serpentino, aplicar la inversión de columnas en filas impares
-        if serpentine == 'yes':
-            for i in range(nr):
-                if i % 2 != 0:
-                    block_plan[i, :] = block_plan[i, ::-1]
-
-        # Convertir la matriz a DataFrame para mejor legibilidad
-        block_df = pd.DataFrame(
-            block_plan,
-            index=[f'Fila {i+1}' for i in range(nr)],
-            columns=[f'Columna {j+1}' for j in range(nc)]
-        )
-        # Agregar al diccionario del plan
-        plan[k + 1] = block_df
-
-        # Agregar registros al libro de campo
-        for i in range(nr):
-            for j in range(nc):
-                genotype = block_plan[i, j]
-                if genotype is not None:
-                    plot_number = plan_id[i, j] + ng * k  # Número de parcela
-                    fila = i + 1
-                    columna = j + 1
-                    bloque = k + 1
-
-                    # Ajustar filas y columnas según 'alongside'
-                    if alongside == 'rows':
-                        columna += k * nc
-                    elif alongside == 'columns':
-                        fila += k * nr
-
-                    records.append({
-                        'Plot': plot_number,
-                        'bloque': bloque,
-                        'fila': fila,
-                        'columna': columna,
-                        'genotipo': genotype
-                    })
-
-    book = pd.DataFrame(records)
+        matrices[k, :ng] = np.random.permutation(geno)
+    matrices = matrices.reshape(nb, nc, nr).transpose(0, 2, 1)
+
+    # Si se usa orden serpentino, invertir las columnas de las filas impares de todos los bloques a la vez
+    if serpentine == 'yes':
+        matrices[:, 1::2] = matrices[:, 1::2, ::-1]
+
+    # Crear el libro de campo con aritmética de índices, en el mismo orden (bloque, fila, columna)
+    k, i, j = np.indices((nb, nr, nc))
+    # Solo se omiten las celdas vacías (None), como antes; un genotipo pd.NA o NaN también es una parcela
+    presentes = matrices != None  # noqa: E711  (comparación elemento a elemento del arreglo)
+    plot_number = plan_id[np.newaxis] + ng * k  # Número de parcela
+    fila = i + 1
+    columna = j + 1
+
+    # Ajustar filas y columnas según 'alongside'
+    if alongside == 'rows':
+        columna = columna + k * nc
+    elif alongside == 'columns':
+        fila = fila + k * nr
+
+    book = pd.DataFrame({
+        'Plot': plot_number[presentes],
+        'bloque': k[presentes] + 1,
+        'fila': fila[presentes],
+        'columna': columna[presentes],
+        'genotipo': matrices[presentes]
+    }).infer_objects()  # Genotipos numéricos conservan su tipo
 
     # Ordenar por número de parcela si serpentine es 'yes'
     if serpentine == 'yes' and nr > 1:
@@ -279,8 +290,5 @@ def diseño_rcbd(geno, nb, nc=None, serpentine='yes', alongside='no'):
     else:
         book = book.sort_values(['bloque', 'fila', 'columna']).reset_index(drop=True)
 
-    # Reordenar columnas
-    book = book[['Plot', 'bloque', 'fila', 'columna', 'genotipo']]
-
-    # Retornar la instancia de FieldLayout con el plan actualizado
-    return FieldLayout(book, plan)
\ No newline at end of file
+    # Retornar la instancia de FieldLayout; el plan de cada bloque se construye al pedirlo
+    return FieldLayout(book, matrices=matrices)
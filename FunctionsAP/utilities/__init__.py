@@ -1,19 +1,28 @@
 # FunctionsAP/utilities/__init__.py
 
-from .columns_add import columns_add
+from .columns_add import columns_add, columns_add_batch
 from .eliminar_valor_columna1 import eliminar_valor_columna1
-from .join_files import join_files, normalize_and_merge_columns
+from .join_files import join_files, iter_join_files, normalize_and_merge_columns, extract_dates_from_filenames
+from .write_join_files import write_join_files, write_dataframe
 from .procesar_valores import procesar_valores
-from .data_base_genetic import data_base_genetic
+from .data_base_genetic import data_base_genetic, data_base_genetic_batch
 from .handle_missing_data import handle_missing_data
+from .optimize_dtypes import optimize_dtypes
 
 # Reexporta las funciones para que estén disponibles en el módulo utilities
 __all__ = [
     "columns_add",
+    "columns_add_batch",
     "eliminar_valor_columna1",
     "join_files",
+    "iter_join_files",
+    "write_join_files",
+    "write_dataframe",
     "normalize_and_merge_columns",
+    "extract_dates_from_filenames",
     "procesar_valores",
     "data_base_genetic",
-    "handle_missing_data"
+    "data_base_genetic_batch",
+    "handle_missing_data",
+    "optimize_dtypes"
 ]
\ No newline at end of file
@@ -1,6 +1,28 @@
 import pandas as pd
 import numpy as np
 
+# Claves admitidas en cada especificación de columns_add_batch
+SPEC_KEYS = ['columns', 'name_column_new', 'type', 'drop', 'separator', 'operation']
+
+# Nombre de cada tipo en los mensajes de error
+TYPE_LABELS = {"number": "Number", "text": "Text", "date": "Date"}
+
+# Operación por defecto y operaciones admitidas para cada tipo
+DEFAULT_OPERATIONS = {"number": "sum", "text": "concat", "date": "mean"}
+OPERATIONS = {
+    "number": ["sum", "mean", "prod", "min", "max", "first"],
+    "text": ["concat", "first"],
+    "date": ["min", "max", "mean", "first"],
+}
+
+# Representaciones de texto (en minúsculas) que se consideran vacías al concatenar
+TEXTOS_VACIOS = {'', 'nan', 'none'}
+
+# Tipos (según infer_dtype) cuyos valores distintos tienen también un str() distinto. En los demás
+# factorize puede agrupar valores con textos diferentes: 1, 1.0 y True, 0.0 y -0.0, Decimal('1') y Decimal('1.0'),
+# o la misma hora en zonas horarias distintas
+TIPOS_FACTORIZABLES = {'string', 'empty', 'integer', 'boolean', 'date'}
+
 def columns_add(
     dataframe: pd.DataFrame,
     columns: list,
@@ -8,7 +30,8 @@ def columns_add(
     type: str = "Number",
     drop: bool = True,
     separator: str = "",
-    operation: str = None
+    operation: str = None,
+    inplace: bool = False
 ) -> pd.DataFrame:
     """
     Combina o agrega columnas de un DataFrame, generando una nueva columna a partir de las especificadas.
@@ -24,6 +47,7 @@ def columns_add(
             - Para "Number": "sum" (por defecto), "mean", "prod", "min", "max", "first".
             - Para "Text": "concat" (por defecto), "first".
             - Para "Date": "min", "max", "mean" (por defecto), "first".
+        inplace (bool): Si es True, modifica 'dataframe' directamente en lugar de trabajar sobre una copia. Por defecto es False.
     
     Retorna:
         pd.DataFrame: DataFrame con la nueva columna agregada. Si 'drop' es True, se eliminan las columnas originales.
@@ -35,12 +59,143 @@ def columns_add(
     if not isinstance(dataframe, pd.DataFrame):
         raise TypeError("El argumento 'dataframe' debe ser un pandas DataFrame.")
     
+    name_column_new, type_lower, operation = _validate_spec(
+        columns, name_column_new, type, operation, dataframe.columns
+    )
+    
+    # Crear una copia del DataFrame para no modificar el original, salvo con inplace
+    df = dataframe if inplace else dataframe.copy()
+    
+    # Definir un nombre temporal para la nueva columna para evitar conflictos con nombres existentes
+    temp_column_name = f"CoL$&$umNa_CreADA_{name_column_new}"
+    while temp_column_name in df.columns:
+        temp_column_name += "_temp"
+    
+    new_column, converted = _compute_column(df, columns, type_lower, operation, separator)
+    # Las columnas de fecha quedan convertidas a datetime en el resultado
+    for col, values in converted.items():
+        df[col] = values
+    df[temp_column_name] = new_column
+    
+    # Eliminar las columnas originales si se especifica drop=True
+    if drop:
+        df.drop(columns=columns, inplace=True)
+    
+    # Renombrar la columna temporal al nombre final deseado
+    df.rename(columns={temp_column_name: name_column_new}, inplace=True)
+    
+    return df
+
+def columns_add_batch(dataframe: pd.DataFrame, specs: list) -> pd.DataFrame:
+    """
+    Aplica varias operaciones de columns_add en una sola pasada.
+
+    Todas las especificaciones se validan antes de calcular nada. Cada columna nueva se calcula a partir de los
+    datos originales (o de una columna creada por una especificación anterior), el DataFrame se copia una sola
+    vez y las eliminaciones y renombres se hacen juntos al final. El resultado es el mismo que encadenar las
+    llamadas a columns_add, sin copiar el DataFrame completo en cada una.
+
+    Parámetros:
+        dataframe (pd.DataFrame): DataFrame sobre el cual se realizarán las operaciones.
+        specs (list): Lista de diccionarios con los argumentos de columns_add: 'columns' (obligatorio),
+            'name_column_new', 'type', 'drop', 'separator' y 'operation'.
+
+    Retorna:
+        pd.DataFrame: DataFrame con las columnas nuevas agregadas, en el orden de las especificaciones.
+
+    Ejemplo de uso:
+        df_mod = columns_add_batch(df, [
+            {"columns": ["Peso1", "Peso2"], "name_column_new": "Peso", "operation": "sum"},
+            {"columns": ["Lote", "Fila"], "name_column_new": "Ubicacion", "type": "Text", "separator": "-"},
+        ])
+    """
+    if not isinstance(dataframe, pd.DataFrame):
+        raise TypeError("El argumento 'dataframe' debe ser un pandas DataFrame.")
+    if not isinstance(specs, list) or not all(isinstance(spec, dict) for spec in specs):
+        raise TypeError("El argumento 'specs' debe ser una lista de diccionarios.")
+
+    # 1. Validar todas las especificaciones con las columnas disponibles en cada paso
+    available = list(dataframe.columns)
+    created = set()
+    plan = []
+    for i, spec in enumerate(specs):
+        unknown = set(spec) - set(SPEC_KEYS)
+        if unknown:
+            raise ValueError(f"Claves no reconocidas en la especificación {i}: {sorted(unknown)}")
+        if 'columns' not in spec:
+            raise ValueError(f"La especificación {i} no tiene la clave 'columns'.")
+        columns = spec['columns']
+        name, type_lower, operation = _validate_spec(
+            columns, spec.get('name_column_new'), spec.get('type', "Number"), spec.get('operation'), available
+        )
+        if type_lower == "number":
+            # Las columnas creadas por especificaciones anteriores se validan al calcularlas
+            originals = [col for col in columns if col not in created]
+            if not all(pd.api.types.is_numeric_dtype(dataframe[col]) for col in originals):
+                raise TypeError("Todas las columnas deben ser numéricas para 'type'='Number'.")
+        drop = spec.get('drop', True)
+        if drop:
+            available = [col for col in available if col not in columns]
+        available.append(name)
+        created.add(name)
+        plan.append((columns, name, type_lower, operation, drop, spec.get('separator', "")))
+
+    # 2. Calcular las columnas nuevas. Cada entrada se toma de la última columna creada con ese nombre
+    #    o, si no hay, de los datos originales (convertidos a datetime si una operación "Date" ya lo hizo)
+    derived = []
+    latest = {}
+    converted_original = {}
+    dropped_original = set()
+
+    def lookup(col):
+        if col in latest:
+            return derived[latest[col]][1]
+        if col in converted_original:
+            return converted_original[col]
+        return dataframe[col]
+
+    for columns, name, type_lower, operation, drop, separator in plan:
+        source = pd.DataFrame({col: lookup(col) for col in columns}, index=dataframe.index)
+        new_column, converted = _compute_column(source, columns, type_lower, operation, separator)
+        for col, values in converted.items():
+            if col in latest:
+                derived[latest[col]][1] = values
+            else:
+                converted_original[col] = values
+        if drop:
+            for col in columns:
+                latest.pop(col, None)
+                for entry in derived:
+                    if entry[0] == col:
+                        entry[2] = False
+                if col in dataframe.columns:
+                    dropped_original.add(col)
+        derived.append([name, new_column, True])
+        latest[name] = len(derived) - 1
+
+    # 3. Una sola copia del DataFrame original con todas las eliminaciones juntas
+    df = dataframe.drop(columns=[col for col in dataframe.columns if col in dropped_original])
+    for col, values in converted_original.items():
+        if col in df.columns:
+            df[col] = values
+
+    # 4. Agregar al final, en orden, las columnas nuevas que no se eliminaron después
+    for name, new_column, alive in derived:
+        if alive:
+            df.insert(len(df.columns), name, new_column, allow_duplicates=True)
+    return df
+
+def _validate_spec(columns, name_column_new, type, operation, available):
+    """
+    Valida los argumentos de una operación de columns_add y completa los valores por defecto.
+    Devuelve (nombre de la columna nueva, tipo en minúsculas, operación).
+    """
     # Validar que 'columns' es una lista de strings
     if not isinstance(columns, list) or not all(isinstance(col, str) for col in columns):
         raise TypeError("El argumento 'columns' debe ser una lista de nombres de columnas (str).")
     
     # Verificar que todas las columnas estén en el DataFrame
-    missing_columns = list(set(columns) - set(dataframe.columns))
+    missing_columns = list(set(columns) - set(available))
     if missing_columns:
         raise ValueError(f"Las siguientes columnas no se encontraron en el DataFrame: {missing_columns}")
     
@@ -51,90 +206,134 @@ def columns_add(
     # Validar que el tipo es uno de los permitidos (sin distinguir mayúsculas/minúsculas)
     if type.lower() not in ["number", "text", "date"]:
         raise ValueError("El argumento 'type' debe ser 'Number', 'Text' o 'Date'.")
+    type_lower = type.lower()
     
     # Si no se especifica la operación, se asigna una operación por defecto según el tipo
     if operation is None:
-        if type.lower() == "number":
-            operation = "sum"
-        elif type.lower() == "text":
-            operation = "concat"
-        elif type.lower() == "date":
-            operation = "mean"
-        else:
-            raise ValueError(f"Tipo '{type}' no soportado.")
-    
-    # Crear una copia del DataFrame para no modificar el original
-    df = dataframe.copy()
-    
-    # Definir un nombre temporal para la nueva columna para evitar conflictos con nombres existentes
-    temp_column_name = f"CoL$&$umNa_CreADA_{name_column_new}"
-    while temp_column_name in df.columns:
-        temp_column_name += "_temp"
+        operation = DEFAULT_OPERATIONS[type_lower]
+    if operation not in OPERATIONS[type_lower]:
+        raise ValueError(f"Operación '{operation}' no soportada para 'type'='{TYPE_LABELS[type_lower]}'.")
     
+    return name_column_new, type_lower, operation
+
+def _compute_column(df: pd.DataFrame, columns: list, type_lower: str, operation: str, separator: str):
+    """
+    Calcula la columna nueva a partir de df[columns]. Devuelve (columna nueva, {columna: valores convertidos}),
+    donde el diccionario contiene las columnas de entrada convertidas a datetime cuando el tipo es "date".
+    """
+    converted = {}
     # Procesar según el tipo de datos
-    if type.lower() == "number":
+    if type_lower == "number":
         # Validar que todas las columnas sean numéricas
         if not all(pd.api.types.is_numeric_dtype(df[col]) for col in columns):
             raise TypeError("Todas las columnas deben ser numéricas para 'type'='Number'.")
         
         # Realizar la operación aritmética especificada
-        if operation == "sum":
-            df[temp_column_name] = df[columns].sum(axis=1, skipna=True)
-        elif operation == "mean":
-            df[temp_column_name] = df[columns].mean(axis=1, skipna=True)
-        elif operation == "prod":
-            df[temp_column_name] = df[columns].prod(axis=1, skipna=True)
-        elif operation == "min":
-            df[temp_column_name] = df[columns].min(axis=1, skipna=True)
-        elif operation == "max":
-            df[temp_column_name] = df[columns].max(axis=1, skipna=True)
-        elif operation == "first":
+        if operation == "first":
             # Rellenar hacia adelante y tomar la primera columna no nula
-            df[temp_column_name] = df[columns].bfill(axis=1).iloc[:, 0]
+            new_column = df[columns].bfill(axis=1).iloc[:, 0]
         else:
-            raise ValueError(f"Operación '{operation}' no soportada para 'type'='Number'.")
+            new_column = getattr(df[columns], operation)(axis=1, skipna=True)
     
-    elif type.lower() == "text":
+    elif type_lower == "text":
         # Convertir las columnas a string, reemplazar cadenas vacías o "nan" por NaN, y concatenar
         if operation == "concat":
-            df[temp_column_name] = df[columns].apply(
-                lambda row: separator.join(
-                    [str(x) for x in row if str(x).lower() not in ['', 'nan', 'none']]
-                ) if not all(str(x).lower() in ['', 'nan', 'none'] for x in row) else separator,
-                axis=1
-                ).replace(separator,np.nan)
-        elif operation == "first":
-            df[temp_column_name] = df[columns].astype(str)\
+            new_column = _concat_text(df, columns, separator)
+        else:
+            new_column = df[columns].astype(str)\
                 .replace(['', 'nan', 'None'], np.nan)\
                 .bfill(axis=1).iloc[:, 0]
-        else:
-            raise ValueError(f"Operación '{operation}' no soportada para 'type'='Text'.")
     
-    elif type.lower() == "date":
+    else:
         # Convertir las columnas especificadas a tipo datetime, con errores convertidos a NaT
         for col in columns:
-            df[col] = pd.to_datetime(df[col], errors='coerce')
+            converted[col] = pd.to_datetime(df[col], errors='coerce')
+        dates = pd.DataFrame(converted, index=df.index)
         
         # Realizar la operación de fecha indicada
         if operation == "min":
-            df[temp_column_name] = df[columns].min(axis=1)
+            new_column = dates[columns].min(axis=1)
         elif operation == "max":
-            df[temp_column_name] = df[columns].max(axis=1)
+            new_column = dates[columns].max(axis=1)
         elif operation == "mean":
             # La media de fechas se calcula como la media de los valores numéricos subyacentes y luego se convierte a datetime
-            df[temp_column_name] = pd.to_datetime(df[columns].mean(axis=1), errors='coerce')
-        elif operation == "first":
-            df[temp_column_name] = df[columns].bfill(axis=1).iloc[:, 0]
+            new_column = pd.to_datetime(dates[columns].mean(axis=1), errors='coerce')
         else:
-            raise ValueError(f"Operación '{operation}' no soportada para 'type'='Date'.")
-    else:
-        raise ValueError(f"Tipo '{type}' no soportado.")
-    
-    # Eliminar las columnas originales si se especifica drop=True
-    if drop:
-        df.drop(columns=columns, inplace=True)
+            new_column = dates[columns].bfill(axis=1).iloc[:, 0]
     
-    # Renombrar la columna temporal al nombre final deseado
-    df.rename(columns={temp_column_name: name_column_new}, inplace=True)
-    
-    return df
\ No newline at end of file
+    return new_column, converted
+
+def _column_texts(series: pd.Series) -> tuple:
+    """
+    Devuelve el texto de cada celda (str(valor), como en apply) y si se conserva al concatenar.
+
+    Convierte a texto una sola vez cada valor distinto cuando agruparlos no mezcla textos diferentes; las
+    columnas object con tipos mezclados se convierten celda a celda.
+    """
+    values = series.astype(object).to_numpy()
+    dtype = series.dtype
+    float_dtype = isinstance(dtype, np.dtype) and dtype.kind == 'f'
+    if float_dtype:
+        # Se agrupa por los bits del valor para no unir 0.0 y -0.0
+        keys = series.to_numpy().view(f'i{dtype.itemsize}')
+    elif (isinstance(dtype, np.dtype) and dtype != object) or isinstance(dtype, pd.DatetimeTZDtype):
+        keys = values
+    elif pd.api.types.infer_dtype(values, skipna=True) in TIPOS_FACTORIZABLES:
+        keys = values
+    else:
+        texts = np.frompyfunc(str, 1, 1)(values).astype(object)
+        keep = np.array([text.lower() not in TEXTOS_VACIOS for text in texts], dtype=bool)
+        return texts, keep
+
+    codes, uniques = pd.factorize(keys)
+    if float_dtype:
+        uniques = uniques.view(dtype)
+    texts = np.empty(len(values), dtype=object)
+    unique_texts = np.array([str(x) for x in uniques], dtype=object)
+    texts[codes >= 0] = unique_texts[codes[codes >= 0]]
+    # Valores nulos: str(None) y str(nan) se descartan, pero str(pd.NA) y str(pd.NaT) no
+    null_rows = codes < 0
+    if null_rows.any():
+        texts[null_rows] = np.frompyfunc(str, 1, 1)(values[null_rows])
+
+    unique_keep = np.array([text.lower() not in TEXTOS_VACIOS for text in unique_texts], dtype=bool)
+    keep = np.zeros(len(values), dtype=bool)
+    keep[codes >= 0] = unique_keep[codes[codes >= 0]]
+    if null_rows.any():
+        keep[null_rows] = [text.lower() not in TEXTOS_VACIOS for text in texts[null_rows]]
+    return texts, keep
+
+def _concat_text(df: pd.DataFrame, columns: list, separator: str) -> pd.Series:
+    """
+    Concatena como texto las columnas indicadas, fila por fila, omitiendo los valores cuya representación
+    en minúsculas es '', 'nan' o 'none'. Las filas cuyo resultado es igual al separador (por ejemplo, todas
+    vacías) quedan como NaN.
+
+    Equivale a aplicar str() a cada celda con apply(axis=1), pero convierte a texto una sola vez cada valor
+    distinto de cada columna y une las columnas con operaciones sobre arreglos.
+    """
+    if len(df) == 0:
+        return pd.Series(index=df.index, dtype=np.float64)
+
+    # apply(axis=1) recibe filas con el tipo común de las columnas (por ejemplo, int junto a float da float)
+    common_dtype = df[columns].iloc[0].dtype
+
+    result = None
+    has_text = np.zeros(len(df), dtype=bool)
+    for col in columns:
+        series = df[col]
+        if common_dtype != object and series.dtype != common_dtype:
+            series = series.astype(common_dtype)
+        texts, keep = _column_texts(series)
+
+        if result is None:
+            result = np.where(keep, texts, '').astype(object)
+        else:
+            append = keep & has_text
+            result[append] = result[append] + separator + texts[append]
+            first = keep & ~has_text
+            result[first] = texts[first]
+        has_text |= keep
+
+    result[~has_text] = separator
+    return pd.Series(result, index=df.index).replace(separator, np.nan)
@@ -1,26 +1,48 @@
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from functools import reduce
+
 import numpy as np
 import pandas as pd
 
-def data_base_genetic(original_data, cycle = ["CI","CII", "CIII", "CIV"], index_column = [], column_calid_cualit = [], column_calid_cuantit = [], list_dic = {} ):
+# Ciclos de evaluación soportados
+CYCLES = ["CI", "CII", "CIII", "CIV"]
+# Ciclos que, además de la calidad cualitativa, procesan las columnas de calidad cuantitativas
+CYCLES_CUANTITATIVOS = ["CII", "CIII", "CIV"]
+# Formatos de salida de data_base_genetic_batch
+BATCH_OUTPUTS = ["dict", "merged"]
+
+def data_base_genetic(original_data, cycle = "CI", index_column = [], column_calid_cualit = [], column_calid_cuantit = [], list_dic = {}, low_memory = False, return_memory = False):
     """
     Procesa un DataFrame para generar un análisis genético de datos basado en evaluaciones y columnas de calidad.
     
     Args:
         df (pd.DataFrame): DataFrame con los datos a procesar.
-        cycle (str, optional): Ciclo de evaluación. El valor por defecto es "CI".
+        cycle (str, optional): Ciclo de evaluación ("CI", "CII", "CIII" o "CIV"). El valor por defecto es "CI".
+            Todos los ciclos devuelven la misma tupla; las columnas del pivot y del resumen llevan el ciclo como sufijo.
         index_column (list): Lista de columnas que se usarán como índice.
         column_calid_cualit (list): Lista de columnas de calidad de tipo cualitativos a procesar.
-        column_calid_cuantit (list): Lista de columnas de calidad de tipo cuantitativos a procesar.(Tener en cuenta que las columnas de esta lista deben estar al final del dataframe)
+        column_calid_cuantit (list): Lista de columnas de calidad de tipo cuantitativos a procesar (solo en CII, CIII y CIV).
+            Se agrupan por categoría según su nombre ("Firmeza-1", "Firmeza-2", ...) y se calcula la media y la desviación
+            estándar de cada categoría. (Tener en cuenta que las columnas de esta lista deben estar al final del dataframe)
         list_dic (dict): Diccionario de mapeo para las columnas de calidad, se encuentran los nombres de las columnas junto con sus diccionarios de equivalencia:
         Orden de las columnas: index_colum - column_calid_cualit - column_calid_cuantit
+        low_memory (bool, optional): Si es True, procesa con Copy-on-Write de pandas: no copia el DataFrame de entrada
+            ni el consolidado intermedio, y solo copia al final las columnas de las salidas que aún comparten memoria
+            con la entrada. Las salidas son las mismas y nunca quedan enlazadas con `original_data`.
+        return_memory (bool, optional): Si es True, devuelve además un diccionario con la memoria usada (MB): el pico
+            durante el proceso (medido con tracemalloc), el tamaño de la entrada y el de las salidas.
         
     Returns:
         tuple: Tupla con tres elementos:
             - dataframe (pd.DataFrame): DataFrame original con columnas reordenadas y nuevas columnas calculadas, solo es la concatenación con calculos
             - pivot_df (pd.DataFrame): DataFrame pivotado con columnas evaluadas.
             - resumen (pd.DataFrame): DataFrame con el resumen de los cálculos y análisis.
+        Con return_memory=True se agrega un cuarto elemento: {'pico_mb', 'entrada_mb', 'salida_mb'}.
     Raises:
         TypeError: Si `index_column` no es una lista, `column_calid_cualit` no es una lista,`column_calid_cuantit` no es una lista, o `list_dic` no es un diccionario.
+        ValueError: Si `cycle` no es un ciclo soportado o alguna columna indicada no existe en el DataFrame.
 
     Example:
         >>> df = pd.DataFrame({
@@ -38,10 +60,140 @@ def data_base_genetic(original_data, cycle = ["CI","CII", "CIII", "CIV"], index_
             'Columna3': mapeo_Columna3}    
         >>> data_base_genetic(df, cycle = "CI", index_column=index_column, column_calid_cualit = column_calid, list_dic=list_dic)
     """
-    # Realizando copia del dataframe
-    df = original_data.copy()
-    
     # Manejo de errores para los tipos de argumentos
+    _validar_argumentos(original_data, [cycle], index_column, column_calid_cualit, column_calid_cuantit, list_dic)
+    
+    if return_memory:
+        # Se mide el pico desde este punto; si tracemalloc ya estaba activo se reinicia su pico (Python >= 3.9)
+        midiendo = tracemalloc.is_tracing()
+        if not midiendo:
+            tracemalloc.start()
+        elif hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+        memoria_inicial = tracemalloc.get_traced_memory()[0]
+    
+    with pd.option_context("mode.copy_on_write", True) if low_memory else nullcontext():
+        # Realizando copia del dataframe (perezosa con Copy-on-Write: solo se copia lo que se modifique)
+        df = original_data.copy(deep=not low_memory)
+        
+        # Mapeando las columnas de calidad cualitativa
+        _mapear_calidad(df, list_dic)
+        
+        resultado = _procesar_ciclo(df, cycle, index_column, column_calid_cualit, column_calid_cuantit, list_dic, low_memory)
+        del df
+        
+        if low_memory:
+            # Las salidas no deben compartir memoria con el DataFrame recibido
+            resultado = tuple(_copiar_columnas_enlazadas(salida, original_data) for salida in resultado)
+    
+    if return_memory:
+        pico = tracemalloc.get_traced_memory()[1] - memoria_inicial
+        if not midiendo:
+            tracemalloc.stop()
+        memoria = {
+            'pico_mb': round(pico / 1e6, 1),
+            'entrada_mb': round(original_data.memory_usage(deep=False).sum() / 1e6, 1),
+            'salida_mb': round(sum(salida.memory_usage(deep=False).sum() for salida in resultado) / 1e6, 1),
+        }
+        return resultado + (memoria,)
+    return resultado
+
+def data_base_genetic_batch(original_data, cycle_column = "Ciclo", cycles = None, index_column = [], column_calid_cualit = [], column_calid_cuantit = [], list_dic = {}, output = "dict", parallel = False, max_workers = None):
+    """
+    Procesa una temporada completa (varios ciclos en un mismo DataFrame) con el motor de data_base_genetic.
+
+    La validación de argumentos y el mapeo de las columnas de calidad se hacen una sola vez sobre todo el DataFrame;
+    después se separan las filas de cada ciclo según `cycle_column` y se calculan sus salidas, opcionalmente en
+    procesos paralelos. Cada ciclo da el mismo resultado que data_base_genetic sobre sus filas sin la columna de ciclo.
+
+    Args:
+        original_data (pd.DataFrame): DataFrame con los datos de la temporada.
+        cycle_column (str): Columna con el ciclo de cada fila ("CI", "CII", "CIII" o "CIV"). No pasa a las salidas.
+        cycles (list, optional): Ciclos a procesar, en orden. Por defecto, los ciclos presentes en `cycle_column`.
+        index_column, column_calid_cualit, column_calid_cuantit, list_dic: Igual que en data_base_genetic.
+        output (str): "dict" (por defecto) devuelve {ciclo: (dataframe, pivot_df, resumen)}; "merged" devuelve una sola
+            tabla ancha con los pivot_df de todos los ciclos unidos por `index_column`.
+        parallel (bool): Si es True, procesa cada ciclo en un proceso distinto.
+        max_workers (int, optional): Número de procesos en modo paralelo. Por defecto, el de concurrent.futures.
+
+    Returns:
+        dict o pd.DataFrame: Según `output`.
+
+    Raises:
+        ValueError: Si `cycle_column` no existe, algún ciclo de `cycles` no es soportado o no tiene filas (el mensaje
+            los lista todos), o `output` no es válido.
+
+    Example:
+        >>> salidas = data_base_genetic_batch(df_temporada, cycle_column="Ciclo", index_column=["Codigo"],
+        ...                                   column_calid_cualit=column_calid, list_dic=list_dic)
+        >>> dataframe, pivot_df, resumen = salidas["CI"]
+    """
+    if output not in BATCH_OUTPUTS:
+        raise ValueError(f"output debe ser uno de {BATCH_OUTPUTS}.")
+    if cycle_column not in original_data.columns:
+        raise ValueError(f"La columna '{cycle_column}' de cycle_column no existe en el DataFrame.")
+    
+    ciclo_por_fila = original_data[cycle_column].to_numpy()
+    presentes = set(pd.unique(ciclo_por_fila))
+    if cycles is None:
+        cycles = [cycle for cycle in CYCLES if cycle in presentes]
+    else:
+        # Todos los ciclos pedidos se verifican antes de procesar ninguno
+        no_soportados = [cycle for cycle in cycles if cycle not in CYCLES]
+        if no_soportados:
+            raise ValueError(f"Ciclos no soportados: {no_soportados}. cycle debe ser uno de {CYCLES}.")
+        ausentes = [cycle for cycle in cycles if cycle not in presentes]
+        if ausentes:
+            raise ValueError(f"Los ciclos {ausentes} no tienen filas en la columna '{cycle_column}'.")
+    if not cycles:
+        raise ValueError("No hay ciclos para procesar.")
+    
+    # Validación y mapeo de calidad una sola vez, sin la columna de ciclo
+    _validar_argumentos(original_data, cycles, index_column, column_calid_cualit, column_calid_cuantit, list_dic)
+    df = original_data.drop(columns=cycle_column)
+    _mapear_calidad(df, list_dic, inferir=False)
+    columnas_mapeadas = [f'{col}_#' for col in list_dic]
+    
+    # Separando las filas de cada ciclo; cada partición es un DataFrame propio
+    partes = {}
+    for cycle in cycles:
+        filas = np.flatnonzero(ciclo_por_fila == cycle)
+        parte = df.take(filas)
+        # El tipo de las columnas mapeadas depende de los valores de cada ciclo, como en data_base_genetic
+        for col in columnas_mapeadas:
+            parte[col] = parte[col].infer_objects()
+        partes[cycle] = parte
+    del df
+    
+    resultados = {}
+    if parallel and len(cycles) > 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futuros = {
+                cycle: pool.submit(_procesar_ciclo, partes.pop(cycle), cycle, index_column, column_calid_cualit, column_calid_cuantit, list_dic)
+                for cycle in cycles
+            }
+            for cycle, futuro in futuros.items():
+                resultados[cycle] = futuro.result()
+    else:
+        for cycle in cycles:
+            resultados[cycle] = _procesar_ciclo(partes.pop(cycle), cycle, index_column, column_calid_cualit, column_calid_cuantit, list_dic)
+    
+    if output == "merged":
+        # Tabla ancha de la temporada: los pivot_df de cada ciclo unidos por las columnas índice
+        return reduce(
+            lambda izquierda, derecha: izquierda.merge(derecha, on=index_column, how="outer"),
+            [pivot_df for _, pivot_df, _ in resultados.values()]
+        )
+    return resultados
+
+def _validar_argumentos(df, cycles, index_column, column_calid_cualit, column_calid_cuantit, list_dic):
+    """
+    Verifica los argumentos de data_base_genetic para uno o varios ciclos.
+    """
+    # Verificación de que los ciclos sean de los soportados
+    for cycle in cycles:
+        if cycle not in CYCLES:
+            raise ValueError(f"cycle debe ser uno de {CYCLES}.")
     # Verificación de que index_column sea una lista
     if not isinstance(index_column, list):
         raise TypeError("index_column debe ser una lista.")
@@ -58,10 +210,10 @@ def data_base_genetic(original_data, cycle = ["CI","CII", "CIII", "CIV"], index_
         if col not in df.columns:
             raise ValueError(f"La columna '{col}' de column_calid_cualit no existe en el DataFrame.")
     
-    if cycle == "CIII":
+    if any(cycle in CYCLES_CUANTITATIVOS for cycle in cycles):
         # Verificación de que column_calid_cuantit sea una lista
         if not isinstance(column_calid_cuantit, list):
-            raise TypeError("column_calid_cualit debe ser una lista.")
+            raise TypeError("column_calid_cuantit debe ser una lista.")
         # Verificación de que las columnas en column_calid_cuantit existen en el DataFrame
         for col in column_calid_cuantit:
             if col not in df.columns:
@@ -74,7 +226,25 @@ def data_base_genetic(original_data, cycle = ["CI","CII", "CIII", "CIV"], index_
     for key, value in list_dic.items():
         if not isinstance(value, dict):
             raise TypeError(f"El valor asociado a la clave '{key}' en list_dic debe ser un diccionario.")
-    
+
+def _mapear_calidad(df, list_dic, inferir = True):
+    """
+    Agrega al DataFrame una columna '<columna>_#' con el valor mapeado de cada columna de list_dic.
+    Con inferir=False las columnas quedan como object, para inferir su tipo después en cada partición.
+    """
+    # Realizando interelación de columnas de calidad con diccionarios
+    for col, mapeo in list_dic.items():
+        #Realizar preprocesado para normalización de segmentos
+        mapeo_proc = _preprocess_mapping(mapeo)
+        #Realizando columna de el calculado
+        mapeada = _safe_map(mapeo_proc, df[col])
+        df[f'{col}_#'] = mapeada.infer_objects() if inferir else mapeada
+
+def _procesar_ciclo(df, cycle, index_column, column_calid_cualit, column_calid_cuantit, list_dic, low_memory = False):
+    """
+    Calcula (dataframe, pivot_df, resumen) de un ciclo sobre un DataFrame propio, ya validado y mapeado.
+    Con low_memory=True el consolidado no se copia: las partes 2 y 3 solo leen de él.
+    """
     # Obteniendo nombres de las columnas del dataframe
     list_columns = list(df.columns)
     
@@ -103,328 +273,310 @@ def data_base_genetic(original_data, cycle = ["CI","CII", "CIII", "CIV"], index_
     #Listas de columnas intermedias
     lista_inted = list_columns[int(posición_final_index+1):int(posicion_inicial_calid)]
     lista_final = list_columns[int(posición_final_calid+1):]
-    if cycle == "CIII":
-        lista_final = [elemento for elemento in lista_final if elemento not in column_calid_cuantit]
-    
-    # Creando funciones que se necesitarán
-    ## Creando función que nos indica que se haya evaluado
-    def columna_presente(df, columna, new_column):
-        """
-        Crea una columna que contenga un valor de 1 si existe un número en la columna especificada y 0 si es NaN o nulo.
-
-        Args:
-            df: El `DataFrame` en el que se creará la columna.
-            columna: El nombre de la columna en la que se verificarán los valores.
-
-        Returns:
-            El `DataFrame` modificado con la nueva columna.
-        """
-
-        # Crea una nueva columna con el valor 1 por defecto.
-        df[new_column] = 1
-
-        # Reemplaza los valores NaN y nulos por 0.
-        df[new_column] = df[new_column].where(df[columna].notnull(), 0)
-
-        return df  
-    
-    def separar_por_categoria(lista, separadores=["-", "+", "*"]):
-        """
-        Separa una lista de elementos en sublistas según su categoría.
-
-        Args:
-            lista: La lista de elementos a separar.
-            separadores: Una lista de posibles separadores entre la categoría y el número.
-
-        Returns:
-            Un diccionario donde las claves son las categorías y los valores son las listas correspondientes.
-        """
-
-        separated_lists = {}
-
-        for item in lista:
-            # Encontrar el primer separador que coincida en el elemento
-            for sep in separadores:
-                parts = item.split(sep)
-                if len(parts) == 2:
-                    category, number = parts
-                    break
-            else:
-                # Si no se encontró ningún separador válido, saltar este elemento
-                continue
-
-            if category not in separated_lists:
-                separated_lists[category] = []
-            separated_lists[category].append(item)
-
-        return separated_lists
-    
-    # Preprocesar los mapeos para incluir minúsculas y variaciones de género
-    def preprocess_mapping(original_map):
-        normalized = {}
-        for key, value in original_map.items():
-            key_lower = key.lower()
-            normalized[key_lower] = value
-            # Agregar variación de género si aplica (ej: 'alto' <-> 'alta')
-            if key_lower.endswith('o'):
-                normalized[key_lower[:-1] + 'a'] = value
-            elif key_lower.endswith('a'):
-                normalized[key_lower[:-1] + 'o'] = value
-        return normalized
-
-    # Función para mapeo seguro
-    def safe_map(mapeo, x):
-        if pd.isna(x):
-            return None
-        return mapeo.get(x.lower(), None)
-    
-    # Comenzando la Bases de datos si se requiera para un Ciclo 1  
-    if cycle == "CI":
-        ######  Parte 1: Dataframe de data (concatenado)    ####################################
-        # Se crea listas vacias para poder guardar las listas totales de columnas de calidad cualitativas
-        list_calid_cualit = []
-        list_calid_cualit_N = []
-        # Realizando interelación de columnas de calidad con diccionarios
-        for col, mapeo in list_dic.items():
-            #Creando Variable para la nueva columna
-            nueva_col = f'{col}_#'
-            #Realizar preprocesado para normalización de segmentos
-            mapeo_proc = preprocess_mapping(mapeo)
-            #Realizando columna de el calculado
-            df[nueva_col] = df[col].apply(lambda x: safe_map(mapeo_proc, x))
-            #Se guarda los nombres de las columnas en las listas creadas anteriormente
-            list_calid_cualit.append(col)
-            list_calid_cualit_N.append(nueva_col)
-        
-        #Creamos Variable con columnas a sumar
-        columnas_a_sumar = [f'{col}_#' for col in column_calid_cualit]
+    
+    ######  Parte 1: Dataframe de data (concatenado)    ####################################
+    # Listas de columnas de calidad cualitativas y sus columnas mapeadas (creadas por _mapear_calidad)
+    list_calid_cualit = list(list_dic)
+    list_calid_cualit_N = [f'{col}_#' for col in list_calid_cualit]
+    
+    #Creamos Variable con columnas a sumar
+    columnas_a_sumar = [f'{col}_#' for col in column_calid_cualit]
 
-        #Reordenando columnas
-        #Creando lista de lista de calidad categorica y numerica
-        lista_intercalada_calidad = [item for pair in zip(list_calid_cualit, list_calid_cualit_N) for item in pair]
-        
-        # Filtrar lista_final desde el DataFrame original
-        lista_final = [
-            col for col in list_columns[posición_final_calid+1:]
-            if col not in list_calid_cualit + list_calid_cualit_N
-        ]
-        #Creando lista reordenada de las columnas
-        orden_columnas = index_column + lista_inted + lista_intercalada_calidad + lista_final
-        
-        # eliminar duplicados y conservar orden
-        orden_columnas = list(dict.fromkeys(orden_columnas))
-        
-        #Función para sumar columnas de la variable
-        df["Suma de puntaje"] = df[columnas_a_sumar].sum(axis=1,skipna=True)
+    #Reordenando columnas
+    #Creando lista de lista de calidad categorica y numerica
+    lista_intercalada_calidad = [item for pair in zip(list_calid_cualit, list_calid_cualit_N) for item in pair]
+    
+    # Agrupando las columnas de los valores cuantitativas por categoría (solo en los ciclos que las procesan)
+    categorias = _separar_por_categoria(column_calid_cuantit) if cycle in CYCLES_CUANTITATIVOS else {}
+    columnas_cuantit = [col for lista in categorias.values() for col in lista]
+    
+    # Filtrar lista_final desde el DataFrame original (las cuantitativas agrupadas se ubican al final)
+    lista_final = [
+        col for col in lista_final
+        if col not in list_calid_cualit + list_calid_cualit_N + columnas_cuantit
+    ]
+    #Creando lista reordenada de las columnas
+    orden_columnas = index_column + lista_inted + lista_intercalada_calidad + lista_final
+    
+    # eliminar duplicados y conservar orden
+    orden_columnas = list(dict.fromkeys(orden_columnas))
+    
+    #Función para sumar columnas de la variable
+    df["Suma de puntaje"] = df[columnas_a_sumar].sum(axis=1,skipna=True)
 
-        #Realizamos el conteo de las columnas a sumar omitiendo los vacios
-        df["Traits evaluados"] = df[columnas_a_sumar].count(axis=1)
+    #Realizamos el conteo de las columnas a sumar omitiendo los vacios
+    df["Traits evaluados"] = df[columnas_a_sumar].count(axis=1)
 
-        #Cambiando los "0" por NaN
-        df["Suma de puntaje"].replace(0, np.nan, inplace=True)
-        df["Traits evaluados"].replace(0, np.nan, inplace=True)
+    #Cambiando los "0" por NaN
+    df["Suma de puntaje"] = df["Suma de puntaje"].replace(0, np.nan)
+    df["Traits evaluados"] = df["Traits evaluados"].replace(0, np.nan)
 
-        #Creando columna con los traits totles evaluados
-        df["Puntos"] = len(columnas_a_sumar)
+    #Creando columna con los traits totles evaluados
+    df["Puntos"] = len(columnas_a_sumar)
 
-        #Creando la columna en base a la función creada
-        df = columna_presente(df, 'Suma de puntaje','Evaluados')
-        
-        #Añadiendo columnas que se agregaron como calculadas
-        orden_columnas= orden_columnas + ["Suma de puntaje","Traits evaluados","Puntos",'Evaluados']
-        
-        #Reordenando columnas
-        df = df.reindex(columns = orden_columnas)
-        
-        #Copiando df a un nuevo dataframe
-        dataframe = df.copy()
-        
-        ######  Parte 2: Base de datos  ########################################################
-        # Obteniendo nombres de las columnas del dataframe
-        list_columns = list(df.columns)
-        
-        #Capturando posiciones en la lista de columnas
-        posicion_inicial_calid = list_columns.index(lista_intercalada_calidad[0])
-        posición_final_calid = list_columns.index(lista_intercalada_calidad[-1])
-        posición_final_index = list_columns.index(index_column[-1])
-        
-        #Listas de columnas intermedias
-        lista_inted = list_columns[int(posición_final_index+1):int(posicion_inicial_calid)]
-        
-        ## Quitando valores a lista_inted
-        lista_inted.remove("Evaluación")
-        lista_inted.remove("Semana")
-        
-        #Lista del final
-        lista_4_ultimos = list_columns[-4:]
-        
-        #Definiendo columnas para repartir los pivot
-        columnas_a_pivotear = lista_inted + lista_intercalada_calidad + lista_final + lista_4_ultimos
-        
-        #Copiando index inicial
-        index_column_copy = index_column.copy()
+    #Creando la columna en base a la función creada
+    df = _columna_presente(df, 'Suma de puntaje','Evaluados')
+    
+    #Añadiendo columnas que se agregaron como calculadas
+    columnas_calculadas = ["Suma de puntaje","Traits evaluados","Puntos",'Evaluados']
+    orden_columnas = orden_columnas + columnas_calculadas
+    
+    # Lista para mantener el orden de las columnas cuantitativas con sus medias y desviaciones
+    nuevo_orden = []
+    if categorias:
+        estadisticos = _media_desviacion_por_categoria(df, categorias)
+        for keys, lista in categorias.items():
+            df[f"{keys}_mean"], df[f"{keys}_desv. est."] = estadisticos[keys]
+            nuevo_orden.extend(lista + [f"{keys}_mean", f"{keys}_desv. est."])
         
-        #Copiando dataframe para realizar el pivoteo
-        data = df.copy()
+        # Reemplazando los valores 0 de la colección de medias y desviaciones a vacios
+        for colum in nuevo_orden:
+            df[colum] = df[colum].replace(0, np.nan)
+    
+    #Agregando el orden de las columnas de calidad cuantitativa
+    orden_columnas = orden_columnas + nuevo_orden
+    
+    #Reordenando columnas
+    df = df.reindex(columns = orden_columnas)
+    
+    #Copiando df a un nuevo dataframe
+    dataframe = df if low_memory else df.copy()
+    
+    ######  Parte 2: Base de datos  ########################################################
+    # Obteniendo nombres de las columnas del dataframe
+    list_columns = list(df.columns)
+    
+    #Capturando posiciones en la lista de columnas
+    posicion_inicial_calid = list_columns.index(lista_intercalada_calidad[0])
+    posición_final_index = list_columns.index(index_column[-1])
+    
+    #Listas de columnas intermedias
+    lista_inted = list_columns[int(posición_final_index+1):int(posicion_inicial_calid)]
+    
+    ## Quitando valores a lista_inted
+    for columna in ["Evaluación", "Semana"]:
+        if columna not in lista_inted:
+            raise ValueError(f"La columna '{columna}' debe ubicarse entre index_column y las columnas de calidad.")
+        lista_inted.remove(columna)
+    
+    #Definiendo columnas para repartir los pivot
+    columnas_a_pivotear = lista_inted + lista_intercalada_calidad + lista_final + columnas_calculadas + nuevo_orden
+    
+    #Copiando index inicial
+    index_column_copy = index_column.copy()
+    
+    # Pivoteo a formato ancho: mismas reglas que pivot_table(aggfunc="first") sin agregar cuando las claves son únicas
+    claves = index_column + ["Evaluación"]
+    data = df[claves + columnas_a_pivotear]
+    # Se descartan las filas con claves vacías, como en groupby
+    claves_completas = data[claves].notna().all(axis=1).to_numpy()
+    if not claves_completas.all():
+        data = data[claves_completas]
+    if data.duplicated(claves).any():
+        # Primer valor no vacío de cada combinación de claves
+        data = data.groupby(claves).first()
+    else:
+        # unstack ya devuelve las filas ordenadas por las claves, no hace falta sort_index
+        data = data.set_index(claves)
+    # Una fila totalmente vacía también lo está en las columnas calculadas, así que basta revisar esas
+    if data[columnas_calculadas].isna().all(axis=1).any():
+        data = data.dropna(how="all")
+    
+    pivot_df = data.unstack("Evaluación").dropna(how="all", axis=1)
 
-        pivot_df = pd.pivot_table(data= data,index=index_column, columns="Evaluación", values=columnas_a_pivotear, aggfunc="first")
+    # Redefinir las columnas
+    pivot_df.columns = [f"{col[0]}_{cycle}-{col[1]}" for col in pivot_df.columns]
 
-        # Redefinir las columnas
-        pivot_df.columns = [f"{col[0]}_CI-{col[1]}" for col in pivot_df.columns]
+    # Reiniciar el índice si deseas que "EVALUAR" sea una columna
+    pivot_df = pivot_df.reset_index()
+    
+    #Creando lista con los valores únicos de la columnas "Evaluación"
+    evaluaciones = list(df["Evaluación"].unique())
+    
+    #Creando lista del orden de las columnas
+    columnas_sin_index = [f"{columna}_{cycle}-{eval}" for eval in evaluaciones for columna in columnas_a_pivotear]
+    
+    # Se agrega una lista con el nuevo orden para generar el datframe de pivot
+    new_order = index_column_copy + columnas_sin_index
 
-        # Reiniciar el índice si deseas que "EVALUAR" sea una columna
-        pivot_df = pivot_df.reset_index()
-        
-        #Creando lista con los valores únicos de la columnas "Evaluación"
-        evaluaciones = list(df["Evaluación"].unique())
-        
-        #Creando lista del orden de las columnas
-        columnas_sin_index = [f"{columna}_CI-{eval}" for eval in evaluaciones for columna in columnas_a_pivotear]
-        
-        # Se agrega una lista con el nuevo orden para generar el datframe de pivot
-        new_order = index_column_copy + columnas_sin_index
+    #Reordenando columnas
+    pivot_df = pivot_df.reindex(columns = new_order)
+    
+    ######  Parte 3: Resumen  ###############################################################
+    # Columnas por evaluación que pasan al resumen
+    columnas_suma = [f'Suma de puntaje_{cycle}-{evaluacion}' for evaluacion in evaluaciones]
+    columnas_traits = [f'Traits evaluados_{cycle}-{evaluacion}' for evaluacion in evaluaciones]
+    columnas_puntos = [f'Puntos_{cycle}-{evaluacion}' for evaluacion in evaluaciones]
+    columnas_evaluados = [f'Evaluados_{cycle}-{evaluacion}' for evaluacion in evaluaciones]
+    
+    # Nombres de las columnas de la campaña
+    columna_promedio = f"Promedio total ponderado {cycle}"
+    
+    #Aumentando lista del index 
+    new_order = index_column.copy()
+    for columnas in zip(columnas_suma, columnas_traits, columnas_puntos, columnas_evaluados):
+        new_order.extend(columnas)
+        
+    #Creando dataframe de la selección de columnas
+    resumen = pivot_df[new_order].copy()
+
+    # Reemplazando vacíos de texto (resumen es una copia propia, sin asignaciones encadenadas)
+    for columna_suma, columna_traits in zip(columnas_suma, columnas_traits):
+        resumen[columna_suma] = resumen[columna_suma].replace("", 0)
+        resumen[columna_traits] = resumen[columna_traits].replace("", np.nan)
+    
+    #Calculando el promedio ponderado: suma de (puntaje * evaluados) entre la suma de evaluados
+    puntajes = resumen[columnas_suma].to_numpy(dtype=float)
+    evaluados = resumen[columnas_evaluados].to_numpy(dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        promedio = np.nansum(puntajes * evaluados, axis=1) / np.nansum(evaluados, axis=1)
+    # Si los puntajes llegan como object (p. ej. un trait sin mapeo), el promedio también es object
+    if any(resumen[columna].dtype == object for columna in columnas_suma + columnas_evaluados):
+        promedio = promedio.astype(object)
+    resumen[columna_promedio] = promedio
+
+    #Calculando los puntos
+    resumen[f"Ptos {cycle}"] = resumen[columnas_puntos].mean(axis=1,skipna=True)
+
+    #Creando columnas de Evaluados de la campaña
+    resumen = _columna_presente(resumen, columna_promedio,'Evaluados')
+
+    #Creando columna de numero de evaluaciones de la campaña
+    resumen[f"Numero de evaluaciones {cycle}"] = resumen[columnas_traits].count(axis=1)
+    
+    #Iterando columnas donde se reemplazaran valores
+    for columna_suma, columna_traits in zip(columnas_suma, columnas_traits):
+        resumen[columna_suma] = resumen[columna_suma].replace(0, "se")
+        resumen[columna_traits] = resumen[columna_traits].replace(np.nan, "se")
 
-        #Reordenando columnas
-        pivot_df = pivot_df.reindex(columns = new_order)
-        
-        ######  Parte 3: Resumen  ###############################################################
-        #Aumentando lista del index 
-        new_order = index_column.copy()
-
-        #Iterando las columnas necesarias de el dataframe pivot_df
-        for evaluación in evaluaciones:
-            columnas = [f'Suma de puntaje_CI-{evaluación}', f'Traits evaluados_CI-{evaluación}', f'Puntos_CI-{evaluación}',f'Evaluados_CI-{evaluación}']
-            new_order.extend(columnas)
-            
-        #Creando dataframe de la selección de columnas
-        resumen = pivot_df[new_order]
-
-        #Iterando columnas donde se reemplazaran valores
-        for evaluación in evaluaciones:
-            resumen[f'Suma de puntaje_CI-{evaluación}'].replace("",0, inplace=True)
-            resumen[f'Traits evaluados_CI-{evaluación}'].replace("",np.nan, inplace=True)
-        
-        #Calculando el promedio ponderado:
-        ## Creando columnas para el paso 1
-        for evaluación in evaluaciones:
-            resumen[f"Paso1_{evaluación}"] = resumen[f'Suma de puntaje_CI-{evaluación}']*resumen[f'Evaluados_CI-{evaluación}']
+    # Realizando cambios en la columna del promedio total ponderado
+    resumen[columna_promedio] = resumen[columna_promedio].replace(0, "se").replace(np.nan, "se")
 
-        ## Creando columnas para el paso 2 y 3
-        resumen["Paso2"] = resumen[[f"Paso1_{evaluacion}" for evaluacion in evaluaciones]].sum(axis=1,skipna=True)
-        resumen["Paso3"] = resumen[[f'Evaluados_CI-{evaluacion}' for evaluacion in evaluaciones]].sum(axis=1,skipna=True)
+    # Retornamos los valores de el dataframe de consolidado, database en columnas y el resumen
+    return   dataframe, pivot_df, resumen
 
-        # Creando columna del promedio ponderado
-        resumen["Promedio total ponderado CI"] = resumen["Paso2"]/resumen["Paso3"]
-        
-        ## Eliminando columnas usadas para el proceso de promedio ponderado
-        columnas_temporales = [f"Paso1_{evaluacion}" for evaluacion in evaluaciones] + ["Paso2", "Paso3"]
-        resumen.drop(columns=columnas_temporales, inplace=True)
+# Creando funciones que se necesitarán
+## Creando función que nos indica que se haya evaluado
+def _columna_presente(df, columna, new_column):
+    """
+    Crea una columna que contenga un valor de 1 si existe un número en la columna especificada y 0 si es NaN o nulo.
 
-        #Calculando los puntos
-        resumen["Ptos CI"] = resumen[[f"Puntos_CI-{evaluacion}" for evaluacion in evaluaciones]].mean(axis=1,skipna=True)
+    Args:
+        df: El `DataFrame` en el que se creará la columna.
+        columna: El nombre de la columna en la que se verificarán los valores.
 
-        #Creando columnas de Evaluados de la campaña
-        resumen = columna_presente(resumen, "Promedio total ponderado CI",'Evaluados')
+    Returns:
+        El `DataFrame` modificado con la nueva columna.
+    """
 
-        #Creando columna de numero de evaluaciones de la campaña
-        resumen["Numero de evaluaciones CI"] = resumen[[f"Traits evaluados_CI-{evaluacion}" for evaluacion in evaluaciones]].count(axis=1)
-        
-        #Iterando columnas donde se reemplazaran valores
-        for evaluación in evaluaciones:
-            resumen[f'Suma de puntaje_CI-{evaluación}'].replace(0,"se", inplace=True)
-            resumen[f'Traits evaluados_CI-{evaluación}'].replace(np.nan,"se", inplace=True)
+    # Crea una nueva columna con el valor 1 por defecto.
+    df[new_column] = 1
 
-        # Realizando cambios en la columna de "Promedio total ponderado CI"
-        resumen["Promedio total ponderado CI"].replace(0,"se", inplace=True)
-        resumen["Promedio total ponderado CI"].replace(np.nan,"se", inplace=True)
+    # Reemplaza los valores NaN y nulos por 0.
+    df[new_column] = df[new_column].where(df[columna].notnull(), 0)
 
-        # Retornamos los valores de el dataframe de consolidado, database en columnas y el resumen
-        return   dataframe, pivot_df, resumen
+    return df  
 
-    # Comenzando la Bases de datos si se requiera para un Ciclo 3  
-    elif cycle == "CIII":
-    ######  Parte 1: Dataframe de data (concatenado)    ####################################
-        # Se crea listas vacias para poder guardar las listas totales de columnas de calidad cualitativas
-        list_calid_cualit = []
-        list_calid_cualit_N = []
-        
-        # Realizando interelación de columnas de calidad con diccionarios
-        for col, mapeo in list_dic.items():
-            #Creando Variable para la nueva columna
-            nueva_col = f'{col}_#'
-            #Realizar preprocesado para normalización de segmentos
-            mapeo_proc = preprocess_mapping(mapeo)
-            #Realizando columna de el calculado
-            df[nueva_col] = df[col].apply(lambda x: safe_map(mapeo_proc, x))
-            #Se guarda los nombres de las columnas en las listas creadas anteriormente
-            list_calid_cualit.append(col)
-            list_calid_cualit_N.append(nueva_col)
-        
-        #Creamos Variable con columnas a sumar
-        columnas_a_sumar = [f'{col}_#' for col in column_calid_cualit]
+def _separar_por_categoria(lista, separadores=["-", "+", "*"]):
+    """
+    Separa una lista de elementos en sublistas según su categoría.
 
-        #Reordenando columnas
-        #Creando lista de lista de calidad categorica y numerica
-        lista_intercalada_calidad_culit = [item for pair in zip(list_calid_cualit, list_calid_cualit_N) for item in pair]
-        
-        # Filtrar lista_final desde el DataFrame original
-        lista_final = [
-            col for col in list_columns[posición_final_calid+1:]
-            if col not in list_calid_cualit + list_calid_cualit_N
-        ]
-        
-        #Creando lista reordenada de las columnas
-        orden_columnas = index_column + lista_inted + lista_intercalada_calidad_culit + lista_final 
-        
-        # eliminar duplicados y conservar orden
-        orden_columnas = list(dict.fromkeys(orden_columnas))
-        
-        #Función para sumar columnas de la variable
-        df["Suma de puntaje"] = df[columnas_a_sumar].sum(axis=1,skipna=True)
+    Args:
+        lista: La lista de elementos a separar.
+        separadores: Una lista de posibles separadores entre la categoría y el número.
 
-        #Realizamos el conteo de las columnas a sumar omitiendo los vacios
-        df["Traits evaluados"] = df[columnas_a_sumar].count(axis=1)
+    Returns:
+        Un diccionario donde las claves son las categorías y los valores son las listas correspondientes.
+    """
 
-        #Cambiando los "0" por NaN
-        df["Suma de puntaje"].replace(0, np.nan, inplace=True)
-        df["Traits evaluados"].replace(0, np.nan, inplace=True)
+    separated_lists = {}
+
+    for item in lista:
+        # Encontrar el primer separador que coincida en el elemento
+        for sep in separadores:
+            parts = item.split(sep)
+            if len(parts) == 2:
+                category, number = parts
+                break
+        else:
+            # Si no se encontró ningún separador válido, saltar este elemento
+            continue
+
+        if category not in separated_lists:
+            separated_lists[category] = []
+        separated_lists[category].append(item)
+
+    return separated_lists
+
+# Preprocesar los mapeos para incluir minúsculas y variaciones de género
+def _preprocess_mapping(original_map):
+    normalized = {}
+    for key, value in original_map.items():
+        key_lower = key.lower()
+        normalized[key_lower] = value
+        # Agregar variación de género si aplica (ej: 'alto' <-> 'alta')
+        if key_lower.endswith('o'):
+            normalized[key_lower[:-1] + 'a'] = value
+        elif key_lower.endswith('a'):
+            normalized[key_lower[:-1] + 'o'] = value
+    return normalized
+
+# Función para mapeo seguro: cada etiqueta distinta se normaliza y se busca una sola vez
+def _safe_map(mapeo, serie):
+    codigos, etiquetas = pd.factorize(serie)
+    # El último elemento (None) corresponde a los vacíos, cuyo código es -1
+    valores = np.array([mapeo.get(etiqueta.lower(), None) for etiqueta in etiquetas] + [None], dtype=object)
+    return pd.Series(valores[codigos], index=serie.index)
+
+def _media_desviacion_por_categoria(df, categorias):
+    """
+    Calcula por fila la media y la desviación estándar (ddof=1) de cada categoría en una sola reducción
+    sobre el bloque de columnas cuantitativas, omitiendo los vacíos.
 
-        #Creando columna con los traits totles evaluados
-        df["Puntos"] = len(columnas_a_sumar)
+    Args:
+        df: El `DataFrame` con las columnas cuantitativas.
+        categorias: Diccionario {categoría: [columnas]} devuelto por _separar_por_categoria.
 
-        #Creando la columna en base a la función creada
-        df = columna_presente(df, 'Suma de puntaje','Evaluados')
-        
-        # Añadiendo columnas que se agregaron como calculadas
-        orden_columnas = orden_columnas + ["Suma de puntaje","Traits evaluados","Puntos",'Evaluados']
-        
-        # Agrupando las columnas de los valores cuantitativas para realizar los calculos de media y desviación estandar
-        ## Agrupando las columnas en un diccionario
-        resultado = separar_por_categoria(column_calid_cuantit)
-        
-        # Lista para mantener el nuevo orden de columnas
-        nuevo_orden = []
+    Returns:
+        Un diccionario {categoría: (media, desviación estándar)} con un arreglo por fila para cada valor.
+    """
+    columnas = [col for lista in categorias.values() for col in lista]
+    tamaños = [len(lista) for lista in categorias.values()]
+    # Posición de inicio de cada categoría dentro del bloque
+    inicios = np.cumsum([0] + tamaños[:-1])
+    valores = df[columnas].to_numpy(dtype=float)
+    presentes = ~np.isnan(valores)
+    conteo = np.add.reduceat(presentes, inicios, axis=1, dtype=np.int64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        media = np.add.reduceat(np.where(presentes, valores, 0), inicios, axis=1) / conteo
+        desvios = np.where(presentes, valores - np.repeat(media, tamaños, axis=1), 0)
+        varianza = np.add.reduceat(desvios ** 2, inicios, axis=1) / (conteo - 1)
+    varianza[conteo <= 1] = np.nan
+    desviacion = np.sqrt(varianza)
+    return {categoria: (media[:, k], desviacion[:, k]) for k, categoria in enumerate(categorias)}
+
+def _copiar_columnas_enlazadas(df, original):
+    """
+    Copia las columnas de df cuyos datos comparten memoria con alguna columna de original (vistas de Copy-on-Write).
+    Las columnas con tipos de extensión (categorías, nullable, ...) que también existen en original se copian siempre.
 
-        ## Creando la iteración en el diccionario que tiene la clave con las listas de columnas
-        for keys, lista in resultado.items():
-            df[f"{keys}_mean"] = df[lista].mean(axis=1, skipna=True)
-            df[f"{keys}_desv. est."] = df[lista].std(axis=1, skipna=True)
-            nuevo_orden.extend(lista + [f"{keys}_mean", f"{keys}_desv. est."])
-        
-        # Reemplazando los valores 0 de la colección de medias y desviaciones a vacios
-        for colum in nuevo_orden:
-            df[colum].replace(0,np.nan, inplace = True)
-        
-        #Agregando el orden de las columnas de calidad cuantitativa
-        orden_columnas = orden_columnas + nuevo_orden
-        
-        #Reordenando columnas
-        df = df.reindex(columns = orden_columnas)
-        
-        #Copiando df a un nuevo dataframe
-        dataframe = df.copy()
-        
-        ######  Parte 2: Base de datos  ########################################################
-        
-        
-    return   dataframe
\ No newline at end of file
+    Args:
+        df: El `DataFrame` de salida.
+        original: El `DataFrame` recibido por el usuario.
+
+    Returns:
+        El `DataFrame` sin columnas enlazadas con original.
+    """
+    bases = [
+        original.iloc[:, j].to_numpy() for j in range(original.shape[1])
+        if isinstance(original.dtypes.iloc[j], np.dtype)
+    ]
+    for j in range(df.shape[1]):
+        columna = df.iloc[:, j]
+        if isinstance(columna.dtype, np.dtype):
+            enlazada = any(np.may_share_memory(columna.to_numpy(), base) for base in bases)
+        else:
+            enlazada = df.columns[j] in original.columns
+        if enlazada:
+            df.isetitem(j, columna.copy())
+    return df
@@ -1,14 +1,70 @@
 import pandas as pd
 import numpy as np
+from typing import Dict, List, Optional, Tuple, Union
 
 #Creando función para eliminar valores de una columna si otras no poseen valores
-def eliminar_valor_columna1(df, Columna1, lista_columnas):
-    mask = pd.Series(True, index=df.index)  # Inicializamos la máscara como True
+def eliminar_valor_columna1(
+    df: pd.DataFrame,
+    Columna1: Union[str, Dict[str, List[str]]],
+    lista_columnas: Optional[List[str]] = None,
+    inplace: bool = False,
+    return_count: bool = False
+) -> Union[pd.DataFrame, Tuple[pd.DataFrame, int]]:
+    """
+    Elimina (convierte a NaN) los valores de una columna en las filas donde todas las columnas de las que
+    depende están vacías (NaN).
 
-    for columna in lista_columnas:
-        mask = mask & df[columna].isna()  # Actualizamos la máscara con cada columna
+    Parámetros:
+        df: DataFrame a procesar.
+        Columna1: Nombre de la columna a limpiar, o diccionario {columna: [columnas de las que depende]}
+                  para limpiar varias columnas en una sola llamada. Los objetivos se procesan en orden, de modo
+                  que una columna ya limpiada cuenta como vacía para los objetivos siguientes.
+        lista_columnas: Columnas de las que depende Columna1 (solo si Columna1 es un nombre).
+        inplace: Si es True, modifica df directamente; si es False (por defecto), trabaja sobre una copia.
+        return_count: Si es True, devuelve además el número de celdas que tenían valor y se convirtieron a NaN.
 
-    # Eliminamos cualquier valor en la 'Columna1' si la máscara es True
-    df.loc[mask, Columna1] = np.nan
+    Devuelve:
+        El DataFrame procesado, o la tupla (DataFrame, celdas modificadas) si return_count es True.
 
+    Ejemplo:
+        df, n = eliminar_valor_columna1(df, {'Peso': ['Fruto1', 'Fruto2'], 'Calibre': ['Peso']}, return_count=True)
+    """
+    if isinstance(Columna1, dict):
+        if lista_columnas is not None:
+            raise ValueError("Si 'Columna1' es un diccionario, 'lista_columnas' debe ser None.")
+        objetivos = {col: list(deps) for col, deps in Columna1.items()}
+    else:
+        if lista_columnas is None:
+            raise ValueError("Debe indicar 'lista_columnas' o pasar un diccionario {columna: [columnas]} en 'Columna1'.")
+        objetivos = {Columna1: list(lista_columnas)}
+
+    faltantes = [
+        col for col in dict.fromkeys(list(objetivos) + [dep for deps in objetivos.values() for dep in deps])
+        if col not in df.columns
+    ]
+    if faltantes:
+        raise ValueError(f"Las siguientes columnas no se encontraron en el DataFrame: {faltantes}")
+
+    if not inplace:
+        df = df.copy()
+
+    # Matriz de nulos de todas las columnas involucradas, calculada una sola vez
+    columnas = list(dict.fromkeys(list(objetivos) + [dep for deps in objetivos.values() for dep in deps]))
+    posicion = {col: j for j, col in enumerate(columnas)}
+    nulos = df[columnas].isna().to_numpy()
+
+    celdas = 0
+    for objetivo, dependencias in objetivos.items():
+        # Filas donde todas las columnas de las que depende están vacías
+        mask = nulos[:, [posicion[col] for col in dependencias]].all(axis=1)
+        j = posicion[objetivo]
+        if mask.any():
+            # Se asigna a todas las filas de la máscara, como antes, para que None también pase a NaN
+            df.loc[mask, objetivo] = np.nan
+            celdas += int((mask & ~nulos[:, j]).sum())
+        # El objetivo limpiado cuenta como vacío para los objetivos siguientes
+        nulos[:, j] |= mask
+
+    if return_count:
+        return df, celdas
     return df
@@ -0,0 +1,302 @@
+import numpy as np
+import pandas as pd
+from datetime import date, datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Union
+
+# Motores de lectura de Excel soportados por read_file
+EXCEL_ENGINES = ['openpyxl', 'streaming', 'calamine', 'auto']
+
+# Nombre de la columna que identifica la hoja cuando se leen varias hojas
+SHEET_COLUMN = 'Hoja'
+
+def calamine_available() -> bool:
+    """
+    Indica si el motor calamine (paquete python-calamine) está instalado.
+    """
+    try:
+        import python_calamine  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+def resolve_excel_engine(engine: str) -> str:
+    """
+    Valida el motor de Excel y resuelve 'auto' a 'calamine' si está instalado o a 'streaming' si no.
+    """
+    if engine not in EXCEL_ENGINES:
+        raise ValueError(f"El motor de Excel debe ser uno de {EXCEL_ENGINES}.")
+    if engine == 'auto':
+        return 'calamine' if calamine_available() else 'streaming'
+    if engine == 'calamine' and not calamine_available():
+        raise ImportError("El motor 'calamine' requiere 'python-calamine' (pip install python-calamine).")
+    return engine
+
+def _header_names(header: Sequence[object]) -> List[str]:
+    """
+    Genera los nombres de columnas a partir de la fila de encabezado con el mismo criterio que pandas:
+    celdas vacías como 'Unnamed: i' y nombres repetidos como 'nombre.1', 'nombre.2', ...
+    """
+    names = []
+    seen: Dict[str, int] = {}
+    for i, value in enumerate(header):
+        name = f"Unnamed: {i}" if value is None or value == '' else value
+        if name in seen:
+            seen[name] += 1
+            new_name = f"{name}.{seen[name]}"
+            while new_name in seen:
+                seen[name] += 1
+                new_name = f"{name}.{seen[name]}"
+            seen[new_name] = 0
+            name = new_name
+        else:
+            seen[name] = 0
+        names.append(name)
+    return names
+
+def _rows_to_frame(
+    columns: List[object],
+    positions: List[int],
+    rows: List[Sequence[object]],
+    column_types: Optional[Dict[str, type]]
+) -> pd.DataFrame:
+    """
+    Construye un DataFrame con las posiciones seleccionadas de cada fila, infiere los tipos y aplica column_types.
+    """
+    data = [
+        tuple(row[i] if i < len(row) else None for i in positions)
+        for row in rows
+    ]
+    df = pd.DataFrame.from_records(data, columns=columns) if data else pd.DataFrame(columns=columns)
+    df = df.infer_objects()
+    # Celdas vacías como NaN, como en pd.read_excel; una columna sin ningún valor queda como float64
+    for col in df.columns[df.dtypes == object]:
+        nulls = df[col].isna()
+        if nulls.all() and len(df):
+            df[col] = np.nan
+        elif nulls.any():
+            df[col] = df[col].where(~nulls, np.nan)
+    # Los tipos indicados se aplican a los valores leídos (no a los inferidos), como pd.read_excel(dtype=...):
+    # el entero 10 pasa a '10' y no a '10.0'
+    for col, dtype in (column_types or {}).items():
+        if col not in df.columns:
+            continue
+        j = columns.index(col)
+        values = pd.Series([row[j] for row in data], index=df.index, dtype=object)
+        if _is_str_type(dtype):
+            # astype(str) convertiría los vacíos en el texto 'None'; pd.read_excel los deja como NaN
+            df[col] = values.astype(str).where(values.notna(), np.nan)
+        else:
+            df[col] = values.astype(dtype)
+    return df
+
+def _match_schema(df: pd.DataFrame, schema: Dict[object, object]) -> pd.DataFrame:
+    """
+    Ajusta los tipos de un bloque a los del primer bloque en que apareció cada columna (que se guardan en schema),
+    para que todos los bloques de un archivo tengan los mismos tipos aunque algunos no tengan valores en una columna.
+    Solo se hacen conversiones sin pérdida: enteros a float, cualquier tipo a object y columnas vacías a un tipo
+    que admite vacíos. En los demás casos el bloque conserva el tipo inferido.
+    """
+    for col in df.columns:
+        dtype = df[col].dtype
+        expected = schema.setdefault(col, dtype)
+        if dtype == expected:
+            continue
+        admits_nulls = not isinstance(expected, np.dtype) or expected.kind in 'fcmMO'
+        if expected == object or (expected.kind == 'f' and dtype.kind in 'iuf'):
+            df[col] = df[col].astype(expected)
+        elif admits_nulls and df[col].isna().all():
+            df[col] = pd.Series(index=df.index, dtype=expected)
+    return df
+
+def _is_str_type(dtype: object) -> bool:
+    """
+    Indica si dtype es str (o equivalente, como 'str' o np.str_).
+    """
+    try:
+        return pd.api.types.pandas_dtype(dtype).kind == 'U'
+    except TypeError:
+        return False
+
+def _normalize_calamine_value(value: object) -> object:
+    if isinstance(value, str):
+        return None if value == '' else value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, date) and not isinstance(value, datetime):
+        return datetime(value.year, value.month, value.day)
+    return value
+
+def _iter_sheet_rows(file_path: Path, engine: str, sheet: Union[str, int]) -> Iterator[Sequence[object]]:
+    """
+    Recorre las filas (valores) de una hoja sin construir el modelo completo del libro.
+    """
+    if engine == 'calamine':
+        from python_calamine import CalamineWorkbook
+        workbook = CalamineWorkbook.from_path(str(file_path))
+        if isinstance(sheet, int):
+            sheet_obj = workbook.get_sheet_by_index(sheet)
+        else:
+            sheet_obj = workbook.get_sheet_by_name(sheet)
+        # calamine devuelve '' en las celdas vacías, float en todos los números y date en las fechas sin hora;
+        # se normalizan como en pd.read_excel
+        for row in sheet_obj.to_python(skip_empty_area=False):
+            yield [_normalize_calamine_value(value) for value in row]
+    else:
+        from openpyxl import load_workbook
+        workbook = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            worksheet = workbook.worksheets[sheet] if isinstance(sheet, int) else workbook[sheet]
+            # Ignorar las dimensiones guardadas en el archivo, que algunos programas escriben mal
+            worksheet.reset_dimensions()
+            yield from worksheet.iter_rows(values_only=True)
+        finally:
+            workbook.close()
+
+def list_excel_sheets(file_path: Union[str, Path], engine: str = 'streaming') -> List[str]:
+    """
+    Devuelve los nombres de las hojas de un libro de Excel sin leer su contenido.
+    """
+    engine = resolve_excel_engine(engine)
+    if engine == 'calamine':
+        from python_calamine import CalamineWorkbook
+        return list(CalamineWorkbook.from_path(str(file_path)).sheet_names)
+    from openpyxl import load_workbook
+    workbook = load_workbook(file_path, read_only=True)
+    try:
+        return list(workbook.sheetnames)
+    finally:
+        workbook.close()
+
+def _sheet_list(sheet_name: Union[str, int, List[Union[str, int]], None], file_path: Path, engine: str):
+    """
+    Normaliza sheet_name a una lista de nombres de hojas. None selecciona todas las hojas.
+    """
+    if isinstance(sheet_name, str):
+        return [sheet_name]
+    names = list_excel_sheets(file_path, engine)
+    if sheet_name is None:
+        return names
+    selected = sheet_name if isinstance(sheet_name, (list, tuple)) else [sheet_name]
+    return [names[sheet] if isinstance(sheet, int) else sheet for sheet in selected]
+
+def read_excel_header(
+    file_path: Union[str, Path],
+    engine: str = 'streaming',
+    sheet_name: Union[str, int, List[Union[str, int]], None] = 0,
+    usecols: Optional[Callable[[object], bool]] = None
+) -> List[object]:
+    """
+    Lee solo la fila de encabezado de las hojas seleccionadas y devuelve los nombres de columnas
+    (unión en orden de aparición), incluida la columna 'Hoja' si se leen varias hojas.
+    Ver iter_excel_chunks para la descripción de los parámetros.
+    """
+    file_path = Path(file_path)
+    engine = resolve_excel_engine(engine)
+    if engine == 'openpyxl':
+        engine = 'streaming'
+    multiple = sheet_name is None or isinstance(sheet_name, (list, tuple))
+
+    columns: Dict[object, None] = {}
+    for sheet in _sheet_list(sheet_name, file_path, engine):
+        rows = _iter_sheet_rows(file_path, engine, sheet)
+        try:
+            header = next(rows, None)
+        finally:
+            rows.close()
+        if header is not None:
+            columns.update(dict.fromkeys(name for name in _header_names(header) if usecols is None or usecols(name)))
+    if multiple:
+        columns[SHEET_COLUMN] = None
+    return list(columns)
+
+def iter_excel_chunks(
+    file_path: Union[str, Path],
+    engine: str = 'streaming',
+    sheet_name: Union[str, int, List[Union[str, int]], None] = 0,
+    column_types: Optional[Dict[str, type]] = None,
+    usecols: Optional[Callable[[object], bool]] = None,
+    chunksize: Optional[int] = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Lee un archivo Excel recorriendo las filas en streaming y produce DataFrames de como máximo
+    *chunksize* filas (o un solo DataFrame por hoja si chunksize es None). Los tipos de cada columna los fija el
+    primer bloque en que aparece y los bloques siguientes se ajustan a ellos cuando la conversión no pierde datos;
+    una columna sin valores en el primer bloque queda como float64, así que conviene fijar su tipo en column_types.
+
+    Parámetros:
+        file_path: Ruta al archivo .xlsx.
+        engine: 'streaming' (openpyxl en modo solo lectura), 'calamine' (python-calamine) o 'auto'.
+        sheet_name: Hoja (nombre o índice), lista de hojas o None para todas. Por defecto la primera hoja.
+                    Si se pide una lista de hojas o todas, se agrega la columna 'Hoja' con el nombre de la hoja.
+        column_types: Diccionario de tipos de datos para las columnas.
+        usecols: Función que recibe el nombre de una columna y devuelve True si se debe leer.
+        chunksize: Número máximo de filas por bloque.
+
+    Devuelve:
+        Un generador de DataFrames.
+    """
+    file_path = Path(file_path)
+    engine = resolve_excel_engine(engine)
+    if engine == 'openpyxl':
+        engine = 'streaming'
+    multiple = sheet_name is None or isinstance(sheet_name, (list, tuple))
+    # Tipos de cada columna según el primer bloque en que aparece; los bloques siguientes se ajustan a ellos
+    schema: Dict[object, object] = {}
+
+    for sheet in _sheet_list(sheet_name, file_path, engine):
+        rows = _iter_sheet_rows(file_path, engine, sheet)
+        header = next(rows, None)
+        if header is None:
+            continue
+        names = _header_names(header)
+        positions = [i for i, name in enumerate(names) if usecols is None or usecols(name)]
+        columns = [names[i] for i in positions]
+
+        buffer = []
+        # Filas vacías pendientes: pd.read_excel conserva las intermedias y descarta las del final de la hoja
+        blank = []
+        emitted = False
+        for row in rows:
+            if not any(value is not None and value != '' for value in row):
+                blank.append(row)
+                continue
+            buffer.extend(blank)
+            blank = []
+            buffer.append(row)
+            while chunksize and len(buffer) >= chunksize:
+                chunk = _match_schema(_rows_to_frame(columns, positions, buffer[:chunksize], column_types), schema)
+                buffer = buffer[chunksize:]
+                if multiple:
+                    chunk[SHEET_COLUMN] = sheet
+                emitted = True
+                yield chunk
+        if buffer or not emitted:
+            chunk = _match_schema(_rows_to_frame(columns, positions, buffer, column_types), schema)
+            if multiple:
+                chunk[SHEET_COLUMN] = sheet
+            yield chunk
+
+def read_excel_fast(
+    file_path: Union[str, Path],
+    engine: str = 'streaming',
+    sheet_name: Union[str, int, List[Union[str, int]], None] = 0,
+    column_types: Optional[Dict[str, type]] = None,
+    usecols: Optional[Callable[[object], bool]] = None
+) -> pd.DataFrame:
+    """
+    Lee un archivo Excel con un motor rápido ('streaming' o 'calamine') en un solo DataFrame.
+    Ver iter_excel_chunks para la descripción de los parámetros.
+    """
+    chunks = list(iter_excel_chunks(
+        file_path,
+        engine=engine,
+        sheet_name=sheet_name,
+        column_types=column_types,
+        usecols=usecols
+    ))
+    if not chunks:
+        return pd.DataFrame()
+    if len(chunks) == 1:
+        return chunks[0]
+    return pd.concat(chunks, ignore_index=True)
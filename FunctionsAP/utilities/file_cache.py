@@ -0,0 +1,209 @@
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+import pandas as pd
+
+# Formatos columnares soportados para la caché por archivo
+CACHE_FORMATS = ['parquet', 'feather']
+
+# Nombre del manifiesto dentro de la carpeta de caché
+MANIFEST_NAME = 'manifest.json'
+
+def file_hash(file_path: Union[str, Path], block_size: int = 1024 * 1024) -> str:
+    """
+    Calcula el hash (blake2b) del contenido de un archivo leyéndolo por bloques.
+    """
+    h = hashlib.blake2b(digest_size=20)
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            h.update(block)
+    return h.hexdigest()
+
+def options_signature(options: Dict[str, object]) -> str:
+    """
+    Crea una firma estable de las opciones de lectura. Si cambia la firma, las entradas
+    de la caché guardadas con otras opciones dejan de ser válidas.
+    """
+    def _normalize(value):
+        if isinstance(value, dict):
+            return {str(k): _normalize(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [_normalize(v) for v in value]
+        if isinstance(value, (set, frozenset)):
+            return sorted((_normalize(v) for v in value), key=repr)
+        if value is None or isinstance(value, (str, int, float, bool)):
+            return value
+        # Tipos de datos (str, np.float32, 'Int64', ...) se representan por su nombre
+        return getattr(value, '__name__', str(value))
+
+    payload = json.dumps(_normalize(options), sort_keys=True, ensure_ascii=False)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=20).hexdigest()
+
+class FileCache:
+    """
+    Caché incremental de archivos leídos por join_files.
+
+    Guarda en `cache_dir` un manifiesto (manifest.json) con la ruta, tamaño, fecha de modificación,
+    hash del contenido y firma de opciones de cada archivo, junto con el DataFrame ya normalizado
+    en formato columnar (Parquet o Feather). En las siguientes ejecuciones solo se vuelven a leer
+    los archivos nuevos o modificados.
+
+    Parámetros:
+        cache_dir: Carpeta donde se guardan el manifiesto y los archivos de caché.
+        options: Opciones de lectura que afectan al resultado (column_types, separators, normalize_columns, ...).
+        cache_format: 'parquet' (por defecto) o 'feather'. Ambos requieren pyarrow.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path], options: Dict[str, object], cache_format: str = 'parquet'):
+        if cache_format not in CACHE_FORMATS:
+            raise ValueError(f"El formato de caché debe ser uno de {CACHE_FORMATS}.")
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError as e:
+            raise ImportError("La caché incremental requiere 'pyarrow' (pip install pyarrow).") from e
+
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_format = cache_format
+        self.signature = options_signature(options)
+        self.manifest_path = self.cache_dir / MANIFEST_NAME
+        self.entries = self._load_manifest()
+
+    def _load_manifest(self) -> Dict[str, Dict[str, object]]:
+        if not self.manifest_path.is_file():
+            return {}
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logging.getLogger(__name__).warning(f"No se pudo leer el manifiesto {self.manifest_path}, se reconstruirá: {e}")
+            return {}
+
+    @staticmethod
+    def _key(file_path: Path) -> str:
+        return str(Path(file_path).resolve())
+
+    def cache_path(self, file_path: Path) -> Path:
+        """
+        Ruta del archivo de caché que corresponde a file_path.
+        """
+        name = hashlib.blake2b(self._key(file_path).encode('utf-8'), digest_size=10).hexdigest()
+        return self.cache_dir / f"{name}.{self.cache_format}"
+
+    def lookup(self, file_path: Path, return_state: bool = False):
+        """
+        Devuelve la entrada del manifiesto si la caché de file_path es válida, o None si hay que leer el archivo.
+
+        La entrada es válida si coinciden la firma de opciones y el tamaño, y además coincide la fecha de
+        modificación o, si esta cambió, el hash del contenido.
+
+        Con return_state=True devuelve la tupla (entrada o None, estado), donde estado es el diccionario
+        'size', 'mtime_ns' y 'hash' del archivo en este momento. Se debe consultar antes de leer el archivo y
+        pasar el estado a record: así el hash no se calcula dos veces y, si el archivo cambia durante la
+        lectura, la caché queda registrada con el estado anterior y se invalida en la siguiente ejecución.
+        """
+        state = self._file_state(file_path, with_hash=False) if return_state else None
+        entry = self._valid_entry(file_path, state)
+        if not return_state:
+            return entry
+        if state['hash'] is None:
+            state['hash'] = entry['hash'] if entry is not None else file_hash(file_path)
+        return entry, state
+
+    def _valid_entry(self, file_path: Path, state: Optional[Dict[str, object]]) -> Optional[Dict[str, object]]:
+        """
+        Entrada válida de file_path (ver lookup). Si se pasa state, se usa su tamaño y fecha de modificación
+        y se guarda en él el hash si hubo que calcularlo.
+        """
+        entry = self.entries.get(self._key(file_path))
+        if entry is None or entry.get('signature') != self.signature:
+            return None
+        if entry.get('format') != self.cache_format or not (self.cache_dir / entry['cache_file']).is_file():
+            return None
+
+        if state is None:
+            state = self._file_state(file_path, with_hash=False)
+        if state['size'] != entry.get('size'):
+            return None
+        if state['mtime_ns'] != entry.get('mtime_ns'):
+            # El archivo se tocó pero puede tener el mismo contenido
+            state['hash'] = file_hash(file_path)
+            if state['hash'] != entry.get('hash'):
+                return None
+            entry['mtime_ns'] = state['mtime_ns']
+        return entry
+
+    @staticmethod
+    def _file_state(file_path: Path, with_hash: bool = True) -> Dict[str, object]:
+        stat = Path(file_path).stat()
+        return {
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'hash': file_hash(file_path) if with_hash else None
+        }
+
+    def record(
+        self,
+        file_path: Path,
+        dialect: Optional[Dict[str, Optional[str]]] = None,
+        state: Optional[Dict[str, object]] = None
+    ) -> None:
+        """
+        Registra en el manifiesto que file_path se guardó en la caché.
+
+        state es el estado del archivo antes de leerlo (ver lookup con return_state=True). Si no se pasa,
+        se toma ahora, lo que vuelve a leer el archivo para calcular el hash.
+        """
+        if state is None:
+            state = self._file_state(file_path)
+        self.entries[self._key(file_path)] = {
+            'size': state['size'],
+            'mtime_ns': state['mtime_ns'],
+            'hash': state['hash'],
+            'signature': self.signature,
+            'format': self.cache_format,
+            'cache_file': self.cache_path(file_path).name,
+            'dialect': dialect or {}
+        }
+
+    def save(self) -> None:
+        """
+        Guarda el manifiesto de forma atómica, eliminando las entradas (y sus archivos de caché)
+        de archivos que ya no existen.
+        """
+        for key in [k for k in self.entries if not Path(k).exists()]:
+            stale = self.cache_dir / self.entries.pop(key)['cache_file']
+            if stale.is_file():
+                stale.unlink()
+
+        tmp_path = self.manifest_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, self.manifest_path)
+
+def write_cache(df: pd.DataFrame, cache_path: Union[str, Path], cache_format: str) -> bool:
+    """
+    Guarda df en cache_path. Devuelve False (y registra una advertencia) si el DataFrame no se puede
+    guardar en formato columnar, por ejemplo por columnas de tipos mixtos.
+    """
+    try:
+        if cache_format == 'feather':
+            df.reset_index(drop=True).to_feather(cache_path)
+        else:
+            df.to_parquet(cache_path, index=False)
+        return True
+    except Exception as e:
+        logging.getLogger(__name__).warning(f"No se pudo guardar la caché {Path(cache_path).name}: {e}")
+        return False
+
+def read_cache(cache_path: Union[str, Path], cache_format: str) -> pd.DataFrame:
+    """
+    Lee un DataFrame guardado con write_cache.
+    """
+    if cache_format == 'feather':
+        return pd.read_feather(cache_path)
+    return pd.read_parquet(cache_path)
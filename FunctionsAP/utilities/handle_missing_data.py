@@ -1,5 +1,12 @@
 import pandas as pd
 import numpy as np
+from typing import Dict, Tuple, Union
+
+# Métodos de relleno soportados en mode='fill'
+FILL_METHODS = ['moda', 'media', 'mediana']
+
+# Formatos del informe en mode='detect'
+DETECT_OUTPUTS = ['list', 'bitmask', 'long']
 
 # Función para rellenar valores faltantes según código
 def handle_missing_data(
@@ -10,8 +17,11 @@ def handle_missing_data(
     mode: str = 'detect',
     method: str = 'moda',
     columnas_info: list = None,
-    verbose: bool = True
-) -> pd.DataFrame:
+    verbose: bool = True,
+    detect_output: str = 'list',
+    return_summary: bool = False,
+    inplace: bool = False
+) -> Union[pd.DataFrame, Tuple[pd.DataFrame, Dict[str, pd.DataFrame]]]:
     """
     Función para detección y/o relleno de datos faltantes según valores únicos y evaluaciones en un dataframe.
 
@@ -31,11 +41,21 @@ def handle_missing_data(
         Columnas adicionales a incluir en el resultado [[3]]
     verbose (bool):
         Mostrar mensajes de proceso (default: True)
+    detect_output (str):
+        Formato del informe en modo 'detect':
+        'list' (default) una fila por registro incompleto con la lista 'missing_columns' y 'missing_count';
+        'bitmask' igual, pero con el entero 'missing_mask' (bit j = columnas_a_evaluar[j]) en lugar de la lista;
+        'long' una fila por celda faltante (registro, 'columna'), sin listas
+    return_summary (bool):
+        En modo 'detect', devolver además un diccionario con los resúmenes 'codigo' y 'semana':
+        por cada código/semana, filas totales, filas incompletas, filas sin ningún dato y faltantes por columna
+    inplace (bool):
+        En modo 'fill', rellenar directamente el DataFrame recibido en lugar de una copia (default: False)
 
     Retorna:
     --------
     - En modo 'detect': 
-        pd.DataFrame con informe de valores faltantes
+        pd.DataFrame con informe de valores faltantes, o la tupla (informe, resúmenes) si return_summary es True
     - En modo 'fill': 
         pd.DataFrame con valores rellenados
 
@@ -48,6 +68,7 @@ def handle_missing_data(
     Ejemplo:
     --------
     >>> df_missing = df.handle_missing_data(cols, 'ID', 'Semana', mode='detect')
+    >>> df_long, resumen = df.handle_missing_data(cols, 'ID', 'Semana', detect_output='long', return_summary=True)
     >>> df_filled = df.handle_missing_data(cols, 'ID', 'Semana', mode='fill')
     """
     
@@ -63,73 +84,291 @@ def handle_missing_data(
         if col not in self.columns:
             raise ValueError(f"Columna faltante: {col} [[6]]")
 
-    df_copy = self.copy()
-    mask = df_copy[columnas_a_evaluar].applymap(lambda x: pd.isna(x) or x == '')
-    filtered_mask = mask.any(axis=1) & ~mask.all(axis=1)
+    if mode == 'detect' and detect_output not in DETECT_OUTPUTS:
+        raise ValueError(f"El formato de salida debe ser uno de {DETECT_OUTPUTS}")
+
+    mask_values = _missing_mask(self, columnas_a_evaluar)
+    any_missing = mask_values.any(axis=1)
+    all_missing = mask_values.all(axis=1)
+    filtered_mask = any_missing & ~all_missing
 
     if mode == 'detect':
-        # Lógica de detección de missing values
-        missing_cols = mask.loc[filtered_mask].apply(
-            lambda row: [col for col in row.index if row[col]], 
-            axis=1
-        )
-        
+        # Lógica de detección de missing values, con arreglos booleanos de NumPy
         info_cols = columnas_info + [columna_codigo, columna_semana] if columnas_info else [columna_codigo, columna_semana]
-        result_df = df_copy.loc[filtered_mask, info_cols].copy()
-        result_df['missing_columns'] = missing_cols
-        result_df['missing_count'] = mask.sum(axis=1)
-        
+        rows = np.flatnonzero(filtered_mask)
+        sub_mask = mask_values[rows]
+
+        if detect_output == 'long':
+            row_pos, col_pos = np.nonzero(sub_mask)
+            result_df = self[info_cols].iloc[rows[row_pos]].copy()
+            result_df['columna'] = pd.Categorical.from_codes(col_pos, categories=columnas_a_evaluar)
+        else:
+            result_df = self[info_cols].iloc[rows].copy()
+            if detect_output == 'list':
+                row_pos, col_pos = np.nonzero(sub_mask)
+                names = np.asarray(columnas_a_evaluar, dtype=object)[col_pos]
+                bounds = np.cumsum(np.bincount(row_pos, minlength=len(rows)))[:-1]
+                result_df['missing_columns'] = [part.tolist() for part in np.split(names, bounds)] if len(rows) else []
+            else:
+                if len(columnas_a_evaluar) > 64:
+                    raise ValueError("El formato 'bitmask' admite como máximo 64 columnas; use 'long'")
+                weights = np.left_shift(np.uint64(1), np.arange(len(columnas_a_evaluar), dtype=np.uint64))
+                result_df['missing_mask'] = (sub_mask * weights).sum(axis=1, dtype=np.uint64)
+            result_df['missing_count'] = sub_mask.sum(axis=1)
+
+        if return_summary:
+            summary = {
+                'codigo': _missing_summary(self[columna_codigo], mask_values, filtered_mask, all_missing, columnas_a_evaluar),
+                'semana': _missing_summary(self[columna_semana], mask_values, filtered_mask, all_missing, columnas_a_evaluar)
+            }
+            return result_df, summary
         return result_df
 
     elif mode == 'fill':
-        # Lógica de relleno inteligente
-        num_rellenadas = 0
-
-        def fill_row(row):
-            nonlocal num_rellenadas
-            original_row = row.copy()
-            
-            for col in columnas_a_evaluar:
-                if pd.isna(row[col]) or row[col] == '':
-                    # Filtrar valores válidos del mismo código en otras semanas
-                    filtro = (df_copy[columna_codigo] == row[columna_codigo]) & \
-                            (df_copy[columna_semana] != row[columna_semana])
-                            
-                    valores = df_copy.loc[filtro, col].replace('', np.nan).dropna()
-                    
-                    if valores.empty:
-                        continue  # Sin valores para rellenar [[2]]
-                        
-                    # Calcular estadístico según método
-                    try:
-                        if method == 'moda':
-                            nuevo_valor = valores.mode()[0] if not valores.mode().empty else np.nan
-                        elif method in ['media', 'mediana']:
-                            valores_num = pd.to_numeric(valores, errors='raise')
-                            nuevo_valor = getattr(valores_num, method)()
-                        else:
-                            raise ValueError(f"Método '{method}' no válido [[4]]")
-                    except Exception as e:
-                        print(f"Error en columna '{col}': {str(e)}")
-                        continue
-
-                    # Actualizar valor y conteo
-                    if not pd.isna(nuevo_valor):
-                        row[col] = nuevo_valor
-                        if verbose:
-                            print(f"Rellenado {col} para {columna_codigo}={row[columna_codigo]} con {nuevo_valor} [[3]]")
-            
-            if not original_row.equals(row):
-                num_rellenadas += 1
-            return row
-
-        # Aplicar relleno y preparar salida
-        df_filled = df_copy.copy()
-        df_filled.loc[filtered_mask] = df_filled.loc[filtered_mask].apply(fill_row, axis=1)
+        # Relleno vectorizado: en lugar de filtrar el DataFrame completo por cada celda faltante,
+        # se agrupan los valores válidos por código y se calcula el estadístico una vez por par (código, semana)
+        if method not in FILL_METHODS:
+            raise ValueError(f"Método '{method}' no válido [[4]]")
+
+        df_filled = self if inplace else self.copy()
+        codes = self[columna_codigo].reset_index(drop=True)
+        weeks = self[columna_semana].reset_index(drop=True)
+        code_ids = pd.factorize(codes)[0]
+        week_ids = pd.factorize(weeks)[0]
+        rows_to_fill = filtered_mask
+        filled_rows = np.zeros(len(self), dtype=bool)
+        fill_counts = {}
+
+        for j, col in enumerate(columnas_a_evaluar):
+            missing = mask_values[:, j]
+            # Celdas a rellenar: filas con faltantes parciales y código no nulo (un código nulo no coincide con ninguno)
+            targets = np.flatnonzero(rows_to_fill & missing & (code_ids >= 0))
+            valid = np.flatnonzero(~missing & (code_ids >= 0))
+            if len(targets) == 0 or len(valid) == 0:
+                fill_counts[col] = 0
+                continue
+
+            values = self[col].reset_index(drop=True)
+            try:
+                if method == 'moda':
+                    fill_values = _fill_values_moda(code_ids, week_ids, values, valid, targets)
+                else:
+                    fill_values = _fill_values_numeric(code_ids, week_ids, values, valid, targets, method)
+            except _FillError as e:
+                print(f"Error en columna '{col}': {e.message}")
+                fill_values = e.partial
+
+            filled = ~pd.isna(fill_values)
+            positions = targets[filled]
+            if len(positions):
+                # Inferir el tipo de los valores para no convertir la columna a object al asignarlos
+                new_values = pd.Series(fill_values[filled], dtype=object).infer_objects().to_numpy()
+                df_filled.iloc[positions, df_filled.columns.get_loc(col)] = new_values
+                filled_rows[positions] = True
+            fill_counts[col] = int(len(positions))
+
+        num_rellenadas = int(filled_rows.sum())
 
         if verbose:
             print(f"\n--- Relleno completado ---")
+            for col, count in fill_counts.items():
+                print(f"Rellenados en {col}: {count}")
             print(f"Filas modificadas: {num_rellenadas} [[5]]")
             print(f"Metodo utilizado: {method}")
-        
-        return df_filled
\ No newline at end of file
+
+        return df_filled
+
+class _FillError(Exception):
+    """
+    Error al calcular el estadístico de algunas celdas. partial contiene los valores calculados (NaN en las demás).
+    """
+
+    def __init__(self, message: str, partial: np.ndarray):
+        super().__init__(message)
+        self.message = message
+        self.partial = partial
+
+def _missing_mask(df: pd.DataFrame, columns: list) -> np.ndarray:
+    """
+    Matriz booleana (filas x columnas) con True en las celdas nulas o con cadena vacía.
+    """
+    mask = np.empty((len(df), len(columns)), dtype=bool)
+    for j, col in enumerate(columns):
+        series = df[col]
+        col_mask = series.isna().to_numpy(dtype=bool)
+        if pd.api.types.is_object_dtype(series.dtype) or pd.api.types.is_string_dtype(series.dtype):
+            col_mask |= series.eq('').fillna(False).to_numpy(dtype=bool)
+        mask[:, j] = col_mask
+    return mask
+
+def _missing_summary(
+    keys: pd.Series,
+    mask_values: np.ndarray,
+    filtered_mask: np.ndarray,
+    all_missing: np.ndarray,
+    columns: list
+) -> pd.DataFrame:
+    """
+    Resumen de datos faltantes por cada valor de keys (código o semana): filas totales, filas incompletas,
+    filas sin ningún dato en las columnas evaluadas y número de celdas faltantes por columna.
+    """
+    data = pd.DataFrame(mask_values, columns=columns)
+    data.insert(0, 'filas', 1)
+    data.insert(1, 'filas_incompletas', filtered_mask.astype(np.int64))
+    data.insert(2, 'filas_vacias', all_missing.astype(np.int64))
+    summary = data.groupby(keys.to_numpy(), sort=False, dropna=False).sum()
+    summary.index.name = keys.name
+    return summary.sort_values('filas_incompletas', ascending=False, kind='mergesort')
+
+def _target_pairs(code_ids: np.ndarray, week_ids: np.ndarray, targets: np.ndarray):
+    """
+    Pares (código, semana) distintos de las celdas a rellenar y, para cada celda, el índice de su par.
+    """
+    pairs, pair_of_target = np.unique(
+        np.column_stack([code_ids[targets], week_ids[targets]]), axis=0, return_inverse=True
+    )
+    return pairs, pair_of_target.ravel()
+
+def _fill_values_moda(
+    code_ids: np.ndarray,
+    week_ids: np.ndarray,
+    values: pd.Series,
+    valid: np.ndarray,
+    targets: np.ndarray
+) -> np.ndarray:
+    """
+    Moda de los valores del mismo código en las otras semanas para cada celda a rellenar.
+
+    Se cuentan los valores por (código, valor) y por (código, semana, valor); la frecuencia sin la semana
+    propia es la diferencia de ambos conteos. Los empates se resuelven con el menor valor, como Series.mode().
+    """
+    pairs, pair_of_target = _target_pairs(code_ids, week_ids, targets)
+    source = pd.DataFrame({'c': code_ids[valid], 'w': week_ids[valid], 'v': values.iloc[valid].to_numpy()})
+    total = source.groupby(['c', 'v'], sort=False).size().rename('n').reset_index()
+    per_week = source.groupby(['c', 'w', 'v'], sort=False).size().rename('nw').reset_index()
+
+    candidates = pd.DataFrame({'pair': np.arange(len(pairs)), 'c': pairs[:, 0], 'w': pairs[:, 1]})
+    candidates = candidates.merge(total, on='c').merge(per_week, on=['c', 'w', 'v'], how='left')
+    # Una semana nula (-1) no se excluye: NaN != semana siempre es True
+    exclude = candidates['nw'].fillna(0).to_numpy() * (candidates['w'].to_numpy() >= 0)
+    candidates['n'] = candidates['n'].to_numpy() - exclude
+    candidates = candidates[candidates['n'] > 0]
+
+    try:
+        candidates = candidates.sort_values(['pair', 'n', 'v'], ascending=[True, False, True], kind='mergesort')
+    except TypeError:
+        # Valores no comparables entre sí: se calcula la moda de cada par como lo hace pandas
+        return _fill_values_exact(
+            code_ids, week_ids, values.iloc[valid].to_numpy(), valid, targets,
+            lambda vals: pd.Series(vals).mode().iloc[0]
+        )
+    best = candidates.drop_duplicates('pair')
+
+    pair_values = np.full(len(pairs), np.nan, dtype=object)
+    pair_values[best['pair'].to_numpy()] = best['v'].to_numpy()
+    return pair_values[pair_of_target]
+
+def _fill_values_numeric(
+    code_ids: np.ndarray,
+    week_ids: np.ndarray,
+    values: pd.Series,
+    valid: np.ndarray,
+    targets: np.ndarray,
+    method: str
+) -> np.ndarray:
+    """
+    Media o mediana de los valores del mismo código en las otras semanas para cada celda a rellenar.
+    """
+    source = values.iloc[valid]
+    numeric = pd.to_numeric(source, errors='coerce')
+    # Valores que no se pueden convertir a número: los pares que los usan no se rellenan
+    invalid = (numeric.isna() & source.notna()).to_numpy()
+    numeric = numeric.to_numpy()
+
+    if method == 'media':
+        partial = _fill_values_media(code_ids, week_ids, numeric, valid, targets, invalid)
+    else:
+        # La mediana no se puede obtener restando agregados, así que se calcula por par (código, semana)
+        def stat(vals):
+            return np.median(vals.astype(np.float64))
+
+        partial = _fill_values_exact(
+            code_ids, week_ids, numeric, valid, targets, stat, invalid=invalid if invalid.any() else None
+        )
+
+    if not invalid.any():
+        return partial
+    bad_value = source.to_numpy()[invalid][0]
+    raise _FillError(f'Unable to parse string "{bad_value}"', partial)
+
+def _fill_values_media(
+    code_ids: np.ndarray,
+    week_ids: np.ndarray,
+    numeric: np.ndarray,
+    valid: np.ndarray,
+    targets: np.ndarray,
+    invalid: np.ndarray
+) -> np.ndarray:
+    """
+    Media de los valores del mismo código en las otras semanas para cada celda a rellenar, sin recorrer los pares.
+
+    Se suman los valores (y se cuentan) por código y por (código, semana); el agregado sin la semana propia es
+    la diferencia de ambos. Los pares cuyo código tiene en otras semanas valores no numéricos quedan en NaN.
+    """
+    pairs, pair_of_target = _target_pairs(code_ids, week_ids, targets)
+    ok = ~invalid
+    source = pd.DataFrame({
+        'c': code_ids[valid],
+        'w': week_ids[valid],
+        'suma': np.where(ok, numeric, 0).astype(np.float64),
+        'n': ok.astype(np.int64),
+        'invalidos': invalid.astype(np.int64)
+    })
+    by_code = source.groupby('c')[['suma', 'n', 'invalidos']].sum()
+    by_week = source.groupby(['c', 'w'])[['suma', 'n', 'invalidos']].sum()
+
+    totals = by_code.reindex(pairs[:, 0]).fillna(0).to_numpy()
+    own_week = by_week.reindex(pd.MultiIndex.from_arrays([pairs[:, 0], pairs[:, 1]])).fillna(0).to_numpy()
+    # Una semana nula (-1) no se excluye: NaN != semana siempre es True
+    own_week[pairs[:, 1] < 0] = 0
+    suma, n, invalidos = (totals - own_week).T
+
+    pair_values = np.full(len(pairs), np.nan, dtype=object)
+    keep = (n > 0) & (invalidos == 0)
+    pair_values[keep] = suma[keep] / n[keep]
+    return pair_values[pair_of_target]
+
+def _fill_values_exact(
+    code_ids: np.ndarray,
+    week_ids: np.ndarray,
+    source_values: np.ndarray,
+    valid: np.ndarray,
+    targets: np.ndarray,
+    stat,
+    invalid: np.ndarray = None
+) -> np.ndarray:
+    """
+    Aplica stat a los valores del mismo código en las otras semanas, una vez por par (código, semana).
+
+    Los valores válidos se ordenan por código una sola vez, de modo que cada par solo recorre
+    el bloque de su código. Se conserva el orden original de las filas dentro de cada código.
+    """
+    pairs, pair_of_target = _target_pairs(code_ids, week_ids, targets)
+    order = np.argsort(code_ids[valid], kind='stable')
+    sorted_codes = code_ids[valid][order]
+    sorted_weeks = week_ids[valid][order]
+    sorted_values = source_values[order]
+    sorted_invalid = invalid[order] if invalid is not None else None
+    starts = np.searchsorted(sorted_codes, pairs[:, 0], side='left')
+    ends = np.searchsorted(sorted_codes, pairs[:, 0], side='right')
+
+    pair_values = np.full(len(pairs), np.nan, dtype=object)
+    for k, (code, week) in enumerate(pairs):
+        block = slice(starts[k], ends[k])
+        keep = sorted_weeks[block] != week if week >= 0 else np.ones(ends[k] - starts[k], dtype=bool)
+        if not keep.any():
+            continue
+        if sorted_invalid is not None and sorted_invalid[block][keep].any():
+            continue
+        pair_values[k] = stat(sorted_values[block][keep])
+    return pair_values[pair_of_target]
@@ -2,13 +2,22 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 import re
+import io
 from datetime import datetime
 from dateutil import parser
 from dateutil.parser import ParserError
 import pytz
 import logging
 import unicodedata
-from typing import List, Dict, Optional, Union
+from functools import lru_cache
+import time
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple, Union
+from .file_cache import FileCache, read_cache, write_cache
+from .optimize_dtypes import optimize_dtypes
+from .procesar_valores import PARALLEL_EXECUTORS
+from .excel_reader import SHEET_COLUMN, iter_excel_chunks, read_excel_fast, read_excel_header, resolve_excel_engine
 
 def join_files(
     folder_path: Union[str, Path],
@@ -24,8 +33,19 @@ def join_files(
     suffix_delimiter: str = "_",
     suffix_filter: Optional[str] = None,
     normalize_columns: bool = False,
-    separators: Optional[Union[str, List[str]]] = None
-) -> pd.DataFrame:
+    separators: Optional[Union[str, List[str]]] = None,
+    parallel: bool = False,
+    max_workers: Optional[int] = None,
+    return_report: bool = False,
+    cache_dir: Optional[Union[str, Path]] = None,
+    cache_format: str = 'parquet',
+    usecols: Optional[List[str]] = None,
+    filters: Optional[List[Tuple[str, str, object]]] = None,
+    optimize_memory: bool = False,
+    excel_engine: str = 'openpyxl',
+    sheet_name: Union[str, int, List[Union[str, int]], None] = 0,
+    excel_executor: str = 'thread'
+) -> Union[pd.DataFrame, Tuple[pd.DataFrame, pd.DataFrame]]:
     """
     Crea un DataFrame a partir de archivos CSV o Excel en una carpeta.
 
@@ -47,9 +67,41 @@ def join_files(
         normalize_columns: Si es True, se realiza pre procesamiento de nombres de columnas, unificando columnas que sean iguales
                            ignorando mayúsculas, espacios y acentos.
         separators: Separador o lista de separadores para archivos CSV. Por defecto es ",".
+        parallel: Si es True, los archivos se leen en paralelo en un pool de hilos (los Excel, según excel_executor).
+                  El orden de las filas del resultado es el mismo que en la lectura secuencial.
+        max_workers: Número máximo de hilos/procesos a usar cuando parallel=True. Por defecto lo decide Python.
+        return_report: Si es True, devuelve además un DataFrame con el informe por archivo
+                       (archivo, estado, filas, segundos, codificación y separador detectados,
+                       origen de caché y mensaje de error si lo hubo). Con optimize_memory, el informe de memoria
+                       se guarda en report.attrs['memoria'].
+        cache_dir: Si se especifica, activa el modo incremental: en esta carpeta se guarda un manifiesto
+                   (ruta, tamaño, fecha de modificación y hash de cada archivo) y el DataFrame ya normalizado
+                   de cada archivo. En las siguientes ejecuciones solo se leen los archivos nuevos o modificados;
+                   la caché se invalida si cambian column_types, encodings, separators o normalize_columns.
+                   Requiere pyarrow.
+        cache_format: Formato de la caché por archivo: 'parquet' (por defecto) o 'feather'.
+        usecols: Lista de columnas a leer de cada archivo. Los nombres se comparan ignorando mayúsculas, espacios
+                 y acentos (como en normalize_and_merge_columns), de modo que 'Código' también selecciona 'codigo '.
+                 Las demás columnas no se llegan a parsear.
+        filters: Lista de filtros de filas (columna, operador, valor) combinados con AND, que se aplican bloque a
+                 bloque durante la lectura. Operadores: '==', '!=', '<', '<=', '>', '>=', 'in', 'not in', 'startswith'.
+                 Ejemplo: [('Semana', 'in', {10, 11}), ('Codigo', 'startswith', 'CS')].
+        optimize_memory: Si es True, optimiza los tipos del resultado con optimize_dtypes: textos repetidos a
+                         'category', numéricos reducidos y las columnas de fecha y 'Suffix' como 'category'.
+                         Se registra en el log la memoria antes y después y, con return_report, el informe de
+                         optimize_dtypes ('bytes_antes', 'bytes_despues' y 'columnas') queda en report.attrs['memoria'].
+        excel_engine: Motor para archivos .xlsx: 'openpyxl' (por defecto), 'streaming' (openpyxl en modo solo
+                      lectura, mucho más rápido en libros grandes), 'calamine' (requiere python-calamine) o 'auto'.
+        sheet_name: Hoja a leer de cada .xlsx (nombre o índice), lista de hojas o None para todas. Por defecto la
+                    primera. Con varias hojas se agrega la columna 'Hoja'.
+        excel_executor: Pool para los .xlsx cuando parallel=True: 'thread' (por defecto) o 'process'. openpyxl está
+                        limitado por CPU, por lo que 'process' acelera las carpetas con muchos Excel, pero en Windows
+                        y macOS los procesos se inician con spawn y vuelven a importar el script principal: el código
+                        que llame a join_files debe estar protegido con `if __name__ == "__main__":`.
     
     Devuelve:
         Un DataFrame que contiene los datos de todos los archivos en la carpeta que cumplen con los criterios.
+        Si return_report es True, devuelve la tupla (DataFrame, informe).
     """
     # Configurar el logger
     logging.basicConfig(level=logging.INFO)
@@ -60,116 +112,537 @@ def join_files(
         file_extensions = ['.csv', '.xlsx']
     if encodings is None:
         encodings = ['utf-8', 'latin-1']
+    validate_filters(filters)
+    resolve_excel_engine(excel_engine)
+    if excel_executor not in PARALLEL_EXECUTORS:
+        raise ValueError(f"El ejecutor debe ser uno de {PARALLEL_EXECUTORS}.")
+
+    report = []
+    # Informe de optimize_dtypes (memoria antes y después) si optimize_memory es True
+    memory_report = None
+
+    def _result(df: pd.DataFrame):
+        if return_report:
+            report_df = pd.DataFrame(report, columns=REPORT_COLUMNS)
+            if memory_report is not None:
+                report_df.attrs['memoria'] = memory_report
+            return df, report_df
+        return df
 
     try:
         folder = Path(folder_path)
         if not folder.is_dir():
             logger.error(f"La ruta {folder_path} no es una carpeta válida.")
-            return pd.DataFrame()
+            return _result(pd.DataFrame())
 
         # Obtener la lista de archivos que tengan una de las extensiones especificadas
         file_list = [f for f in folder.iterdir() if f.suffix.lower() in file_extensions]
         num_files = len(file_list)
         if num_files == 0:
             logger.warning("No se encontraron archivos en la carpeta.")
-            return pd.DataFrame()
+            return _result(pd.DataFrame())
 
-        dataframes = []
-        files_processed = 0
+        # Argumentos comunes para la lectura de cada archivo
+        read_kwargs = {
+            'column_types': column_types,
+            'encodings': encodings,
+            'chunksize': chunksize,
+            'separators': separators,
+            'usecols': usecols,
+            'filters': filters,
+            'excel_engine': excel_engine,
+            'sheet_name': sheet_name
+        }
 
-        for file_path in file_list:
-            file_name = file_path.name
+        # Caché incremental: se invalida si cambian las opciones que afectan al DataFrame leído
+        file_cache = None
+        if cache_dir is not None:
+            file_cache = FileCache(
+                cache_dir,
+                options={
+                    'column_types': column_types,
+                    'encodings': encodings,
+                    'separators': separators,
+                    'normalize_columns': normalize_columns,
+                    'usecols': usecols,
+                    'filters': filters,
+                    'excel_engine': excel_engine,
+                    'sheet_name': sheet_name
+                },
+                cache_format=cache_format
+            )
 
-            # Verificar si es un archivo regular y que no esté vacío
-            if not file_path.is_file():
-                logger.warning(f"Saltando {file_name}, no es un archivo regular.")
-                continue
-            if file_path.stat().st_size == 0:
-                logger.warning(f"El archivo {file_name} está vacío.")
-                continue
+        # Planificar los archivos a leer: se validan, se extraen la fecha y el sufijo del nombre y, si se
+        # normalizan las columnas, se compila un solo plan con la unión de los encabezados de la carpeta
+        tasks, plan = _plan_files(
+            file_list,
+            include_date=include_date,
+            default_timezone=default_timezone,
+            stop_on_error=stop_on_error,
+            suffix_index=suffix_index,
+            suffix_delimiter=suffix_delimiter,
+            suffix_filter=suffix_filter,
+            report=report,
+            logger=logger,
+            header_kwargs=_header_kwargs(read_kwargs) if normalize_columns else None,
+            file_cache=file_cache
+        )
 
-            # Extraer la fecha del nombre del archivo si se solicita
-            date_obj = None
-            if include_date:
-                try:
-                    date_obj = extract_date_from_filename(file_name, default_timezone)
-                except ParserError as e:
-                    logger.error(f"Error al analizar la fecha en el archivo '{file_name}': {e}")
-                    if stop_on_error:
-                        raise
-                    else:
-                        continue
-                except Exception as e:
-                    logger.error(f"Ocurrió un error al extraer la fecha del archivo '{file_name}': {e}")
+        # Consultar la caché incremental: los archivos sin cambios se cargan desde la caché
+        # El estado de cada archivo (tamaño, fecha y hash) se toma antes de leerlo y se registra tal cual
+        caches = [None] * len(tasks)
+        states = [None] * len(tasks)
+        if file_cache is not None:
+            for i, (file_path, _, _) in enumerate(tasks):
+                entry, states[i] = file_cache.lookup(file_path, return_state=True)
+                caches[i] = {
+                    'path': str(file_cache.cache_path(file_path)),
+                    'format': file_cache.cache_format,
+                    'hit': entry is not None,
+                    'dialect': entry['dialect'] if entry is not None else {}
+                }
+
+        # Leer los archivos (en paralelo si se solicita) conservando el orden de la lista
+        task_args = [
+            (file_path, read_kwargs, normalize_columns, plan, date_column, date_value, suffix_value, cache)
+            for (file_path, date_value, suffix_value), cache in zip(tasks, caches)
+        ]
+        if parallel and len(task_args) > 1:
+            results = _iter_parallel(task_args, max_workers, excel_executor)
+        else:
+            results = (_run_task(_load_file, args) for args in task_args)
+
+        dataframes = []
+        files_processed = 0
+
+        # closing() detiene las lecturas pendientes en cuanto se sale del bucle (error con stop_on_error)
+        with closing(results):
+            for (file_path, _, _), state, (loaded, elapsed, error) in zip(tasks, states, results):
+                file_name = file_path.name
+                if error is not None:
+                    logger.error(f"Error al leer el archivo {file_name}: {error}")
+                    report.append(_report_row(file_name, 'error', segundos=elapsed, mensaje=str(error)))
                     if stop_on_error:
-                        raise
+                        raise error
                     else:
                         continue
 
-            # Extraer el sufijo del nombre del archivo si se especifica suffix_index
-            add_suffix = False
-            if suffix_index is not None:
-                file_stem = file_path.stem  # Nombre sin extensión
-                tokens = file_stem.split(suffix_delimiter)
-                if len(tokens) > abs(suffix_index):
-                    suffix_value = tokens[suffix_index]
-                    # Si se especifica un filtro, solo procesamos si coincide
-                    if suffix_filter is not None and suffix_value != suffix_filter:
-                        logger.info(f"Saltando {file_name}: token '{suffix_value}' no coincide con el filtro '{suffix_filter}'.")
-                        continue
-                    add_suffix = True
-                else:
-                    logger.warning(f"No se pudo extraer el sufijo con índice {suffix_index} del archivo {file_name}.")
+                df, info = loaded
+                report.append(_report_row(file_name, 'ok', filas=len(df), segundos=elapsed, info=info))
 
-            # Intentar leer el archivo en un DataFrame
-            try:
-                df = read_file(
-                    file_path=file_path,
-                    column_types=column_types,
-                    encodings=encodings,
-                    chunksize=chunksize,
-                    separators=separators
-                )
-            except Exception as e:
-                logger.error(f"Error al leer el archivo {file_name}: {e}")
-                if stop_on_error:
-                    raise
-                else:
-                    continue
-
-            # Preprocesar los nombres de columnas si se solicita
-            if normalize_columns:
-                df = normalize_and_merge_columns(df)
-
-            # Agregar la fecha extraída, si corresponde, y convertirla a datetime sin zona horaria
-            if include_date and date_obj:
-                df[date_column] = date_obj.replace(tzinfo=None)
+                # Registrar en el manifiesto los archivos que se acaban de guardar en la caché
+                if file_cache is not None and info['cache'] == 'written':
+                    file_cache.record(
+                        file_path, {'encoding': info['encoding'], 'separator': info['separator']}, state=state
+                    )
+                dataframes.append(df)
+                files_processed += 1
 
-            # Agregar el sufijo extraído al DataFrame, si corresponde
-            if add_suffix:
-                df['Suffix'] = suffix_value
+        if file_cache is not None:
+            file_cache.save()
+            hits = sum(1 for row in report if row['cache'] == 'hit')
+            logger.info(f"Caché incremental: {hits} archivos cargados desde la caché, {len(tasks) - hits} leídos.")
 
-            dataframes.append(df)
-            files_processed += 1
+        if report:
+            total = sum(row['segundos'] for row in report if row['segundos'] is not None)
+            logger.info(f"Tiempo total de lectura: {total:.2f} s en {len(report)} archivos.")
 
         if dataframes:
             df_final = pd.concat(dataframes, ignore_index=True)
+            del dataframes
+
+            # Optimizar la memoria del resultado si se solicita
+            if optimize_memory:
+                constant_columns = [col for col in (date_column, 'Suffix') if col in df_final.columns]
+                df_final, memory_report = optimize_dtypes(
+                    df_final,
+                    categorical_columns=constant_columns,
+                    inplace=True,
+                    return_report=True
+                )
             folder_name = Path(folder_path).name
             logger.info(f"Se leyeron correctamente {files_processed} de {num_files} archivos de la carpeta '{folder_name}'.")
 
-            return df_final
+            return _result(df_final)
         else:
             logger.warning("No se pudieron crear DataFrames a partir de los archivos.")
-            return pd.DataFrame()
+            return _result(pd.DataFrame())
 
     except Exception as e:
         logger.error(f"Ocurrió un error inesperado: {e}")
         raise
 
+def iter_join_files(
+    folder_path: Union[str, Path],
+    column_types: Optional[Dict[str, type]] = None,
+    include_date: bool = False,
+    date_column: str = 'Fecha',
+    file_extensions: Optional[List[str]] = None,
+    default_timezone: str = 'UTC',
+    encodings: Optional[List[str]] = None,
+    stop_on_error: bool = False,
+    chunksize: int = 100_000,
+    suffix_index: Optional[int] = None,
+    suffix_delimiter: str = "_",
+    suffix_filter: Optional[str] = None,
+    normalize_columns: bool = False,
+    separators: Optional[Union[str, List[str]]] = None,
+    usecols: Optional[List[str]] = None,
+    filters: Optional[List[Tuple[str, str, object]]] = None,
+    excel_engine: str = 'openpyxl',
+    sheet_name: Union[str, int, List[Union[str, int]], None] = 0
+) -> Iterator[pd.DataFrame]:
+    """
+    Versión en streaming de join_files: recorre los archivos de la carpeta y produce bloques de como
+    máximo *chunksize* filas, con las columnas de fecha y sufijo ya agregadas. A diferencia de join_files,
+    nunca se mantiene en memoria más de un bloque a la vez, por lo que sirve para carpetas más grandes
+    que la memoria disponible.
+
+    Los parámetros tienen el mismo significado que en join_files. Si ocurre un error a mitad de un archivo
+    y stop_on_error es False, se registra el error y se pasa al siguiente archivo (los bloques ya producidos
+    de ese archivo no se pueden deshacer). Con filters, los bloques pueden tener menos de *chunksize* filas.
+    Para que los .xlsx grandes también se lean en streaming, use excel_engine='streaming' o 'calamine'.
+
+    Devuelve:
+        Un generador de DataFrames.
+
+    Ejemplo:
+        for bloque in iter_join_files("cosecha/", include_date=True, chunksize=50_000):
+            procesar(bloque)
+    """
+    # Configurar el logger
+    logging.basicConfig(level=logging.INFO)
+    logger = logging.getLogger(__name__)
+
+    if chunksize is None or chunksize < 1:
+        raise ValueError("chunksize debe ser un entero positivo.")
+    validate_filters(filters)
+    resolve_excel_engine(excel_engine)
+
+    # Establecer extensiones y codificaciones por defecto si no se han pasado
+    if file_extensions is None:
+        file_extensions = ['.csv', '.xlsx']
+    if encodings is None:
+        encodings = ['utf-8', 'latin-1']
+
+    folder = Path(folder_path)
+    if not folder.is_dir():
+        logger.error(f"La ruta {folder_path} no es una carpeta válida.")
+        return
+
+    # Obtener la lista de archivos que tengan una de las extensiones especificadas
+    file_list = [f for f in folder.iterdir() if f.suffix.lower() in file_extensions]
+    if not file_list:
+        logger.warning("No se encontraron archivos en la carpeta.")
+        return
+
+    read_kwargs = {
+        'column_types': column_types,
+        'encodings': encodings,
+        'chunksize': chunksize,
+        'separators': separators,
+        'usecols': usecols,
+        'filters': filters,
+        'excel_engine': excel_engine,
+        'sheet_name': sheet_name
+    }
+    tasks, plan = _plan_files(
+        file_list,
+        include_date=include_date,
+        default_timezone=default_timezone,
+        stop_on_error=stop_on_error,
+        suffix_index=suffix_index,
+        suffix_delimiter=suffix_delimiter,
+        suffix_filter=suffix_filter,
+        report=[],
+        logger=logger,
+        header_kwargs=_header_kwargs(read_kwargs) if normalize_columns else None
+    )
+
+    files_processed = 0
+    for file_path, date_value, suffix_value in tasks:
+        try:
+            for chunk in iter_file_chunks(file_path, **read_kwargs):
+                # Preprocesar los nombres de columnas si se solicita
+                if normalize_columns:
+                    chunk = normalize_and_merge_columns(chunk, plan)
+                yield _tag_frame(chunk, date_column, date_value, suffix_value)
+        except Exception as e:
+            logger.error(f"Error al leer el archivo {file_path.name}: {e}")
+            if stop_on_error:
+                raise
+            else:
+                continue
+        files_processed += 1
+
+    logger.info(f"Se leyeron correctamente {files_processed} de {len(file_list)} archivos de la carpeta '{folder.name}'.")
+
+# Columnas del informe por archivo que devuelve join_files(return_report=True)
+REPORT_COLUMNS = ['archivo', 'estado', 'filas', 'segundos', 'encoding', 'separador', 'cache', 'mensaje']
+
+def _report_row(
+    file_name: str,
+    estado: str,
+    filas: Optional[int] = None,
+    segundos: Optional[float] = None,
+    info: Optional[Dict[str, object]] = None,
+    mensaje: Optional[str] = None
+) -> Dict[str, object]:
+    """
+    Crea una fila del informe por archivo de join_files.
+    """
+    info = info or {}
+    return {
+        'archivo': file_name,
+        'estado': estado,
+        'filas': filas,
+        'segundos': segundos,
+        'encoding': info.get('encoding'),
+        'separador': info.get('separator'),
+        'cache': info.get('cache'),
+        'mensaje': mensaje
+    }
+
+def _plan_files(
+    file_list: List[Path],
+    include_date: bool,
+    default_timezone: str,
+    stop_on_error: bool,
+    suffix_index: Optional[int],
+    suffix_delimiter: str,
+    suffix_filter: Optional[str],
+    report: List[Dict[str, object]],
+    logger: logging.Logger,
+    header_kwargs: Optional[Dict[str, object]] = None,
+    file_cache: Optional[FileCache] = None
+) -> Tuple[List[Tuple[Path, Optional[datetime], Optional[str]]], Optional['ColumnPlan']]:
+    """
+    Valida los archivos a leer y extrae del nombre de cada uno la fecha y el sufijo.
+
+    Los archivos con errores al extraer la fecha se registran en report y se omiten,
+    o se relanza el error si stop_on_error es True.
+
+    Si se indica header_kwargs (argumentos de read_header), se lee el encabezado de cada archivo y se compila
+    un único ColumnPlan con la unión de los encabezados de la carpeta, que se aplica después a todos los archivos.
+    Los archivos que se cargarán desde la caché incremental (ya normalizados) no se abren.
+
+    Devuelve:
+        Tupla (lista de tuplas (ruta, fecha sin zona horaria o None, sufijo o None) en el orden de file_list,
+        plan de columnas o None).
+    """
+    tasks = []
+    headers = []
+    for file_path in file_list:
+        file_name = file_path.name
+
+        # Verificar si es un archivo regular y que no esté vacío
+        if not file_path.is_file():
+            logger.warning(f"Saltando {file_name}, no es un archivo regular.")
+            continue
+        if file_path.stat().st_size == 0:
+            logger.warning(f"El archivo {file_name} está vacío.")
+            continue
+
+        # Extraer la fecha del nombre del archivo si se solicita
+        date_value = None
+        if include_date:
+            try:
+                date_obj = extract_date_from_filename(file_name, default_timezone)
+            except ParserError as e:
+                logger.error(f"Error al analizar la fecha en el archivo '{file_name}': {e}")
+                report.append(_report_row(file_name, 'error', mensaje=str(e)))
+                if stop_on_error:
+                    raise
+                else:
+                    continue
+            except Exception as e:
+                logger.error(f"Ocurrió un error al extraer la fecha del archivo '{file_name}': {e}")
+                report.append(_report_row(file_name, 'error', mensaje=str(e)))
+                if stop_on_error:
+                    raise
+                else:
+                    continue
+            # Convertir la fecha a datetime sin zona horaria
+            if date_obj:
+                date_value = date_obj.replace(tzinfo=None)
+
+        # Extraer el sufijo del nombre del archivo si se especifica suffix_index
+        suffix_value = None
+        if suffix_index is not None:
+            file_stem = file_path.stem  # Nombre sin extensión
+            tokens = file_stem.split(suffix_delimiter)
+            if len(tokens) > abs(suffix_index):
+                suffix_value = tokens[suffix_index]
+                # Si se especifica un filtro, solo procesamos si coincide
+                if suffix_filter is not None and suffix_value != suffix_filter:
+                    logger.info(f"Saltando {file_name}: token '{suffix_value}' no coincide con el filtro '{suffix_filter}'.")
+                    continue
+            else:
+                logger.warning(f"No se pudo extraer el sufijo con índice {suffix_index} del archivo {file_name}.")
+
+        tasks.append((file_path, date_value, suffix_value))
+
+        # Encabezado para el plan de columnas de la carpeta
+        if header_kwargs is not None and (file_cache is None or file_cache.lookup(file_path) is None):
+            try:
+                headers.append(read_header(file_path, **header_kwargs))
+            except Exception as e:
+                # El error se informará al leer el archivo
+                logger.debug(f"No se pudo leer el encabezado de {file_name}: {e}")
+
+    plan = ColumnPlan.from_headers(headers) if headers else None
+    return tasks, plan
+
+def _header_kwargs(read_kwargs: Dict[str, object]) -> Dict[str, object]:
+    """
+    Argumentos de read_header a partir de los argumentos de read_file.
+    """
+    return {key: value for key, value in read_kwargs.items() if key not in ('column_types', 'chunksize')}
+
+def _load_file(
+    file_path: Path,
+    read_kwargs: Dict[str, object],
+    normalize_columns: bool,
+    plan: Optional['ColumnPlan'],
+    date_column: str,
+    date_value: Optional[datetime],
+    suffix_value: Optional[str],
+    cache: Optional[Dict[str, object]] = None
+) -> Tuple[pd.DataFrame, Dict[str, object]]:
+    """
+    Lee un archivo y le agrega las columnas de fecha y sufijo. Se define a nivel de módulo
+    para que pueda enviarse a un pool de procesos.
+
+    Parámetros:
+        file_path: Ruta al archivo.
+        read_kwargs: Argumentos para read_file.
+        normalize_columns: Si es True, normaliza y fusiona los nombres de columnas.
+        plan: Plan de columnas de la carpeta (ver _plan_files) o None para usar el del encabezado del archivo.
+        date_column: Nombre de la columna para la fecha.
+        date_value: Fecha extraída del nombre del archivo (sin zona horaria) o None.
+        suffix_value: Sufijo extraído del nombre del archivo o None.
+        cache: Si se usa la caché incremental, diccionario con 'path', 'format', 'hit' y 'dialect'.
+               Si 'hit' es True se lee el DataFrame de la caché; si no, se lee el archivo y se guarda en la caché.
+
+    Devuelve:
+        Una tupla (DataFrame con los datos del archivo, información de lectura con 'encoding',
+        'separator' y 'cache' ('hit', 'written' o None)).
+    """
+    if cache is not None and cache['hit']:
+        df = read_cache(cache['path'], cache['format'])
+        info = dict(cache['dialect'], cache='hit')
+    else:
+        df, dialect = read_file(file_path=file_path, return_dialect=True, **read_kwargs)
+
+        # Preprocesar los nombres de columnas si se solicita
+        if normalize_columns:
+            df = normalize_and_merge_columns(df, plan)
+
+        # Guardar el DataFrame normalizado (antes de agregar fecha y sufijo) en la caché
+        written = cache is not None and write_cache(df, cache['path'], cache['format'])
+        info = dict(dialect, cache='written' if written else None)
+
+    return _tag_frame(df, date_column, date_value, suffix_value), info
+
+def _tag_frame(
+    df: pd.DataFrame,
+    date_column: str,
+    date_value: Optional[datetime],
+    suffix_value: Optional[str]
+) -> pd.DataFrame:
+    """
+    Agrega al DataFrame las columnas de fecha y sufijo extraídas del nombre del archivo, si corresponden.
+    """
+    # Agregar la fecha extraída, si corresponde
+    if date_value is not None:
+        df[date_column] = date_value
+
+    # Agregar el sufijo extraído al DataFrame, si corresponde
+    if suffix_value is not None:
+        df['Suffix'] = suffix_value
+
+    return df
+
+def _run_task(func, args: tuple) -> Tuple[object, float, Optional[Exception]]:
+    """
+    Ejecuta func(*args) midiendo el tiempo. Devuelve (resultado, segundos, error) en lugar de
+    propagar la excepción, para que el llamador decida según stop_on_error.
+    """
+    start = time.perf_counter()
+    try:
+        result = func(*args)
+    except Exception as e:
+        return None, time.perf_counter() - start, e
+    return result, time.perf_counter() - start, None
+
+def _iter_parallel(task_args: List[tuple], max_workers: Optional[int], excel_executor: str = 'thread'):
+    """
+    Lee los archivos en paralelo: los CSV en un pool de hilos y los Excel en el pool de excel_executor.
+    Produce los resultados (resultado, segundos, error) en el mismo orden que task_args.
+    """
+    def _needs_process(args: tuple) -> bool:
+        # Los Excel que se cargan desde la caché no necesitan un proceso aparte
+        cache = args[-1]
+        return (excel_executor == 'process' and args[0].suffix.lower() == '.xlsx'
+                and not (cache is not None and cache['hit']))
+
+    uses_processes = any(_needs_process(args) for args in task_args)
+    thread_pool = ThreadPoolExecutor(max_workers=max_workers)
+    process_pool = ProcessPoolExecutor(max_workers=max_workers) if uses_processes else None
+    futures = []
+    try:
+        for args in task_args:
+            pool = process_pool if _needs_process(args) else thread_pool
+            futures.append(pool.submit(_run_task, _load_file, args))
+        for future in futures:
+            # Los errores del propio pool (BrokenProcessPool, argumentos o resultados que no se pueden
+            # serializar) también se devuelven como error del archivo, para que decida stop_on_error
+            try:
+                outcome = future.result()
+            except Exception as e:
+                outcome = (None, 0.0, e)
+            yield outcome
+    finally:
+        # Si el llamador se detiene (stop_on_error o deja de iterar), se cancelan las lecturas pendientes
+        # y no se espera a las que ya están en curso. Se cancela futuro a futuro en lugar de usar
+        # shutdown(cancel_futures=True), que no existe en Python 3.8
+        for future in futures:
+            future.cancel()
+        thread_pool.shutdown(wait=False)
+        if process_pool is not None:
+            process_pool.shutdown(wait=False)
+
+# Expresiones regulares para diferentes formatos de fecha, en orden de prioridad
+DATE_PATTERNS = [
+    re.compile(r'\d{4}[-/]\d{2}[-/]\d{2}(?:[-_\s]\d{2}[:]\d{2}[:]\d{2})?'),  # YYYY-MM-DD[-HH:MM:SS]
+    re.compile(r'\d{8}'),  # YYYYMMDD
+    re.compile(r'\d{4}[-/]\d{3}')  # YYYY-DDD (día juliano)
+]
+_SEPARATORS_PATTERN = re.compile(r'[_\s:]')
+
+# Formatos conocidos que se convierten directamente sin pasar por dateutil: YYYYMMDD, YYYY-MM-DD y YYYY/MM/DD
+_FAST_DATE_PATTERN = re.compile(r'(\d{4})[-/]?(\d{2})[-/]?(\d{2})')
+
+def _fast_parse_date(date_str: str) -> Optional[datetime]:
+    """
+    Convierte las fechas de formato conocido sin usar dateutil. Devuelve None si el texto no tiene
+    exactamente uno de esos formatos o la fecha no es válida, para que se use el camino general.
+    """
+    match = _FAST_DATE_PATTERN.fullmatch(date_str)
+    if match is None:
+        return None
+    try:
+        return datetime(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+    except ValueError:
+        return None
+
 def extract_date_from_filename(file_name: str, default_timezone: str) -> datetime:
     """
     Extrae la fecha del nombre de un archivo.
 
+    Los resultados se guardan en una caché LRU por (nombre de archivo, zona horaria), de modo que
+    los nombres repetidos entre ejecuciones no se vuelven a analizar.
+
     Parámetros:
         file_name: Nombre del archivo.
         default_timezone: Zona horaria por defecto.
@@ -177,22 +650,19 @@ def extract_date_from_filename(file_name: str, default_timezone: str) -> datetim
     Devuelve:
         Un objeto datetime con la fecha extraída.
     """
-    # Expresiones regulares para diferentes formatos de fecha
-    date_patterns = [
-        r'\d{4}[-/]\d{2}[-/]\d{2}(?:[-_\s]\d{2}[:]\d{2}[:]\d{2})?',  # YYYY-MM-DD[-HH:MM:SS]
-        r'\d{8}',  # YYYYMMDD
-        r'\d{4}[-/]\d{3}'  # YYYY-DDD (día juliano)
-    ]
-    
-    for pattern in date_patterns:
-        matches = re.findall(pattern, file_name)
-        if matches:
-            date_str = matches[0]
+    return _extract_date_cached(file_name, default_timezone)
+
+@lru_cache(maxsize=65536)
+def _extract_date_cached(file_name: str, default_timezone: str) -> datetime:
+    for pattern in DATE_PATTERNS:
+        match = pattern.search(file_name)
+        if match:
             # Reemplazar separadores para estandarizar
-            date_str = re.sub(r'[_\s]', '-', date_str)
-            date_str = re.sub(r'[:]', '-', date_str)
+            date_str = _SEPARATORS_PATTERN.sub('-', match.group(0))
             try:
-                date_obj = parser.parse(date_str)
+                date_obj = _fast_parse_date(date_str)
+                if date_obj is None:
+                    date_obj = parser.parse(date_str)
                 if date_obj.tzinfo is None:
                     timezone = pytz.timezone(default_timezone)
                     date_obj = timezone.localize(date_obj)
@@ -202,122 +672,475 @@ def extract_date_from_filename(file_name: str, default_timezone: str) -> datetim
 
     raise ParserError(f"No se encontró una fecha válida en el nombre del archivo '{file_name}'.")
 
+def extract_dates_from_filenames(
+    file_names: List[Union[str, Path]],
+    default_timezone: str = 'UTC',
+    errors: str = 'coerce'
+) -> np.ndarray:
+    """
+    Extrae en una sola llamada las fechas de una lista de nombres (o rutas) de archivos.
+
+    Parámetros:
+        file_names: Lista de nombres o rutas de archivos.
+        default_timezone: Zona horaria por defecto.
+        errors: 'coerce' (por defecto) deja NaT en los nombres sin fecha válida; 'raise' relanza el error.
+
+    Devuelve:
+        Un arreglo numpy datetime64[ns] con las fechas sin zona horaria, como las guarda join_files.
+    """
+    if errors not in ['coerce', 'raise']:
+        raise ValueError("El argumento 'errors' debe ser 'coerce' o 'raise'.")
+
+    names = [Path(name).name for name in file_names]
+    # Cada nombre distinto se analiza una sola vez
+    dates = {}
+    for name in dict.fromkeys(names):
+        try:
+            dates[name] = np.datetime64(extract_date_from_filename(name, default_timezone).replace(tzinfo=None), 'ns')
+        except Exception:
+            if errors == 'raise':
+                raise
+            dates[name] = np.datetime64('NaT', 'ns')
+    return np.array([dates[name] for name in names], dtype='datetime64[ns]')
+
+# Tamaño máximo (en bytes) del prefijo del archivo que se usa para detectar codificación y separador
+SNIFF_BYTES = 64 * 1024
+
+def sniff_csv_dialect(
+    file_path: Path,
+    encodings: List[str],
+    separators: Optional[Union[str, List[str]]] = None,
+    column_types: Optional[Dict[str, type]] = None,
+    sniff_bytes: int = SNIFF_BYTES
+) -> Tuple[str, str]:
+    """
+    Detecta la codificación y el separador de un archivo CSV analizando solo un prefijo acotado del archivo.
+
+    Se aplica el mismo criterio que la lectura completa: para cada codificación se prueban los separadores
+    en orden y se elige el primero que produce más de una columna; si ninguno lo logra, se conserva la
+    combinación con más columnas.
+
+    Parámetros:
+        file_path: Ruta al archivo CSV.
+        encodings: Lista de codificaciones a intentar.
+        separators: Separador o lista de separadores a intentar. Por defecto es ",".
+        column_types: Diccionario de tipos de datos para las columnas.
+        sniff_bytes: Número máximo de bytes del inicio del archivo a analizar.
+
+    Devuelve:
+        Una tupla (codificación, separador).
+    """
+    file_name = file_path.name
+
+    # Preparar la lista de separadores a probar
+    if separators is None:
+        sep_list = [","]
+    elif isinstance(separators, str):
+        sep_list = [separators]
+    else:
+        sep_list = separators
+
+    with open(file_path, 'rb') as f:
+        sample = f.read(sniff_bytes + 1)
+
+    # Si el archivo es más grande que la muestra, cortar en el último salto de línea para no partir un registro
+    cut_mid_line = False
+    if len(sample) > sniff_bytes:
+        sample = sample[:sniff_bytes]
+        last_newline = sample.rfind(b'\n')
+        if last_newline > 0:
+            sample = sample[:last_newline + 1]
+        else:
+            # Sin salto de línea el corte puede caer en medio de un carácter multibyte
+            cut_mid_line = True
+
+    best = None
+    best_num_cols = 0
+
+    # Iterar sobre cada codificación y separador
+    for encoding in encodings:
+        try:
+            text = _decode_sample(sample, encoding, cut_mid_line)
+        except (UnicodeDecodeError, LookupError) as e:
+            logging.warning(f"Error al leer {file_name} con codificación {encoding}: {e}")
+            continue
+        for sep in sep_list:
+            try:
+                num_cols = pd.read_csv(io.StringIO(text), dtype=column_types, sep=sep).shape[1]
+            except ValueError as e:
+                logging.warning(f"Error al leer {file_name} con codificación {encoding} y separador '{sep}': {e}")
+                continue  # Probar con la siguiente combinación
+            # Actualizar la mejor combinación (mayor cantidad de columnas)
+            if num_cols > best_num_cols:
+                best = (encoding, sep)
+                best_num_cols = num_cols
+            # Si se obtienen más de una columna, se asume lectura correcta
+            if num_cols > 1:
+                return encoding, sep
+
+    if best is None:
+        raise ValueError(f"No se pudo leer el archivo {file_name} con las combinaciones de codificaciones y separadores proporcionadas.")
+    return best
+
+def _decode_sample(sample: bytes, encoding: str, cut_mid_line: bool) -> str:
+    """
+    Decodifica la muestra de sniff_csv_dialect. Si la muestra se cortó en medio de una línea y el error
+    está al final (un carácter multibyte incompleto), se retrocede al último carácter completo; cualquier
+    otro byte inválido sigue descartando la codificación.
+    """
+    try:
+        return sample.decode(encoding)
+    except UnicodeDecodeError as e:
+        if cut_mid_line and e.end == len(sample) and e.start > 0:
+            return sample[:e.start].decode(encoding)
+        raise
+
 def read_file(
     file_path: Path,
     column_types: Optional[Dict[str, type]],
     encodings: List[str],
     chunksize: Optional[int],
-    separators: Optional[Union[str, List[str]]] = None
-) -> pd.DataFrame:
+    separators: Optional[Union[str, List[str]]] = None,
+    return_dialect: bool = False,
+    sniff_bytes: int = SNIFF_BYTES,
+    usecols: Optional[List[str]] = None,
+    filters: Optional[List[Tuple[str, str, object]]] = None,
+    excel_engine: str = 'openpyxl',
+    sheet_name: Union[str, int, List[Union[str, int]], None] = 0
+) -> Union[pd.DataFrame, Tuple[pd.DataFrame, Dict[str, Optional[str]]]]:
     """
     Lee un archivo CSV o Excel en un DataFrame.
 
+    Para archivos CSV, la codificación y el separador se detectan sobre un prefijo del archivo
+    (ver sniff_csv_dialect) y luego el archivo se lee una sola vez.
+
     Parámetros:
         file_path: Ruta al archivo.
         column_types: Diccionario de tipos de datos para las columnas.
         encodings: Lista de codificaciones para intentar al leer el archivo.
         chunksize: Número de filas a leer por iteración (útil para archivos grandes).
         separators: Separador o lista de separadores para archivos CSV. Por defecto es ",".
+        return_dialect: Si es True, devuelve además un diccionario {'encoding': ..., 'separator': ...}
+                        con la combinación usada (None para archivos Excel).
+        sniff_bytes: Número máximo de bytes del inicio del archivo usados para la detección.
+        usecols: Lista de columnas a leer. Los nombres se comparan ignorando mayúsculas, espacios y acentos,
+                 y las columnas no pedidas no se llegan a parsear.
+        filters: Lista de filtros de filas (columna, operador, valor), ver apply_row_filters. Se aplican
+                 bloque a bloque durante la lectura, combinados con AND.
+        excel_engine: Motor para archivos .xlsx: 'openpyxl' (pd.read_excel, por defecto), 'streaming'
+                      (openpyxl en modo solo lectura, recorre las filas sin construir el libro completo),
+                      'calamine' (requiere python-calamine) o 'auto' (calamine si está instalado, si no streaming).
+        sheet_name: Hoja a leer (nombre o índice), lista de hojas o None para todas. Por defecto la primera.
+                    Si se leen varias hojas se agrega la columna 'Hoja' con el nombre de cada una.
     
     Devuelve:
-        Un DataFrame con los datos del archivo.
+        Un DataFrame con los datos del archivo, o la tupla (DataFrame, dialecto) si return_dialect es True.
     """
     file_name = file_path.name
+    usecols_fn, keep_keys = _column_projection(usecols, filters)
 
-    # Si el archivo es CSV, se intentará leer usando los separadores proporcionados
+    # Si el archivo es CSV, se detecta el dialecto sobre un prefijo y se lee el archivo completo una sola vez
     if file_path.suffix.lower() == '.csv':
-        # Preparar la lista de separadores a probar
-        if separators is None:
-            sep_list = [","]
-        elif isinstance(separators, str):
-            sep_list = [separators]
-        else:
-            sep_list = separators
-
-        best_df = None
-        best_num_cols = 0
-
-        # Iterar sobre cada codificación y separador
-        for encoding in encodings:
-            for sep in sep_list:
-                try:
-                    # Si se usa chunksize, primero leer unas pocas filas para evaluar la separación
-                    if chunksize:
-                        temp_df = pd.read_csv(
-                            file_path,
-                            dtype=column_types,
-                            encoding=encoding,
-                            sep=sep,
-                            nrows=10
-                        )
-                    else:
-                        temp_df = pd.read_csv(
-                            file_path,
-                            dtype=column_types,
-                            encoding=encoding,
-                            sep=sep
-                        )
-                    num_cols = temp_df.shape[1]
-                    # Actualizar el mejor DataFrame (mayor cantidad de columnas)
-                    if num_cols > best_num_cols:
-                        best_df = (encoding, sep, temp_df)
-                        best_num_cols = num_cols
-                    # Si se obtienen más de una columna, se asume lectura correcta
-                    if num_cols > 1:
-                        best_df = (encoding, sep, temp_df)
-                        best_num_cols = num_cols
-                        break  # Se encontró un separador adecuado para esta codificación
-                except (UnicodeDecodeError, ValueError) as e:
-                    logging.warning(f"Error al leer {file_name} con codificación {encoding} y separador '{sep}': {e}")
-                    continue  # Probar con la siguiente combinación
-            if best_df is not None and best_num_cols > 1:
-                break  # Se encontró una combinación adecuada
+        encoding, sep = sniff_csv_dialect(
+            file_path,
+            encodings=encodings,
+            separators=separators,
+            column_types=column_types,
+            sniff_bytes=sniff_bytes
+        )
 
-        # Si se leyó correctamente con alguna combinación, volver a leer el archivo completo (apoyando chunksize si corresponde)
-        if best_df is not None:
-            encoding, sep, _ = best_df
+        # Con filtros de filas se lee por bloques para no materializar las filas descartadas
+        if filters and not chunksize:
+            chunksize = FILTER_CHUNKSIZE
+
+        # El prefijo puede decodificarse bien aunque el resto del archivo no; en ese caso se prueban las demás codificaciones
+        candidates = [encoding] + [enc for enc in encodings if enc != encoding]
+        for i, encoding in enumerate(candidates):
             try:
                 if chunksize:
-                    df_iterator = pd.read_csv(
+                    with pd.read_csv(
                         file_path,
                         dtype=column_types,
                         encoding=encoding,
                         sep=sep,
+                        usecols=usecols_fn,
                         chunksize=chunksize
-                    )
-                    df = pd.concat(df_iterator, ignore_index=True)
+                    ) as reader:
+                        chunks = [_select_rows(clean_quotes(chunk), filters, keep_keys) for chunk in reader]
+                    df = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
                 else:
                     df = pd.read_csv(
                         file_path,
                         dtype=column_types,
                         encoding=encoding,
-                        sep=sep
+                        sep=sep,
+                        usecols=usecols_fn
                     )
-                # Limpieza de comillas dobles no deseadas en columnas de tipo texto
-                df = clean_quotes(df)
-                return df
+                    # Limpieza de comillas dobles no deseadas en columnas de tipo texto
+                    df = clean_quotes(df)
+            except UnicodeDecodeError as e:
+                if i + 1 < len(candidates):
+                    logging.warning(f"Error al leer {file_name} con codificación {encoding} y separador '{sep}': {e}")
+                    continue
+                raise ValueError(f"Error al leer el archivo {file_name} con codificación {encoding} y separador '{sep}': {e}")
             except Exception as e:
                 raise ValueError(f"Error al leer el archivo {file_name} con codificación {encoding} y separador '{sep}': {e}")
-        else:
-            raise ValueError(f"No se pudo leer el archivo {file_name} con las combinaciones de codificaciones y separadores proporcionadas.")
+
+            if return_dialect:
+                return df, {'encoding': encoding, 'separator': sep}
+            return df
 
     # Para archivos Excel, se procede de la forma habitual (sin considerar separadores)
     elif file_path.suffix.lower() == '.xlsx':
         try:
-            df = pd.read_excel(
-                file_path,
-                dtype=column_types
-            )
-            return df
+            engine = resolve_excel_engine(excel_engine)
+            if engine == 'openpyxl':
+                df = pd.read_excel(
+                    file_path,
+                    dtype=column_types,
+                    usecols=usecols_fn,
+                    sheet_name=sheet_name
+                )
+                # Con varias hojas pd.read_excel devuelve un diccionario {hoja: DataFrame}
+                if isinstance(df, dict):
+                    df = pd.concat(
+                        [frame.assign(**{SHEET_COLUMN: name}) for name, frame in df.items()],
+                        ignore_index=True
+                    )
+            else:
+                df = read_excel_fast(
+                    file_path,
+                    engine=engine,
+                    sheet_name=sheet_name,
+                    column_types=column_types,
+                    usecols=usecols_fn
+                )
+            df = _select_rows(df, filters, keep_keys)
         except Exception as e:
             raise ValueError(f"Error al leer el archivo {file_name}: {e}")
+        if return_dialect:
+            return df, {'encoding': None, 'separator': None}
+        return df
+    else:
+        raise ValueError(f"Tipo de archivo no soportado para {file_name}.")
+
+def read_header(
+    file_path: Path,
+    encodings: List[str],
+    separators: Optional[Union[str, List[str]]] = None,
+    sniff_bytes: int = SNIFF_BYTES,
+    usecols: Optional[List[str]] = None,
+    filters: Optional[List[Tuple[str, str, object]]] = None,
+    excel_engine: str = 'openpyxl',
+    sheet_name: Union[str, int, List[Union[str, int]], None] = 0
+) -> List[object]:
+    """
+    Lee solo el encabezado de un archivo CSV o Excel y devuelve los nombres de las columnas que tendría
+    el DataFrame leído con read_file (incluidas las columnas usadas solo por los filtros).
+    Los parámetros tienen el mismo significado que en read_file.
+    """
+    usecols_fn, _ = _column_projection(usecols, filters)
+    if file_path.suffix.lower() == '.csv':
+        encoding, sep = sniff_csv_dialect(file_path, encodings=encodings, separators=separators, sniff_bytes=sniff_bytes)
+        return list(pd.read_csv(file_path, encoding=encoding, sep=sep, usecols=usecols_fn, nrows=0).columns)
+    elif file_path.suffix.lower() == '.xlsx':
+        return read_excel_header(file_path, engine=excel_engine, sheet_name=sheet_name, usecols=usecols_fn)
+    else:
+        raise ValueError(f"Tipo de archivo no soportado para {file_path.name}.")
+
+def iter_file_chunks(
+    file_path: Path,
+    column_types: Optional[Dict[str, type]],
+    encodings: List[str],
+    chunksize: int,
+    separators: Optional[Union[str, List[str]]] = None,
+    sniff_bytes: int = SNIFF_BYTES,
+    usecols: Optional[List[str]] = None,
+    filters: Optional[List[Tuple[str, str, object]]] = None,
+    excel_engine: str = 'openpyxl',
+    sheet_name: Union[str, int, List[Union[str, int]], None] = 0
+) -> Iterator[pd.DataFrame]:
+    """
+    Lee un archivo CSV o Excel por bloques de como máximo *chunksize* filas.
+
+    Para archivos CSV se detecta el dialecto sobre un prefijo y luego se lee el archivo en streaming.
+    Los archivos Excel se leen en streaming con los motores 'streaming' y 'calamine'; con 'openpyxl'
+    se leen completos y se devuelven en bloques.
+
+    Parámetros:
+        file_path: Ruta al archivo.
+        column_types: Diccionario de tipos de datos para las columnas.
+        encodings: Lista de codificaciones para intentar al leer el archivo.
+        chunksize: Número de filas por bloque.
+        separators: Separador o lista de separadores para archivos CSV. Por defecto es ",".
+        sniff_bytes: Número máximo de bytes del inicio del archivo usados para la detección.
+        usecols: Lista de columnas a leer (ver read_file).
+        filters: Lista de filtros de filas (ver read_file). Los bloques pueden quedar con menos filas.
+        excel_engine: Motor para archivos .xlsx (ver read_file).
+        sheet_name: Hoja u hojas a leer de los archivos .xlsx (ver read_file).
+
+    Devuelve:
+        Un generador de DataFrames.
+    """
+    file_name = file_path.name
+    usecols_fn, keep_keys = _column_projection(usecols, filters)
+
+    if file_path.suffix.lower() == '.csv':
+        encoding, sep = sniff_csv_dialect(
+            file_path,
+            encodings=encodings,
+            separators=separators,
+            column_types=column_types,
+            sniff_bytes=sniff_bytes
+        )
+        try:
+            with pd.read_csv(
+                file_path,
+                dtype=column_types,
+                encoding=encoding,
+                sep=sep,
+                usecols=usecols_fn,
+                chunksize=chunksize
+            ) as reader:
+                for chunk in reader:
+                    # Limpieza de comillas dobles no deseadas en columnas de tipo texto
+                    yield _select_rows(clean_quotes(chunk), filters, keep_keys)
+        except Exception as e:
+            raise ValueError(f"Error al leer el archivo {file_name} con codificación {encoding} y separador '{sep}': {e}")
+
+    elif file_path.suffix.lower() == '.xlsx':
+        engine = resolve_excel_engine(excel_engine)
+        if engine == 'openpyxl':
+            df = read_file(file_path, column_types=column_types, encodings=encodings, chunksize=None,
+                           usecols=usecols, filters=filters, sheet_name=sheet_name)
+            for start in range(0, len(df), chunksize):
+                yield df.iloc[start:start + chunksize].copy()
+        else:
+            try:
+                for chunk in iter_excel_chunks(
+                    file_path,
+                    engine=engine,
+                    sheet_name=sheet_name,
+                    column_types=column_types,
+                    usecols=usecols_fn,
+                    chunksize=chunksize
+                ):
+                    yield _select_rows(chunk, filters, keep_keys)
+            except Exception as e:
+                raise ValueError(f"Error al leer el archivo {file_name}: {e}")
     else:
         raise ValueError(f"Tipo de archivo no soportado para {file_name}.")
 
+# Tamaño de bloque usado cuando hay filtros de filas y no se indicó chunksize
+FILTER_CHUNKSIZE = 100_000
+
+# Operadores soportados en los filtros de filas
+FILTER_OPERATORS = {
+    '==': lambda s, v: s == v,
+    '!=': lambda s, v: s != v,
+    '<': lambda s, v: s < v,
+    '<=': lambda s, v: s <= v,
+    '>': lambda s, v: s > v,
+    '>=': lambda s, v: s >= v,
+    'in': lambda s, v: s.isin(list(v)),
+    'not in': lambda s, v: ~s.isin(list(v)),
+    'startswith': lambda s, v: s.astype('string').str.startswith(v).fillna(False).astype(bool),
+}
+
+def column_key(name: object) -> str:
+    """
+    Clave de comparación de un nombre de columna: sin espacios al inicio y al final, sin acentos y en minúsculas.
+    Es el mismo criterio con el que normalize_and_merge_columns unifica columnas.
+    """
+    return remove_accents(str(name).strip()).lower()
+
+def validate_filters(filters: Optional[List[Tuple[str, str, object]]]) -> None:
+    """
+    Verifica que los filtros de filas tengan la forma (columna, operador, valor) con un operador soportado.
+    """
+    if not filters:
+        return
+    for item in filters:
+        if not isinstance(item, (list, tuple)) or len(item) != 3:
+            raise ValueError(f"Cada filtro debe ser una tupla (columna, operador, valor); se recibió {item!r}.")
+        if item[1] not in FILTER_OPERATORS:
+            raise ValueError(f"Operador de filtro '{item[1]}' no soportado. Opciones: {list(FILTER_OPERATORS)}.")
+
+def apply_row_filters(df: pd.DataFrame, filters: Optional[List[Tuple[str, str, object]]]) -> pd.DataFrame:
+    """
+    Filtra las filas de un DataFrame con una lista de filtros (columna, operador, valor) combinados con AND.
+
+    Los nombres de columna se comparan ignorando mayúsculas, espacios y acentos; si varias columnas coinciden
+    se toma, por fila, el primer valor no nulo (igual que normalize_and_merge_columns).
+    Operadores: '==', '!=', '<', '<=', '>', '>=', 'in', 'not in', 'startswith'.
+
+    Ejemplo:
+        apply_row_filters(df, [('Semana', 'in', {10, 11}), ('Codigo', 'startswith', 'CS')])
+    """
+    if not filters:
+        return df
+    validate_filters(filters)
+
+    keys = [column_key(col) for col in df.columns]
+    mask = np.ones(len(df), dtype=bool)
+    for column, operator, value in filters:
+        positions = [i for i, key in enumerate(keys) if key == column_key(column)]
+        if not positions:
+            raise ValueError(f"La columna de filtro '{column}' no existe.")
+        if len(positions) == 1:
+            series = df.iloc[:, positions[0]]
+        else:
+            series = df.iloc[:, positions].bfill(axis=1).iloc[:, 0]
+        mask &= np.asarray(FILTER_OPERATORS[operator](series, value), dtype=bool)
+    return df.loc[mask].copy()
+
+def _column_projection(
+    usecols: Optional[List[str]],
+    filters: Optional[List[Tuple[str, str, object]]]
+):
+    """
+    Prepara la proyección de columnas para pd.read_csv/pd.read_excel.
+
+    Devuelve:
+        Tupla (función para el argumento usecols o None, conjunto de claves de columnas a conservar o None).
+        Las columnas usadas solo por los filtros se leen, pero se descartan después de filtrar.
+    """
+    validate_filters(filters)
+    if usecols is None:
+        return None, None
+    keep_keys = {column_key(col) for col in usecols}
+    needed_keys = keep_keys | {column_key(item[0]) for item in (filters or [])}
+    return (lambda col: column_key(col) in needed_keys), keep_keys
+
+def _select_rows(
+    df: pd.DataFrame,
+    filters: Optional[List[Tuple[str, str, object]]],
+    keep_keys: Optional[set]
+) -> pd.DataFrame:
+    """
+    Aplica los filtros de filas a un bloque y descarta las columnas leídas solo para filtrar.
+    """
+    if filters:
+        df = apply_row_filters(df, filters)
+        if keep_keys is not None:
+            df = df[[col for col in df.columns if column_key(col) in keep_keys]]
+    return df
+
+def _clean_quote_value(x: object) -> object:
+    """
+    Limpia las comillas de un valor de texto. Devuelve el mismo objeto si no hay nada que cambiar.
+    """
+    if isinstance(x, str) and '"' in x:
+        cleaned = x.replace('";', ';').replace(';"', ';').strip('"')
+        if cleaned != x:
+            return cleaned
+    return x
+
 def clean_quotes(df: pd.DataFrame) -> pd.DataFrame:
     """
     Limpia las comillas dobles no deseadas en las columnas de tipo texto.
     Se eliminan patrones como '";' y ';"' y se quitan las comillas sobrantes al inicio y final.
+    Cada valor distinto de una columna se limpia una sola vez y el resultado se expande a las filas.
     
     Parámetros:
         df: DataFrame a limpiar.
@@ -326,7 +1149,30 @@ def clean_quotes(df: pd.DataFrame) -> pd.DataFrame:
         DataFrame con las cadenas de texto limpiadas.
     """
     for col in df.select_dtypes(include='object').columns:
-        df[col] = df[col].apply(lambda x: x.replace('";', ';').replace(';"', ';').strip('"') if isinstance(x, str) else x)
+        series = df[col]
+        # Sondeo rápido sobre los valores distintos: las columnas sin comillas no se modifican
+        try:
+            uniques = pd.unique(series)
+        except TypeError:
+            # Valores no hashables (listas, diccionarios): se limpia celda por celda
+            df[col] = series.map(_clean_quote_value)
+            continue
+        if not any(isinstance(x, str) and '"' in x for x in uniques):
+            continue
+
+        # Cada valor distinto se limpia una sola vez y el resultado se expande a las filas
+        codes, uniques = pd.factorize(series)
+        uniques = np.asarray(uniques, dtype=object)
+        cleaned = np.fromiter((_clean_quote_value(x) for x in uniques), dtype=object, count=len(uniques))
+        changed = np.fromiter((c is not u for c, u in zip(cleaned, uniques)), dtype=bool, count=len(uniques))
+        if not changed.any():
+            continue
+
+        rows = codes >= 0
+        rows[rows] = changed[codes[rows]]
+        values = series.to_numpy(dtype=object, copy=True)
+        values[rows] = cleaned[codes[rows]]
+        df[col] = values
     return df
 
 def remove_accents(input_str: str) -> str:
@@ -336,7 +1182,114 @@ def remove_accents(input_str: str) -> str:
     nfkd_form = unicodedata.normalize('NFKD', input_str)
     return "".join([c for c in nfkd_form if not unicodedata.combining(c)])
 
-def normalize_and_merge_columns(df: pd.DataFrame) -> pd.DataFrame:
+@lru_cache(maxsize=65536)
+def normalize_column_name(name: object) -> str:
+    """
+    Nombre normalizado de una columna: sin espacios al inicio y al final, sin acentos y con solo la
+    primera letra en mayúscula. Se memoriza porque los mismos encabezados se repiten en cada archivo.
+    """
+    return column_key(name).capitalize()
+
+class ColumnPlan:
+    """
+    Plan compilado para normalizar y unificar las columnas de un encabezado.
+
+    Se calcula una sola vez por encabezado: el nombre normalizado de cada columna, el orden de las columnas
+    de salida y las posiciones de las columnas que deben fusionarse. Aplicarlo a un DataFrame cuesta una
+    selección de columnas (iloc) más una fusión vectorizada por cada grupo de duplicados,
+    en lugar de copiar el DataFrame columna a columna.
+
+    El plan puede construirse con la unión de los encabezados de varios archivos (from_headers); al aplicarlo
+    a un DataFrame que solo tiene parte de esas columnas, se usan solo las presentes.
+
+    Parámetros:
+        columns: Nombres de columnas originales.
+
+    Ejemplo:
+        plan = ColumnPlan.from_headers([df1.columns, df2.columns])
+        df1_norm = plan.apply(df1)
+    """
+
+    def __init__(self, columns: Iterable[object]):
+        self.columns = tuple(columns)
+        self.name_map = {col: normalize_column_name(col) for col in self.columns}
+        # Orden de las columnas de salida: orden de primera aparición del nombre normalizado
+        self.order: Dict[str, int] = {}
+        for norm in self.name_map.values():
+            self.order.setdefault(norm, len(self.order))
+        self._layouts: Dict[Tuple[object, ...], Tuple[List[str], List[int], List[Tuple[int, List[int]]]]] = {}
+
+    @classmethod
+    def from_headers(cls, headers: Iterable[Iterable[object]]) -> 'ColumnPlan':
+        """
+        Construye un plan a partir de la unión (en orden de aparición) de varios encabezados.
+        """
+        union: Dict[object, None] = {}
+        for header in headers:
+            union.update(dict.fromkeys(header))
+        return cls(union)
+
+    @property
+    def output_columns(self) -> List[str]:
+        """
+        Nombres de las columnas de salida en orden.
+        """
+        return list(self.order)
+
+    def _layout(self, columns: Tuple[object, ...]):
+        """
+        Posiciones (dentro de un encabezado concreto) de la primera columna de cada grupo y de las columnas a fusionar.
+        """
+        layout = self._layouts.get(columns)
+        if layout is not None:
+            return layout
+
+        groups: Dict[str, List[int]] = {}
+        for i, col in enumerate(columns):
+            norm = self.name_map.get(col)
+            if norm is None:
+                norm = normalize_column_name(col)
+            groups.setdefault(norm, []).append(i)
+        names = sorted(groups, key=lambda norm: self.order.get(norm, len(self.order)))
+        first_positions = [groups[norm][0] for norm in names]
+        merges = [(k, groups[norm][1:]) for k, norm in enumerate(names) if len(groups[norm]) > 1]
+
+        layout = (names, first_positions, merges)
+        self._layouts[columns] = layout
+        return layout
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Devuelve un nuevo DataFrame con las columnas normalizadas y las columnas duplicadas fusionadas
+        (por fila, el primer valor no nulo en el orden original de las columnas).
+        """
+        names, first_positions, merges = self._layout(tuple(df.columns))
+        new_df = df.iloc[:, first_positions].set_axis(names, axis=1)
+        dtypes = df.dtypes
+        for k, positions in merges:
+            group = [first_positions[k]] + positions
+            group_dtypes = {dtypes.iloc[pos] for pos in group}
+            dtype = group_dtypes.pop() if len(group_dtypes) == 1 else None
+            if isinstance(dtype, np.dtype) and dtype != object:
+                # Columnas numpy del mismo tipo: fusión por posición, que conserva el tipo como bfill
+                merged = df.iloc[:, first_positions[k]]
+                for pos in positions:
+                    merged = merged.where(merged.notna(), df.iloc[:, pos].to_numpy())
+            else:
+                # Tipos distintos, object o de extensión: el tipo resultante depende de los valores,
+                # así que se usa el mismo bfill por fila que la versión original
+                merged = df.iloc[:, group].bfill(axis=1).iloc[:, 0]
+            new_df.isetitem(k, merged)
+        return new_df
+
+@lru_cache(maxsize=1024)
+def column_plan(columns: Tuple[object, ...]) -> ColumnPlan:
+    """
+    Devuelve el plan de columnas de un encabezado, reutilizándolo entre archivos con el mismo encabezado.
+    """
+    return ColumnPlan(columns)
+
+def normalize_and_merge_columns(df: pd.DataFrame, plan: Optional[ColumnPlan] = None) -> pd.DataFrame:
     """
     Normaliza los nombres de las columnas eliminando espacios al inicio y al final,
     removiendo acentos, convirtiendo a minúsculas (para comparar) y unificando columnas
@@ -344,23 +1297,11 @@ def normalize_and_merge_columns(df: pd.DataFrame) -> pd.DataFrame:
 
     Parámetros:
         df: DataFrame original.
+        plan: Plan de columnas precalculado (ColumnPlan). Si es None, se usa el plan en caché del encabezado de df.
 
     Devuelve:
         Un nuevo DataFrame con los nombres de columnas normalizados y columnas duplicadas fusionadas.
     """
-    # Crear un mapeo: nombre original -> nombre normalizado
-    normalized_map = {col: remove_accents(col.strip()).lower().capitalize() for col in df.columns}
-    
-    # Invertir el mapeo para agrupar columnas que se normalizan igual
-    groups = {}
-    for original, norm in normalized_map.items():
-        groups.setdefault(norm, []).append(original)
-    
-    new_df = pd.DataFrame(index=df.index)
-    for norm_name, cols in groups.items():
-        if len(cols) == 1:
-            new_df[norm_name] = df[cols[0]]
-        else:
-            # Fusionar columnas: para cada fila, tomar el primer valor no nulo de las columnas duplicadas
-            new_df[norm_name] = df[cols].bfill(axis=1).iloc[:, 0]
-    return new_df
+    if plan is None:
+        plan = column_plan(tuple(df.columns))
+    return plan.apply(df)
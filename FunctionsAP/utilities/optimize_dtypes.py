@@ -0,0 +1,97 @@
+import pandas as pd
+import numpy as np
+import logging
+from typing import Dict, List, Optional, Tuple, Union
+
+def optimize_dtypes(
+    df: pd.DataFrame,
+    category_ratio: float = 0.5,
+    categorical_columns: Optional[List[str]] = None,
+    downcast: bool = True,
+    inplace: bool = False,
+    return_report: bool = False
+) -> Union[pd.DataFrame, Tuple[pd.DataFrame, Dict[str, object]]]:
+    """
+    Reduce la memoria de un DataFrame ajustando los tipos de datos de sus columnas.
+
+    - Las columnas de texto (object) con pocos valores distintos se convierten a 'category'.
+    - Las columnas enteras se reducen al menor tipo entero que contiene sus valores.
+    - Las columnas float64 pasan a float32 solo si la conversión no pierde precisión, y a entero si
+      todos sus valores son enteros y no hay NaN.
+    - Las columnas de categorical_columns se convierten a 'category' siempre (por ejemplo, las columnas
+      constantes por archivo 'Fecha' y 'Suffix' que agrega join_files).
+
+    Parámetros:
+        df: DataFrame a optimizar.
+        category_ratio: Proporción máxima de valores distintos respecto al número de filas para convertir
+                        una columna de texto a 'category'. Por defecto 0.5.
+        categorical_columns: Columnas que se convierten a 'category' sin importar su cardinalidad.
+        downcast: Si es True, reduce los tipos numéricos.
+        inplace: Si es True, modifica df en lugar de trabajar sobre una copia.
+        return_report: Si es True, devuelve además un diccionario con 'bytes_antes', 'bytes_despues'
+                       y 'columnas' ({columna: (tipo_antes, tipo_despues)} de las columnas modificadas).
+
+    Devuelve:
+        El DataFrame optimizado, o la tupla (DataFrame, informe) si return_report es True.
+
+    Ejemplo:
+        df_opt, info = optimize_dtypes(df, categorical_columns=['Fecha', 'Suffix'], return_report=True)
+    """
+    # Configurar logger básico
+    logging.basicConfig(level=logging.INFO)
+    logger = logging.getLogger(__name__)
+
+    if not isinstance(df, pd.DataFrame):
+        raise TypeError("El argumento 'df' debe ser un pandas DataFrame.")
+
+    bytes_before = int(df.memory_usage(deep=True).sum())
+    if not inplace:
+        df = df.copy()
+
+    forced = set(categorical_columns or [])
+    changed = {}
+    num_rows = len(df)
+
+    # Se recorre por posición para admitir nombres de columnas duplicados
+    for i, col in enumerate(df.columns):
+        series = df.iloc[:, i]
+        old_dtype = series.dtype
+        new_series = None
+
+        if col in forced:
+            if not isinstance(old_dtype, pd.CategoricalDtype):
+                new_series = series.astype('category')
+
+        elif pd.api.types.is_object_dtype(old_dtype):
+            # Solo columnas de texto puro (con o sin valores nulos)
+            if pd.api.types.infer_dtype(series, skipna=True) == 'string':
+                if num_rows and series.nunique(dropna=True) <= category_ratio * num_rows:
+                    new_series = series.astype('category')
+
+        elif downcast and pd.api.types.is_integer_dtype(old_dtype) and not pd.api.types.is_extension_array_dtype(old_dtype):
+            new_series = pd.to_numeric(series, downcast='integer')
+
+        elif downcast and old_dtype == np.float64:
+            values = series.to_numpy()
+            if len(values) and np.isfinite(values).all() and (np.mod(values, 1) == 0).all() \
+                    and np.abs(values).max() < 2 ** 53:
+                # Todos los valores son enteros y no hay NaN
+                new_series = pd.to_numeric(series.astype(np.int64), downcast='integer')
+            else:
+                as_float32 = values.astype(np.float32)
+                if np.array_equal(as_float32.astype(np.float64), values, equal_nan=True):
+                    new_series = pd.Series(as_float32, index=series.index, name=col)
+
+        if new_series is not None and new_series.dtype != old_dtype:
+            df.isetitem(i, new_series)
+            changed[col] = (str(old_dtype), str(new_series.dtype))
+
+    bytes_after = int(df.memory_usage(deep=True).sum())
+    logger.info(
+        f"Memoria del DataFrame: {bytes_before / 1024 ** 2:.2f} MB -> {bytes_after / 1024 ** 2:.2f} MB "
+        f"({len(changed)} columnas optimizadas)."
+    )
+
+    if return_report:
+        return df, {'bytes_antes': bytes_before, 'bytes_despues': bytes_after, 'columnas': changed}
+    return df
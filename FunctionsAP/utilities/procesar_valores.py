@@ -1,7 +1,14 @@
 import pandas as pd
 import numpy as np
 import logging
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Iterator, List, Dict, Optional
+
+# Valores considerados "vacíos" por convertir_vacios
+VALORES_VACIOS = ["", " ", "nan", "None", None]
+
+# Tipos de pool disponibles para el modo paralelo
+PARALLEL_EXECUTORS = ['thread', 'process']
 
 def procesar_valores(
     df: pd.DataFrame,
@@ -12,7 +19,11 @@ def procesar_valores(
     fill_value = None,
     convertir_tipo: Optional[Dict[str, type]] = None,
     trim_strings: bool = False,
-    raise_error: bool = False
+    raise_error: bool = False,
+    inplace: bool = False,
+    parallel: bool = False,
+    max_workers: Optional[int] = None,
+    executor: str = 'thread'
 ) -> pd.DataFrame:
     """
     Procesa y limpia los valores de un DataFrame de forma modular.
@@ -35,6 +46,16 @@ def procesar_valores(
       - convertir_tipo (dict, opcional): Diccionario con {columna: tipo} para convertir el tipo de datos.
       - trim_strings (bool): Si True, elimina espacios en blanco iniciales y finales en columnas de texto.
       - raise_error (bool): Si True, se relanza la excepción en caso de error; de lo contrario, se registra y continúa.
+      - inplace (bool): Si True, modifica df directamente en lugar de trabajar sobre una copia.
+      - parallel (bool): Si True, procesa las columnas en paralelo repartiéndolas en lotes entre varios workers.
+      - max_workers (int, opcional): Número de workers en modo paralelo. Por defecto, el de concurrent.futures.
+      - executor (str): 'thread' (por defecto) o 'process'. Los hilos no copian datos pero las operaciones de
+        texto de pandas solo liberan el GIL en parte; los procesos evitan el GIL a cambio de serializar cada
+        lote de columnas, por lo que convienen en tablas anchas con transformaciones de texto costosas.
+    
+    Cada columna se procesa una sola vez con todos los pasos combinados y se salta cuando no contiene ningún
+    valor a modificar. En columnas object y numéricas los reemplazos y la conversión de vacíos se hacen en un
+    único replace; en las demás (category, string, fechas, ...) se aplican en dos pasos, como replace los admite.
     
     Retorna:
       - pd.DataFrame: DataFrame modificado con los valores procesados.
@@ -52,15 +73,21 @@ def procesar_valores(
     # Configurar logger básico
     logging.basicConfig(level=logging.INFO)
     logger = logging.getLogger(__name__)
+
+    if executor not in PARALLEL_EXECUTORS:
+        raise ValueError(f"El ejecutor debe ser uno de {PARALLEL_EXECUTORS}.")
     
-    try:
-        # Hacer una copia para no modificar el DataFrame original
-        df_proc = df.copy()
-    except Exception as e:
-        logger.error(f"Error al copiar el DataFrame: {e}")
-        if raise_error:
-            raise
-        return df
+    if inplace:
+        df_proc = df
+    else:
+        try:
+            # Hacer una copia para no modificar el DataFrame original
+            df_proc = df.copy()
+        except Exception as e:
+            logger.error(f"Error al copiar el DataFrame: {e}")
+            if raise_error:
+                raise
+            return df
 
     # Determinar las columnas a procesar
     if columnas is None:
@@ -68,23 +95,222 @@ def procesar_valores(
     else:
         # Filtrar las columnas que existan en el DataFrame
         columnas = [col for col in columnas if col in df_proc.columns]
-    
-    # 1. Reemplazar valores según replace_map
-    if replace_map is not None and isinstance(replace_map, dict):
-        for col in columnas:
+
+    # Reemplazos de los pasos 1 y 2 combinados en un solo diccionario
+    mapa = _combined_replace_map(
+        replace_map if isinstance(replace_map, dict) else None,
+        convertir_vacios
+    )
+
+    tipos = {}
+    if convertir_tipo is not None and isinstance(convertir_tipo, dict):
+        for col, new_type in convertir_tipo.items():
+            if col in df_proc.columns:
+                tipos[col] = new_type
+            else:
+                logger.warning(f"La columna {col} no se encontró para conversión de tipo.")
+
+    # Cada columna se transforma una sola vez con todos sus pasos, en el mismo orden que antes:
+    # reemplazos y vacíos -> relleno de NaN (todas las columnas) -> conversión de tipo -> trim
+    seleccionadas = set(columnas)
+    tareas = []
+    for col in dict.fromkeys(df_proc.columns):
+        en_columnas = col in seleccionadas
+        if not (en_columnas or fill_missing or col in tipos):
+            continue
+        tareas.append((col, df_proc[col], {
+            'mapa': mapa if en_columnas else None,
+            'replace_map': replace_map if en_columnas and isinstance(replace_map, dict) else None,
+            'convertir_vacios': convertir_vacios and en_columnas,
+            'fill_missing': fill_missing,
+            'fill_value': fill_value,
+            'new_type': tipos.get(col),
+            'trim_strings': trim_strings and en_columnas
+        }))
+
+    if parallel and len(tareas) > 1:
+        resultados = _procesar_en_paralelo(tareas, raise_error, max_workers, executor)
+    else:
+        resultados = (_procesar_lote([tarea], raise_error)[0] for tarea in tareas)
+
+    # Los resultados llegan en el orden de las columnas: los mensajes se registran en ese orden y,
+    # con raise_error, se relanza el error de la primera columna que falló
+    for col, new_series, mensajes, error in resultados:
+        for mensaje in mensajes:
+            logger.error(mensaje)
+        if error is not None:
+            raise error
+        if new_series is not None:
+            df_proc[col] = new_series
+
+    return df_proc
+
+class _LogBuffer:
+    """
+    Guarda los mensajes de error de un worker para registrarlos después, en orden, en el proceso principal.
+    """
+
+    def __init__(self):
+        self.messages: List[str] = []
+
+    def error(self, message: str) -> None:
+        self.messages.append(message)
+
+def _procesar_lote(tareas: list, raise_error: bool) -> list:
+    """
+    Procesa un lote de columnas. Devuelve, por columna, (columna, Serie nueva o None si no cambió,
+    mensajes de error, excepción a relanzar o None). Es una función de módulo para poder usarla en procesos.
+    """
+    resultados = []
+    for col, series, opciones in tareas:
+        buffer = _LogBuffer()
+        try:
+            new_series = _procesar_columna(series, col, logger=buffer, raise_error=raise_error, **opciones)
+        except Exception as e:
+            resultados.append((col, None, buffer.messages, e))
+            # Con raise_error el resto del lote no se procesa, como en la ejecución secuencial
+            break
+        resultados.append((col, None if new_series is series else new_series, buffer.messages, None))
+    return resultados
+
+def _procesar_en_paralelo(tareas: list, raise_error: bool, max_workers: Optional[int], executor: str) -> Iterator[tuple]:
+    """
+    Reparte las columnas en lotes contiguos entre un pool de hilos o de procesos y devuelve los
+    resultados en el orden original de las columnas.
+    """
+    pool_class = ThreadPoolExecutor if executor == 'thread' else ProcessPoolExecutor
+    with pool_class(max_workers=max_workers) as pool:
+        workers = getattr(pool, '_max_workers', None) or 1
+        # Varios lotes por worker para repartir mejor columnas de costo desigual
+        tamano = max(1, -(-len(tareas) // (workers * 4)))
+        futures = [
+            pool.submit(_procesar_lote, tareas[i:i + tamano], raise_error)
+            for i in range(0, len(tareas), tamano)
+        ]
+        try:
+            for future in futures:
+                for resultado in future.result():
+                    yield resultado
+        finally:
+            for future in futures:
+                future.cancel()
+
+def _es_nulo(value) -> bool:
+    try:
+        return value is None or bool(pd.isna(value))
+    except (TypeError, ValueError):
+        return False
+
+def _es_vacio(value) -> bool:
+    if isinstance(value, str):
+        return value in VALORES_VACIOS
+    return _es_nulo(value)
+
+def _combined_replace_map(replace_map: Optional[dict], convertir_vacios: bool) -> Optional[dict]:
+    """
+    Combina replace_map y la conversión de vacíos en un único diccionario equivalente a aplicar
+    primero replace_map y después la conversión de vacíos a np.nan.
+    """
+    if not convertir_vacios:
+        return replace_map or None
+    mapa = dict(replace_map or {})
+    if convertir_vacios:
+        mapa = {key: (np.nan if _es_vacio(value) else value) for key, value in mapa.items()}
+        # Una clave nula de replace_map ya reemplazó los nulos, que no deben volver a convertirse en NaN
+        hay_clave_nula = any(_es_nulo(key) for key in mapa)
+        for vacio in VALORES_VACIOS:
+            if not (vacio is None and hay_clave_nula):
+                mapa.setdefault(vacio, np.nan)
+    return mapa
+
+def _strip_strings(series: pd.Series) -> pd.Series:
+    """
+    Equivale a series.str.strip(), pero recorta una sola vez cada valor distinto y devuelve la misma
+    Serie si ningún valor cambia.
+    """
+    if not pd.api.types.is_object_dtype(series.dtype):
+        return series.str.strip()
+    codes, uniques = pd.factorize(series)
+    uniques = np.asarray(uniques, dtype=object)
+    stripped = np.array([u.strip() for u in uniques], dtype=object)
+    changed = stripped != uniques
+    if not changed.any():
+        return series
+    rows = codes >= 0
+    rows[rows] = changed[codes[rows]]
+    values = series.to_numpy(dtype=object, copy=True)
+    values[rows] = stripped[codes[rows]]
+    return pd.Series(values, index=series.index, name=series.name)
+
+def _admite_mapa_combinado(series: pd.Series) -> bool:
+    """
+    Indica si la columna admite el replace combinado: object o numérica de NumPy. En category o string,
+    replace falla si el diccionario mezcla reemplazos por NaN con otros valores o tipos.
+    """
+    dtype = series.dtype
+    return pd.api.types.is_object_dtype(dtype) or (
+        isinstance(dtype, np.dtype) and pd.api.types.is_numeric_dtype(dtype)
+    )
+
+def _hay_coincidencias(series: pd.Series, mapa: dict) -> bool:
+    """
+    Comprobación rápida con isin de si algún valor de la columna es clave de mapa. Las claves nulas
+    (None, NaN) coinciden con cualquier valor nulo.
+    """
+    claves = [key for key in mapa if not _es_nulo(key)]
+    try:
+        if pd.api.types.is_object_dtype(series.dtype):
+            # Basta con comprobar los valores distintos
+            hay_coincidencias = bool(pd.Series(pd.unique(series.to_numpy())).isin(claves).any())
+        else:
+            # Una columna numérica solo puede coincidir con claves numéricas
+            claves_numericas = [key for key in claves if isinstance(key, (int, float, np.number))]
+            hay_coincidencias = bool(claves_numericas) and bool(series.isin(claves_numericas).any())
+    except Exception:
+        hay_coincidencias = True
+    if not hay_coincidencias and len(claves) < len(mapa):
+        hay_coincidencias = series.hasnans
+    return hay_coincidencias
+
+def _procesar_columna(
+    series: pd.Series,
+    col,
+    mapa: Optional[dict],
+    replace_map: Optional[dict],
+    convertir_vacios: bool,
+    fill_missing: bool,
+    fill_value,
+    new_type,
+    trim_strings: bool,
+    logger: logging.Logger,
+    raise_error: bool
+) -> pd.Series:
+    """
+    Aplica a una columna los pasos de procesar_valores. Cada paso se salta si una comprobación rápida
+    indica que no hay nada que cambiar; devuelve la misma Serie si no se modificó.
+    """
+    # 1 y 2. Reemplazos y conversión de vacíos: en una sola pasada si el tipo lo admite
+    pasos_separados = bool(mapa)
+    if mapa and _admite_mapa_combinado(series):
+        try:
+            if _hay_coincidencias(series, mapa):
+                series = series.replace(mapa)
+            pasos_separados = False
+        except Exception:
+            # Se repite con los dos replace por separado, que registran su propio error si vuelve a fallar
+            pass
+
+    if pasos_separados:
+        if replace_map:
             try:
-                df_proc[col] = df_proc[col].replace(replace_map)
+                series = series.replace(replace_map)
             except Exception as e:
                 logger.error(f"Error reemplazando valores en la columna {col}: {e}")
                 if raise_error:
                     raise
-
-    # 2. Convertir valores "vacíos" a np.nan
-    if convertir_vacios:
-        valores_vacios = ["", " ", "nan", "None", None]
-        for col in columnas:
+        if convertir_vacios:
             try:
-                df_proc[col] = df_proc[col].replace(valores_vacios, np.nan)
+                series = series.replace(VALORES_VACIOS, np.nan)
             except Exception as e:
                 logger.error(f"Error al convertir valores vacíos en la columna {col}: {e}")
                 if raise_error:
@@ -93,35 +319,29 @@ def procesar_valores(
     # 3. Rellenar valores faltantes (NaN) si se solicita
     if fill_missing:
         try:
-            df_proc = df_proc.fillna(fill_value)
+            if series.hasnans:
+                series = series.fillna(fill_value)
         except Exception as e:
-            logger.error(f"Error al rellenar valores faltantes: {e}")
+            logger.error(f"Error al rellenar valores faltantes en la columna {col}: {e}")
             if raise_error:
                 raise
 
-    # 4. Convertir el tipo de datos de columnas específicas, si se proporciona convertir_tipo
-    if convertir_tipo is not None and isinstance(convertir_tipo, dict):
-        for col, new_type in convertir_tipo.items():
-            if col in df_proc.columns:
-                try:
-                    df_proc[col] = df_proc[col].astype(new_type)
-                except Exception as e:
-                    logger.error(f"Error al convertir la columna {col} a {new_type}: {e}")
-                    if raise_error:
-                        raise
-            else:
-                logger.warning(f"La columna {col} no se encontró para conversión de tipo.")
+    # 4. Convertir el tipo de datos
+    if new_type is not None:
+        try:
+            series = series.astype(new_type)
+        except Exception as e:
+            logger.error(f"Error al convertir la columna {col} a {new_type}: {e}")
+            if raise_error:
+                raise
+
+    # 5. Eliminar espacios en blanco en columnas de texto
+    if trim_strings and pd.api.types.is_string_dtype(series):
+        try:
+            series = _strip_strings(series)
+        except Exception as e:
+            logger.error(f"Error al aplicar trim en la columna {col}: {e}")
+            if raise_error:
+                raise
 
-    # 5. Eliminar espacios en blanco en columnas de texto si se solicita
-    if trim_strings:
-        for col in columnas:
-            # Solo aplicar a columnas de tipo objeto (cadena)
-            if pd.api.types.is_string_dtype(df_proc[col]):
-                try:
-                    df_proc[col] = df_proc[col].str.strip()
-                except Exception as e:
-                    logger.error(f"Error al aplicar trim en la columna {col}: {e}")
-                    if raise_error:
-                        raise
-
-    return df_proc
\ No newline at end of file
+    return series
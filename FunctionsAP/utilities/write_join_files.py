@@ -0,0 +1,228 @@
+import logging
+from pathlib import Path
+from typing import List, Optional, Union
+
+import pandas as pd
+
+from .join_files import iter_join_files
+
+# Formatos de salida soportados
+OUTPUT_FORMATS = ['parquet', 'feather', 'csv']
+
+# Extensión de archivo de cada formato de salida
+OUTPUT_EXTENSIONS = {'parquet': '.parquet', 'feather': '.feather', 'csv': '.csv'}
+
+def write_join_files(
+    folder_path: Union[str, Path],
+    output_path: Union[str, Path],
+    output_format: Optional[str] = None,
+    partition_cols: Optional[List[str]] = None,
+    csv_separator: str = ",",
+    **kwargs
+) -> int:
+    """
+    Consolida los archivos de una carpeta directamente en un archivo Parquet, Feather o CSV, bloque a bloque,
+    sin construir el DataFrame completo en memoria. La memoria usada queda acotada por *chunksize*.
+
+    El esquema de salida (columnas y, en Parquet/Feather, tipos) lo define el primer bloque. Las columnas que
+    falten en bloques posteriores se completan con NaN y las columnas nuevas se descartan con una advertencia.
+    Para carpetas con tipos heterogéneos conviene fijar column_types (por ejemplo, {'Codigo': str}).
+
+    Parámetros:
+        folder_path: Ruta a la carpeta que contiene los archivos.
+        output_path: Ruta del archivo de salida, o de la carpeta de salida si se usa partition_cols.
+        output_format: 'parquet', 'feather' o 'csv'. Si es None, se deduce de la extensión de output_path
+                       (o se usa 'parquet' si se particiona).
+        partition_cols: Columnas por las que particionar la salida (por ejemplo ['Fecha'] o ['Suffix']). Se escribe
+                        un dataset con carpetas 'columna=valor', como espera pyarrow.dataset o pd.read_parquet.
+        csv_separator: Separador a usar cuando la salida es CSV. Por defecto ",".
+        **kwargs: Argumentos de iter_join_files (column_types, include_date, chunksize, separators, ...).
+
+    Devuelve:
+        Número de filas escritas.
+
+    Ejemplo:
+        filas = write_join_files("cosecha/", "cosecha.feather", include_date=True, chunksize=200_000)
+        # Lectura posterior con memoria mapeada (sin volver a parsear):
+        # tabla = pyarrow.feather.read_table("cosecha.feather", memory_map=True)
+    """
+    # Configurar el logger
+    logging.basicConfig(level=logging.INFO)
+    logger = logging.getLogger(__name__)
+
+    writer = _ChunkWriter(output_path, output_format, partition_cols=partition_cols, csv_separator=csv_separator)
+    try:
+        for chunk in iter_join_files(folder_path, **kwargs):
+            writer.write(chunk)
+    finally:
+        writer.close()
+
+    logger.info(f"Se escribieron {writer.rows} filas en '{Path(output_path).name}'.")
+    return writer.rows
+
+def write_dataframe(
+    df: pd.DataFrame,
+    output_path: Union[str, Path],
+    output_format: Optional[str] = None,
+    partition_cols: Optional[List[str]] = None,
+    csv_separator: str = ",",
+    chunksize: Optional[int] = None
+) -> int:
+    """
+    Guarda un DataFrame ya consolidado (por ejemplo, el resultado de join_files) en Parquet, Feather o CSV,
+    opcionalmente particionado. Ver write_join_files para la descripción de los parámetros.
+
+    Parámetros:
+        chunksize: Si se especifica, el DataFrame se escribe en bloques de este número de filas.
+
+    Devuelve:
+        Número de filas escritas.
+    """
+    if not isinstance(df, pd.DataFrame):
+        raise TypeError("El argumento 'df' debe ser un pandas DataFrame.")
+
+    writer = _ChunkWriter(output_path, output_format, partition_cols=partition_cols, csv_separator=csv_separator)
+    try:
+        step = chunksize or max(len(df), 1)
+        for start in range(0, max(len(df), 1), step):
+            writer.write(df.iloc[start:start + step])
+    finally:
+        writer.close()
+    return writer.rows
+
+def _partition_value(value: object) -> str:
+    """
+    Convierte el valor de una columna de partición en un nombre de carpeta válido en cualquier sistema.
+    """
+    if pd.isna(value):
+        return '__HIVE_DEFAULT_PARTITION__'
+    if isinstance(value, pd.Timestamp):
+        if value == value.normalize():
+            return value.strftime('%Y-%m-%d')
+        return value.strftime('%Y-%m-%dT%H%M%S')
+    return str(value).replace('/', '_').replace('\\', '_')
+
+class _ChunkWriter:
+    """
+    Escribe bloques de DataFrames en un archivo (o dataset particionado) Parquet, Feather o CSV.
+    """
+
+    def __init__(
+        self,
+        output_path: Union[str, Path],
+        output_format: Optional[str] = None,
+        partition_cols: Optional[List[str]] = None,
+        csv_separator: str = ","
+    ):
+        self.output_path = Path(output_path)
+        self.partition_cols = list(partition_cols or [])
+        if output_format is None:
+            suffix = self.output_path.suffix.lower().lstrip('.')
+            output_format = suffix if suffix or not self.partition_cols else 'parquet'
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"El formato de salida debe ser uno de {OUTPUT_FORMATS}.")
+        self.output_format = output_format
+        self.csv_separator = csv_separator
+
+        if output_format in ['parquet', 'feather']:
+            try:
+                import pyarrow  # noqa: F401
+            except ImportError as e:
+                raise ImportError(f"La salida en {output_format} requiere 'pyarrow' (pip install pyarrow).") from e
+
+        if self.partition_cols:
+            self.output_path.mkdir(parents=True, exist_ok=True)
+
+        self.logger = logging.getLogger(__name__)
+        self.columns: Optional[List[str]] = None
+        self.schema = None
+        self.dropped = set()
+        self.writer = None
+        self.sink = None
+        self.header_written = False
+        self.part_counter = 0
+        self.rows = 0
+
+    def _align(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        # Alinear el bloque con las columnas del primer bloque
+        if self.columns is None:
+            self.columns = list(chunk.columns)
+            missing = [col for col in self.partition_cols if col not in self.columns]
+            if missing:
+                raise ValueError(f"Las columnas de partición no existen en los datos: {missing}")
+            return chunk
+        new_columns = set(chunk.columns) - set(self.columns) - self.dropped
+        if new_columns:
+            self.logger.warning(f"Se descartan columnas que no están en el primer bloque: {sorted(new_columns)}")
+            self.dropped |= new_columns
+        return chunk.reindex(columns=self.columns)
+
+    def _to_table(self, frame: pd.DataFrame):
+        import pyarrow as pa
+
+        if self.schema is None:
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            self.schema = table.schema
+            return table
+        try:
+            return pa.Table.from_pandas(frame, schema=self.schema, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+            raise ValueError(f"Un bloque no coincide con el esquema del primer bloque; fije column_types: {e}")
+
+    def _write_part(self, frame: pd.DataFrame, directory: Path) -> None:
+        # Cada bloque de cada partición se guarda como un archivo nuevo dentro de su carpeta
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"part-{self.part_counter:05d}{OUTPUT_EXTENSIONS[self.output_format]}"
+        self.part_counter += 1
+        if self.output_format == 'csv':
+            frame.to_csv(path, sep=self.csv_separator, index=False)
+        elif self.output_format == 'parquet':
+            import pyarrow.parquet as pq
+            pq.write_table(self._to_table(frame), path)
+        else:
+            import pyarrow.feather as feather
+            feather.write_feather(self._to_table(frame), path, compression='uncompressed')
+
+    def write(self, chunk: pd.DataFrame) -> None:
+        chunk = self._align(chunk)
+
+        if self.partition_cols:
+            data_columns = [col for col in self.columns if col not in self.partition_cols]
+            groups = chunk.groupby(self.partition_cols, dropna=False, sort=False, observed=True)
+            for keys, group in groups:
+                keys = keys if isinstance(keys, tuple) else (keys,)
+                directory = self.output_path.joinpath(*[
+                    f"{col}={_partition_value(value)}" for col, value in zip(self.partition_cols, keys)
+                ])
+                self._write_part(group[data_columns], directory)
+        elif self.output_format == 'csv':
+            chunk.to_csv(
+                self.output_path,
+                sep=self.csv_separator,
+                index=False,
+                mode='a' if self.header_written else 'w',
+                header=not self.header_written
+            )
+            self.header_written = True
+        else:
+            table = self._to_table(chunk)
+            if self.writer is None:
+                if self.output_format == 'parquet':
+                    import pyarrow.parquet as pq
+                    self.writer = pq.ParquetWriter(self.output_path, table.schema)
+                else:
+                    import pyarrow as pa
+                    # Feather v2 es el formato de archivo IPC de Arrow; sin compresión se puede mapear en memoria
+                    self.sink = pa.OSFile(str(self.output_path), 'wb')
+                    self.writer = pa.ipc.new_file(self.sink, table.schema)
+            self.writer.write_table(table)
+
+        self.rows += len(chunk)
+
+    def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+        if self.sink is not None:
+            self.sink.close()
+            self.sink = None
@@ -0,0 +1,69 @@
+"""
+Benchmark de clean_quotes: implementación anterior (lambda por celda) frente a la vectorizada.
+
+Uso:
+    python benchmarks/bench_clean_quotes.py --rows 1000000 --cols 40
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from FunctionsAP.utilities.join_files import clean_quotes
+
+
+def clean_quotes_apply(df: pd.DataFrame) -> pd.DataFrame:
+    # Implementación anterior, conservada como referencia
+    for col in df.select_dtypes(include='object').columns:
+        df[col] = df[col].apply(lambda x: x.replace('";', ';').replace(';"', ';').strip('"') if isinstance(x, str) else x)
+    return df
+
+
+def make_frame(rows: int, cols: int, quote_ratio: float, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    plain = np.array([f"valor{i}" for i in range(50)] + [None], dtype=object)
+    quoted = np.array(['"CS18.148"', 'a";b', 'c;"d', '"x;"y"'], dtype=object)
+    data = {}
+    for j in range(cols):
+        if j % 4 == 3:
+            # Una de cada cuatro columnas es numérica
+            data[f"num_{j}"] = rng.random(rows)
+        elif j % 4 == 0:
+            # Columnas de texto con algunas comillas
+            column = rng.choice(plain, rows)
+            mask = rng.random(rows) < quote_ratio
+            column[mask] = rng.choice(quoted, mask.sum())
+            data[f"txt_{j}"] = column
+        else:
+            # Columnas de texto sin comillas
+            data[f"txt_{j}"] = rng.choice(plain, rows)
+    return pd.DataFrame(data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--cols", type=int, default=40)
+    parser.add_argument("--quote-ratio", type=float, default=0.01)
+    args = parser.parse_args()
+
+    df = make_frame(args.rows, args.cols, args.quote_ratio)
+    print(f"Frame: {args.rows} filas x {args.cols} columnas")
+
+    start = time.perf_counter()
+    expected = clean_quotes_apply(df.copy())
+    t_old = time.perf_counter() - start
+    print(f"apply (anterior): {t_old:.2f} s")
+
+    start = time.perf_counter()
+    result = clean_quotes(df.copy())
+    t_new = time.perf_counter() - start
+    print(f"vectorizada:      {t_new:.2f} s")
+
+    pd.testing.assert_frame_equal(result, expected)
+    print(f"Resultados idénticos. Aceleración: {t_old / t_new:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
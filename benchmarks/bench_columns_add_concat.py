@@ -0,0 +1,71 @@
+"""
+Benchmark de columns_add(type='Text', operation='concat'): implementación anterior (apply por fila)
+frente a la vectorizada.
+
+Uso:
+    python benchmarks/bench_columns_add_concat.py --rows 2000000 --cols 3
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from FunctionsAP.utilities.columns_add import columns_add
+
+
+def concat_apply(df: pd.DataFrame, columns: list, separator: str) -> pd.Series:
+    # Implementación anterior, conservada como referencia
+    return df[columns].apply(
+        lambda row: separator.join(
+            [str(x) for x in row if str(x).lower() not in ['', 'nan', 'none']]
+        ) if not all(str(x).lower() in ['', 'nan', 'none'] for x in row) else separator,
+        axis=1
+        ).replace(separator, np.nan)
+
+
+def make_frame(rows: int, cols: int, empty_ratio: float, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    labels = np.array([f"lote{i}" for i in range(200)] + ['', 'nan', None], dtype=object)
+    data = {}
+    for j in range(cols):
+        if j % 3 == 2:
+            # Una de cada tres columnas es numérica, con NaN
+            column = rng.integers(1, 60, rows).astype(float)
+            column[rng.random(rows) < empty_ratio] = np.nan
+        else:
+            column = rng.choice(labels[:-3], rows)
+            mask = rng.random(rows) < empty_ratio
+            column[mask] = rng.choice(labels[-3:], mask.sum())
+        data[f"col_{j}"] = column
+    return pd.DataFrame(data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--cols", type=int, default=3)
+    parser.add_argument("--empty-ratio", type=float, default=0.1)
+    parser.add_argument("--separator", default="-")
+    args = parser.parse_args()
+
+    df = make_frame(args.rows, args.cols, args.empty_ratio)
+    columns = df.columns.tolist()
+    print(f"Frame: {args.rows} filas x {args.cols} columnas")
+
+    start = time.perf_counter()
+    expected = concat_apply(df, columns, args.separator)
+    t_old = time.perf_counter() - start
+    print(f"apply (anterior): {t_old:.2f} s")
+
+    start = time.perf_counter()
+    result = columns_add(df, columns, name_column_new="Concat", type="Text", separator=args.separator)["Concat"]
+    t_new = time.perf_counter() - start
+    print(f"vectorizada:      {t_new:.2f} s")
+
+    pd.testing.assert_series_equal(result, expected, check_names=False)
+    print(f"Resultados idénticos. Aceleración: {t_old / t_new:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import FunctionsAP  # noqa: F401  (registra df.fap)
+from FunctionsAP import columns_add, eliminar_valor_columna1, handle_missing_data, procesar_valores
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({
+        'Codigo': ['A', 'A', 'B', 'B', 'C'],
+        'Semana': [1, 2, 1, 2, 1],
+        'Peso1': [1.0, np.nan, 3.0, 4.0, np.nan],
+        'Peso2': [0.5, 1.5, np.nan, 2.0, np.nan],
+        'Lote': [' L1 ', '', 'None', 'L2', 'L3'],
+    })
+
+
+def test_cadena_igual_a_llamadas_directas(df):
+    original = df.copy()
+    result = (
+        df.fap.procesar_valores(convertir_vacios=True, trim_strings=True)
+          .columns_add(['Peso1', 'Peso2'], name_column_new='Peso')
+          .eliminar_valor_columna1('Lote', ['Peso'])
+          .collect()
+    )
+    expected = procesar_valores(df, convertir_vacios=True, trim_strings=True)
+    expected = columns_add(expected, ['Peso1', 'Peso2'], name_column_new='Peso')
+    expected = eliminar_valor_columna1(expected, 'Lote', ['Peso'])
+
+    pd.testing.assert_frame_equal(result, expected)
+    pd.testing.assert_frame_equal(df, original)
+
+
+def test_pasos_terminales(df):
+    report = df.fap.handle_missing_data(['Peso1', 'Peso2'], 'Codigo', 'Semana').collect()
+    pd.testing.assert_frame_equal(report, handle_missing_data(df, ['Peso1', 'Peso2'], 'Codigo', 'Semana'))
+
+    result, count = df.fap.eliminar_valor_columna1('Lote', ['Peso1', 'Peso2'], return_count=True).collect()
+    assert count == 1 and pd.isna(result.loc[4, 'Lote'])
+
+    with pytest.raises(ValueError):
+        df.fap.handle_missing_data(['Peso1'], 'Codigo', 'Semana').columns_add(['Peso1', 'Peso2'])
+
+
+@pytest.mark.parametrize('register', [
+    lambda df: df.fap.procesar_valores(inplace=True),
+    lambda df: df.fap.procesar_valores(None, None, True, False, None, None, False, False, True),
+    lambda df: df.fap.columns_add(['Peso1', 'Peso2']).eliminar_valor_columna1('Lote', ['Peso1'], True),
+])
+def test_inplace_no_se_admite_en_la_cadena(df, register):
+    with pytest.raises(ValueError, match='inplace'):
+        register(df)
+
+
+def test_la_cadena_no_modifica_el_original(df):
+    original = df.copy()
+    df.fap.eliminar_valor_columna1('Lote', ['Peso1', 'Peso2']).procesar_valores(convertir_vacios=True).collect()
+    pd.testing.assert_frame_equal(df, original)
+    assert df.fap.columns_add(['Peso1']).procesar_valores().steps == ['columns_add', 'procesar_valores']
+
+
+def test_la_cadena_copia_una_sola_vez(df, monkeypatch):
+    steps = (
+        df.fap.procesar_valores(convertir_vacios=True)
+          .columns_add(['Peso1', 'Peso2'], name_column_new='Peso', drop=False)
+          .eliminar_valor_columna1('Lote', ['Peso1'])
+          .handle_missing_data(['Peso1', 'Peso2'], 'Codigo', 'Semana', mode='fill', verbose=False)
+    )
+    expected = procesar_valores(df, convertir_vacios=True)
+    expected = columns_add(expected, ['Peso1', 'Peso2'], name_column_new='Peso', drop=False)
+    expected = eliminar_valor_columna1(expected, 'Lote', ['Peso1'])
+    expected = handle_missing_data(expected, ['Peso1', 'Peso2'], 'Codigo', 'Semana', mode='fill', verbose=False)
+
+    copias = []
+    copy = pd.DataFrame.copy
+    monkeypatch.setattr(pd.DataFrame, 'copy', lambda self, *a, **k: copias.append(self) or copy(self, *a, **k))
+    result = steps.collect()
+    monkeypatch.undo()
+
+    pd.testing.assert_frame_equal(result, expected)
+    # Solo se copia el DataFrame original; las demás copias son tablas auxiliares del relleno
+    copias = [copia for copia in copias if 'Codigo' in copia.columns]
+    assert len(copias) == 1 and copias[0] is df
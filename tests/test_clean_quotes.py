@@ -0,0 +1,36 @@
+import importlib
+
+import numpy as np
+import pandas as pd
+
+jf = importlib.import_module('FunctionsAP.utilities.join_files')
+
+
+def clean_quotes_baseline(df: pd.DataFrame) -> pd.DataFrame:
+    for col in df.select_dtypes(include='object').columns:
+        df[col] = df[col].apply(lambda x: x.replace('";', ';').replace(';"', ';').strip('"') if isinstance(x, str) else x)
+    return df
+
+
+def test_clean_quotes_igual_a_baseline():
+    rng = np.random.default_rng(0)
+    values = np.array(['"CS18.148"', 'a";b', 'c;"d', '"x;"y"', 'limpio', '', None, np.nan, 1, 1.0, True, '1'],
+                      dtype=object)
+    df = pd.DataFrame({
+        'texto': rng.choice(values, 500),
+        'sin_comillas': rng.choice(values[4:], 500),
+        'numero': rng.random(500),
+    })
+    expected = clean_quotes_baseline(df.copy())
+    result = jf.clean_quotes(df.copy())
+
+    pd.testing.assert_frame_equal(result, expected)
+    # Los valores no texto se conservan con su tipo original
+    for got, exp in zip(result['texto'], expected['texto']):
+        assert type(got) is type(exp)
+
+
+def test_clean_quotes_valores_no_hashables():
+    df = pd.DataFrame({'texto': ['"a"', ['"b"'], {'c': 1}]})
+    result = jf.clean_quotes(df.copy())
+    assert result['texto'].tolist() == ['a', ['"b"'], {'c': 1}]
@@ -0,0 +1,243 @@
+import datetime
+import warnings
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from FunctionsAP import columns_add, columns_add_batch
+
+
+def columns_add_baseline(dataframe, columns, name_column_new=None, type="Number", drop=True, separator="", operation=None):
+    if name_column_new is None:
+        name_column_new = columns[0]
+    if operation is None:
+        operation = {"number": "sum", "text": "concat", "date": "mean"}[type.lower()]
+    df = dataframe.copy()
+    temp_column_name = f"CoL$&$umNa_CreADA_{name_column_new}"
+    while temp_column_name in df.columns:
+        temp_column_name += "_temp"
+
+    if type.lower() == "number":
+        if not all(pd.api.types.is_numeric_dtype(df[col]) for col in columns):
+            raise TypeError("Todas las columnas deben ser numéricas para 'type'='Number'.")
+        if operation == "first":
+            df[temp_column_name] = df[columns].bfill(axis=1).iloc[:, 0]
+        else:
+            df[temp_column_name] = getattr(df[columns], operation)(axis=1, skipna=True)
+    elif type.lower() == "text":
+        if operation == "concat":
+            df[temp_column_name] = df[columns].apply(
+                lambda row: separator.join(
+                    [str(x) for x in row if str(x).lower() not in ['', 'nan', 'none']]
+                ) if not all(str(x).lower() in ['', 'nan', 'none'] for x in row) else separator,
+                axis=1
+                ).replace(separator, np.nan)
+        else:
+            df[temp_column_name] = df[columns].astype(str)\
+                .replace(['', 'nan', 'None'], np.nan)\
+                .bfill(axis=1).iloc[:, 0]
+    else:
+        for col in columns:
+            df[col] = pd.to_datetime(df[col], errors='coerce')
+        if operation == "mean":
+            df[temp_column_name] = pd.to_datetime(df[columns].mean(axis=1), errors='coerce')
+        elif operation == "first":
+            df[temp_column_name] = df[columns].bfill(axis=1).iloc[:, 0]
+        else:
+            df[temp_column_name] = getattr(df[columns], operation)(axis=1)
+
+    if drop:
+        df.drop(columns=columns, inplace=True)
+    df.rename(columns={temp_column_name: name_column_new}, inplace=True)
+    return df
+
+
+def assert_igual_a_baseline(df, columns, **kwargs):
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        expected = columns_add_baseline(df, columns, **kwargs)
+        result = columns_add(df, columns, **kwargs)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+COLUMNAS_TEXTO = {
+    'texto': ['a', None, 'c', '', 'NaN', 'a'],
+    'mixta': ['1', 1, 1.0, True, np.nan, 1],
+    'numeros_objeto': [0, 0.0, -0.0, False, None, 2],
+    'decimal': [Decimal('1'), Decimal('1.0'), Decimal('1.00'), None, Decimal('2'), Decimal('1')],
+    'entero': [1, 2, 1, 3, 2, 1],
+    'flotante': [0.0, -0.0, np.nan, 1.5, 1.0, 0.0],
+    'booleano': [True, False, True, True, False, False],
+    'fecha': pd.to_datetime(['2024-01-01', None, '2024-01-03', '2024-01-01', None, '2024-01-05']),
+    'fecha_tz': pd.to_datetime(['2024-01-01', None, '2024-01-03', '2024-01-01', None, '2024-01-05']).tz_localize('UTC'),
+    'zonas': [pd.Timestamp('2024-01-01 00:00', tz='UTC'), pd.Timestamp('2024-01-01 01:00', tz='Europe/Paris'),
+              None, pd.Timestamp('2024-01-01 00:00', tz='UTC'), None, None],
+    'fechas_python': [datetime.date(2024, 1, 1), datetime.datetime(2024, 1, 1), None,
+                      datetime.date(2024, 1, 1), None, datetime.date(2024, 1, 2)],
+    'Int64': pd.array([1, None, 3, 1, None, 2], dtype='Int64'),
+    'string': pd.array(['a', None, 'b', 'a', '', 'c'], dtype='string'),
+    'categoria': pd.Categorical(['x', None, 'y', 'x', None, 'y']),
+}
+
+
+@pytest.mark.parametrize('separator', ['', '-', '1'])
+@pytest.mark.parametrize('columna', list(COLUMNAS_TEXTO))
+def test_concat_una_columna(columna, separator):
+    df = pd.DataFrame({'a': COLUMNAS_TEXTO[columna]})
+    assert_igual_a_baseline(df, ['a'], type='Text', separator=separator)
+
+
+@pytest.mark.parametrize('segunda', list(COLUMNAS_TEXTO))
+@pytest.mark.parametrize('primera', list(COLUMNAS_TEXTO))
+def test_concat_dos_columnas(primera, segunda):
+    df = pd.DataFrame({'a': COLUMNAS_TEXTO[primera], 'b': COLUMNAS_TEXTO[segunda], 'c': range(6)})
+    assert_igual_a_baseline(df, ['a', 'b'], type='Text', separator='_', name_column_new='ab')
+
+
+def test_concat_tipos_mezclados():
+    df = pd.DataFrame({'a': ['1', 1, 1.0, True]})
+    result = columns_add(df, ['a'], type='Text', separator='1')
+    assert result['a'].tolist()[2:] == ['1.0', 'True']
+    assert result['a'].iloc[:2].isna().all()
+
+    result = columns_add(df, ['a'], type='Text', separator='|')
+    assert result['a'].tolist() == ['1', '1', '1.0', 'True']
+
+
+@pytest.mark.parametrize('operation', ['sum', 'mean', 'prod', 'min', 'max', 'first'])
+def test_operaciones_numericas(operation):
+    df = pd.DataFrame({
+        'a': [1, 2, 3, 4],
+        'b': [1.5, np.nan, 3.0, np.nan],
+        'c': pd.array([None, 2, None, 4], dtype='Int64'),
+        'd': [True, False, True, False],
+    })
+    assert_igual_a_baseline(df, ['a', 'b'], operation=operation)
+    assert_igual_a_baseline(df, ['b', 'd'], operation=operation, drop=False, name_column_new='n')
+
+
+@pytest.mark.parametrize('operation', ['min', 'max', 'mean', 'first'])
+def test_operaciones_fecha(operation):
+    df = pd.DataFrame({
+        'a': ['2024-01-01', None, '2024-01-03', 'x'],
+        'b': pd.to_datetime(['2024-02-01', '2024-02-02', None, None]),
+    })
+    assert_igual_a_baseline(df, ['a', 'b'], type='Date', operation=operation)
+
+
+@pytest.mark.parametrize('columna', list(COLUMNAS_TEXTO))
+def test_texto_first(columna):
+    df = pd.DataFrame({'a': COLUMNAS_TEXTO[columna], 'b': COLUMNAS_TEXTO['texto']})
+    assert_igual_a_baseline(df, ['a', 'b'], type='Text', operation='first')
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'name_column_new': 'Peso'},
+    {'type': 'Text', 'separator': '-', 'drop': False},
+    {'type': 'Date', 'operation': 'min'},
+])
+def test_inplace(kwargs):
+    df = pd.DataFrame({'a': [1, None, 3], 'b': ['2024-01-01', None, '2024-01-03']})
+    columns = ['a'] if 'type' not in kwargs else ['a', 'b']
+    expected = columns_add(df, columns, **kwargs)
+    original = df.copy()
+    pd.testing.assert_frame_equal(df, original)
+
+    result = columns_add(df, columns, inplace=True, **kwargs)
+    assert result is df
+    pd.testing.assert_frame_equal(df, expected)
+
+
+def test_columnas_no_numericas():
+    df = pd.DataFrame({'a': [1, 2], 'b': ['x', 'y']})
+    with pytest.raises(TypeError):
+        columns_add(df, ['a', 'b'])
+
+
+def encadenar(df, specs):
+    for spec in specs:
+        spec = dict(spec)
+        df = columns_add_baseline(df, spec.pop('columns'), **spec)
+    return df
+
+
+def datos_batch():
+    return pd.DataFrame({
+        'Peso1': [1.0, np.nan, 3.0, 4.0],
+        'Peso2': [10, 20, 30, 40],
+        'Lote': ['A', None, 'C', 'D'],
+        'Fila': [1, 2, None, 4],
+        'Inicio': ['2024-01-01', '2024-01-05', None, 'x'],
+        'Fin': pd.to_datetime(['2024-01-03', None, '2024-01-09', '2024-01-10']),
+    })
+
+
+SPECS_BATCH = {
+    'independientes': [
+        {'columns': ['Peso1', 'Peso2'], 'name_column_new': 'Peso'},
+        {'columns': ['Lote', 'Fila'], 'name_column_new': 'Ubicacion', 'type': 'Text', 'separator': '-'},
+        {'columns': ['Inicio', 'Fin'], 'name_column_new': 'Fecha', 'type': 'Date', 'operation': 'min'},
+    ],
+    'sin_eliminar': [
+        {'columns': ['Peso1', 'Peso2'], 'name_column_new': 'Peso', 'drop': False, 'operation': 'mean'},
+        {'columns': ['Inicio', 'Fin'], 'name_column_new': 'Fecha', 'type': 'date', 'drop': False},
+        {'columns': ['Lote'], 'name_column_new': 'Lote2', 'type': 'text', 'operation': 'first', 'drop': False},
+    ],
+    'encadenadas': [
+        {'columns': ['Peso1', 'Peso2'], 'name_column_new': 'Peso', 'drop': False},
+        {'columns': ['Peso', 'Peso1'], 'name_column_new': 'Total', 'operation': 'max'},
+        {'columns': ['Total', 'Fila'], 'name_column_new': 'Clave', 'type': 'Text', 'separator': '/'},
+    ],
+    'columna_creada_eliminada': [
+        {'columns': ['Peso1', 'Peso2'], 'name_column_new': 'Peso', 'drop': False},
+        {'columns': ['Peso'], 'name_column_new': 'Copia', 'operation': 'first'},
+    ],
+    'fechas_convertidas_sin_eliminar': [
+        {'columns': ['Inicio', 'Fin'], 'name_column_new': 'Desde', 'type': 'Date', 'operation': 'min', 'drop': False},
+        {'columns': ['Inicio', 'Fin'], 'name_column_new': 'Hasta', 'type': 'Date', 'operation': 'max', 'drop': False},
+        {'columns': ['Inicio', 'Lote'], 'name_column_new': 'Texto', 'type': 'Text', 'drop': False},
+    ],
+    'mismo_nombre': [
+        {'columns': ['Peso1', 'Peso2']},
+        {'columns': ['Lote', 'Fila'], 'name_column_new': 'Lote', 'type': 'Text'},
+        {'columns': ['Peso1', 'Lote'], 'name_column_new': 'Peso1', 'type': 'Text', 'separator': ' '},
+    ],
+    'nombre_existente': [
+        {'columns': ['Peso1'], 'name_column_new': 'Peso2', 'operation': 'first'},
+    ],
+}
+
+
+@pytest.mark.parametrize('caso', list(SPECS_BATCH))
+def test_batch_igual_a_encadenar(caso):
+    df = datos_batch()
+    original = df.copy()
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        expected = encadenar(df, SPECS_BATCH[caso])
+        result = columns_add_batch(df, SPECS_BATCH[caso])
+    pd.testing.assert_frame_equal(result, expected)
+    pd.testing.assert_frame_equal(df, original)
+
+
+def test_batch_sin_especificaciones():
+    df = datos_batch()
+    result = columns_add_batch(df, [])
+    pd.testing.assert_frame_equal(result, df)
+    assert result is not df
+
+
+@pytest.mark.parametrize('specs, error', [
+    ([{'columns': ['Peso1'], 'otra': 1}], ValueError),
+    ([{'name_column_new': 'Peso'}], ValueError),
+    ([{'columns': ['Peso1', 'Lote']}], TypeError),
+    ([{'columns': ['Peso1', 'Peso2']}, {'columns': ['Peso2']}], ValueError),
+    ([{'columns': ['Peso1'], 'type': 'Otro'}], ValueError),
+    ([{'columns': ['Lote'], 'type': 'Text', 'operation': 'sum'}], ValueError),
+    ('no es lista', TypeError),
+])
+def test_batch_valida_antes_de_calcular(specs, error):
+    with pytest.raises(error):
+        columns_add_batch(datos_batch(), specs)
@@ -0,0 +1,330 @@
+import importlib
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from FunctionsAP import data_base_genetic, data_base_genetic_batch
+
+INDEX = ['Codigo']
+CUALIT = ['Color', 'Tamaño']
+CUANTIT = ['Firmeza-1', 'Firmeza-2', 'Firmeza-3', 'Brix-1', 'Brix-2']
+LIST_DIC = {
+    'Color': {'Alto': 3, 'medio': 2, 'Bajo': 1},
+    'Tamaño': {'grande': 2, 'chico': 0},
+}
+
+
+def data_base_genetic_baseline(original_data, cycle, index_column, column_calid_cualit, column_calid_cuantit, list_dic):
+    """
+    Versión original (ciclos CI y CIII) sin la validación de argumentos. CIII solo devolvía el consolidado.
+    """
+    df = original_data.copy()
+    list_columns = list(df.columns)
+    diccionario_posiciones = {elemento: i for i, elemento in enumerate(list_columns)}
+    posición_final_index = max(diccionario_posiciones[elemento] for elemento in index_column)
+    posicion_inicial_calid = min(diccionario_posiciones[elemento] for elemento in column_calid_cualit)
+    posición_final_calid = max(diccionario_posiciones[elemento] for elemento in column_calid_cualit)
+    lista_inted = list_columns[int(posición_final_index+1):int(posicion_inicial_calid)]
+
+    def columna_presente(df, columna, new_column):
+        df[new_column] = 1
+        df[new_column] = df[new_column].where(df[columna].notnull(), 0)
+        return df
+
+    def separar_por_categoria(lista, separadores=["-", "+", "*"]):
+        separated_lists = {}
+        for item in lista:
+            for sep in separadores:
+                parts = item.split(sep)
+                if len(parts) == 2:
+                    category, number = parts
+                    break
+            else:
+                continue
+            separated_lists.setdefault(category, []).append(item)
+        return separated_lists
+
+    def preprocess_mapping(original_map):
+        normalized = {}
+        for key, value in original_map.items():
+            key_lower = key.lower()
+            normalized[key_lower] = value
+            if key_lower.endswith('o'):
+                normalized[key_lower[:-1] + 'a'] = value
+            elif key_lower.endswith('a'):
+                normalized[key_lower[:-1] + 'o'] = value
+        return normalized
+
+    def safe_map(mapeo, x):
+        if pd.isna(x):
+            return None
+        return mapeo.get(x.lower(), None)
+
+    list_calid_cualit = []
+    list_calid_cualit_N = []
+    for col, mapeo in list_dic.items():
+        nueva_col = f'{col}_#'
+        mapeo_proc = preprocess_mapping(mapeo)
+        df[nueva_col] = df[col].apply(lambda x: safe_map(mapeo_proc, x))
+        list_calid_cualit.append(col)
+        list_calid_cualit_N.append(nueva_col)
+    columnas_a_sumar = [f'{col}_#' for col in column_calid_cualit]
+    lista_intercalada_calidad = [item for pair in zip(list_calid_cualit, list_calid_cualit_N) for item in pair]
+    lista_final = [
+        col for col in list_columns[posición_final_calid+1:]
+        if col not in list_calid_cualit + list_calid_cualit_N
+    ]
+    orden_columnas = list(dict.fromkeys(index_column + lista_inted + lista_intercalada_calidad + lista_final))
+
+    df["Suma de puntaje"] = df[columnas_a_sumar].sum(axis=1, skipna=True)
+    df["Traits evaluados"] = df[columnas_a_sumar].count(axis=1)
+    df["Suma de puntaje"].replace(0, np.nan, inplace=True)
+    df["Traits evaluados"].replace(0, np.nan, inplace=True)
+    df["Puntos"] = len(columnas_a_sumar)
+    df = columna_presente(df, 'Suma de puntaje', 'Evaluados')
+    orden_columnas = orden_columnas + ["Suma de puntaje", "Traits evaluados", "Puntos", 'Evaluados']
+
+    if cycle == "CIII":
+        resultado = separar_por_categoria(column_calid_cuantit)
+        nuevo_orden = []
+        for keys, lista in resultado.items():
+            df[f"{keys}_mean"] = df[lista].mean(axis=1, skipna=True)
+            df[f"{keys}_desv. est."] = df[lista].std(axis=1, skipna=True)
+            nuevo_orden.extend(lista + [f"{keys}_mean", f"{keys}_desv. est."])
+        for colum in nuevo_orden:
+            df[colum].replace(0, np.nan, inplace=True)
+        orden_columnas = orden_columnas + nuevo_orden
+        df = df.reindex(columns=orden_columnas)
+        return df.copy()
+
+    df = df.reindex(columns=orden_columnas)
+    dataframe = df.copy()
+
+    list_columns = list(df.columns)
+    posicion_inicial_calid = list_columns.index(lista_intercalada_calidad[0])
+    posición_final_index = list_columns.index(index_column[-1])
+    lista_inted = list_columns[int(posición_final_index+1):int(posicion_inicial_calid)]
+    lista_inted.remove("Evaluación")
+    lista_inted.remove("Semana")
+    lista_4_ultimos = list_columns[-4:]
+    columnas_a_pivotear = lista_inted + lista_intercalada_calidad + lista_final + lista_4_ultimos
+    index_column_copy = index_column.copy()
+    data = df.copy()
+    pivot_df = pd.pivot_table(data=data, index=index_column, columns="Evaluación", values=columnas_a_pivotear, aggfunc="first")
+    pivot_df.columns = [f"{col[0]}_CI-{col[1]}" for col in pivot_df.columns]
+    pivot_df = pivot_df.reset_index()
+    evaluaciones = list(df["Evaluación"].unique())
+    columnas_sin_index = [f"{columna}_CI-{eval}" for eval in evaluaciones for columna in columnas_a_pivotear]
+    pivot_df = pivot_df.reindex(columns=index_column_copy + columnas_sin_index)
+
+    new_order = index_column.copy()
+    for evaluación in evaluaciones:
+        new_order.extend([f'Suma de puntaje_CI-{evaluación}', f'Traits evaluados_CI-{evaluación}',
+                          f'Puntos_CI-{evaluación}', f'Evaluados_CI-{evaluación}'])
+    resumen = pivot_df[new_order]
+    for evaluación in evaluaciones:
+        resumen[f'Suma de puntaje_CI-{evaluación}'].replace("", 0, inplace=True)
+        resumen[f'Traits evaluados_CI-{evaluación}'].replace("", np.nan, inplace=True)
+    for evaluación in evaluaciones:
+        resumen[f"Paso1_{evaluación}"] = resumen[f'Suma de puntaje_CI-{evaluación}']*resumen[f'Evaluados_CI-{evaluación}']
+    resumen["Paso2"] = resumen[[f"Paso1_{evaluacion}" for evaluacion in evaluaciones]].sum(axis=1, skipna=True)
+    resumen["Paso3"] = resumen[[f'Evaluados_CI-{evaluacion}' for evaluacion in evaluaciones]].sum(axis=1, skipna=True)
+    resumen["Promedio total ponderado CI"] = resumen["Paso2"]/resumen["Paso3"]
+    columnas_temporales = [f"Paso1_{evaluacion}" for evaluacion in evaluaciones] + ["Paso2", "Paso3"]
+    resumen.drop(columns=columnas_temporales, inplace=True)
+    resumen["Ptos CI"] = resumen[[f"Puntos_CI-{evaluacion}" for evaluacion in evaluaciones]].mean(axis=1, skipna=True)
+    resumen = columna_presente(resumen, "Promedio total ponderado CI", 'Evaluados')
+    resumen["Numero de evaluaciones CI"] = resumen[[f"Traits evaluados_CI-{evaluacion}" for evaluacion in evaluaciones]].count(axis=1)
+    for evaluación in evaluaciones:
+        resumen[f'Suma de puntaje_CI-{evaluación}'].replace(0, "se", inplace=True)
+        resumen[f'Traits evaluados_CI-{evaluación}'].replace(np.nan, "se", inplace=True)
+    resumen["Promedio total ponderado CI"].replace(0, "se", inplace=True)
+    resumen["Promedio total ponderado CI"].replace(np.nan, "se", inplace=True)
+    return dataframe, pivot_df, resumen
+
+
+def _frame(codigos=40, evaluaciones=(1, 2, 3), seed=0, duplicados=False, claves_vacias=False):
+    rng = np.random.default_rng(seed)
+    filas = [(codigo, evaluacion) for codigo in range(codigos) for evaluacion in evaluaciones]
+    n = len(filas)
+    df = pd.DataFrame({
+        'Codigo': [f'G{codigo:03d}' for codigo, _ in filas],
+        'Evaluación': [evaluacion for _, evaluacion in filas],
+        'Semana': rng.integers(1, 20, n),
+        'Lote': rng.choice(['L1', 'L2', None], n),
+        'Color': rng.choice(['Alto', 'alta', 'MEDIO', 'bajo', 'Baja', 'raro', None], n),
+        'Tamaño': rng.choice(['Grande', 'chica', 'chico', None, None], n),
+        'Obs': rng.choice(['ok', None], n),
+    })
+    for col in CUANTIT:
+        valores = rng.normal(10, 3, n).round(1)
+        valores[rng.random(n) < 0.25] = np.nan
+        valores[rng.random(n) < 0.05] = 0
+        df[col] = valores
+    if duplicados:
+        df = pd.concat([df, df.sample(frac=0.2, random_state=seed).assign(Lote='dup')], ignore_index=True)
+    if claves_vacias:
+        df.loc[df.sample(frac=0.05, random_state=seed).index, 'Codigo'] = None
+    return df
+
+
+def _kwargs(cycle):
+    return dict(cycle=cycle, index_column=INDEX, column_calid_cualit=CUALIT, column_calid_cuantit=CUANTIT, list_dic=LIST_DIC)
+
+
+def _baseline(df, cycle):
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        return data_base_genetic_baseline(df, cycle, INDEX, CUALIT, CUANTIT, LIST_DIC)
+
+
+def _assert_salidas_iguales(result, expected):
+    assert len(result) == len(expected)
+    for salida, esperada in zip(result, expected):
+        pd.testing.assert_frame_equal(salida, esperada)
+
+
+@pytest.mark.parametrize('variante', [{}, {'duplicados': True}, {'claves_vacias': True}, {'evaluaciones': ('E1', 'E2')}])
+@pytest.mark.parametrize('seed', [0, 1])
+def test_ci_igual_a_baseline(seed, variante):
+    df = _frame(seed=seed, **variante)
+    original = df.copy()
+    expected = _baseline(df, "CI")
+    result = data_base_genetic(df, **_kwargs("CI"))
+    _assert_salidas_iguales(result, expected)
+    pd.testing.assert_frame_equal(df, original)
+
+
+@pytest.mark.parametrize('seed', [0, 1])
+def test_ciii_consolidado_igual_a_baseline(seed):
+    df = _frame(seed=seed)
+    expected = _baseline(df, "CIII")
+    # La versión original repetía cada columna cuantitativa; ahora aparece una vez, junto a su media y desviación
+    expected = expected.loc[:, ~expected.columns.duplicated(keep='last')]
+    dataframe, pivot_df, resumen = data_base_genetic(df, **_kwargs("CIII"))
+    pd.testing.assert_frame_equal(dataframe, expected, check_exact=False, rtol=1e-12)
+    assert 'Firmeza_mean_CIII-1' in pivot_df.columns
+    assert 'Promedio total ponderado CIII' in resumen.columns
+
+
+@pytest.mark.parametrize('cycle', ["CII", "CIII", "CIV"])
+def test_ciclos_cuantitativos_comparten_motor(cycle):
+    df = _frame()
+    result = data_base_genetic(df, **_kwargs(cycle))
+    referencia = data_base_genetic(df, **_kwargs("CIII"))
+    for salida, esperada in zip(result, referencia):
+        esperada = esperada.rename(columns=lambda col: col.replace("CIII", cycle))
+        pd.testing.assert_frame_equal(salida, esperada)
+
+
+def test_ci_ignora_cuantitativas():
+    df = _frame()
+    dataframe, pivot_df, resumen = data_base_genetic(df, **_kwargs("CI"))
+    assert not any(col.endswith('_mean') for col in dataframe.columns)
+
+
+@pytest.mark.parametrize('output', ["dict", "merged"])
+@pytest.mark.parametrize('parallel', [False, True])
+def test_batch_igual_a_cada_ciclo(parallel, output):
+    partes = {cycle: _frame(seed=i, codigos=20 + 5 * i) for i, cycle in enumerate(["CI", "CIII", "CIV"])}
+    temporada = pd.concat([parte.assign(Ciclo=cycle) for cycle, parte in partes.items()], ignore_index=True)
+    # Las etiquetas de un ciclo no aparecen en otro: el tipo de las columnas mapeadas depende de cada ciclo
+    temporada.loc[temporada['Ciclo'] == "CI", 'Tamaño'] = None
+    original = temporada.copy()
+
+    result = data_base_genetic_batch(
+        temporada, cycle_column="Ciclo", index_column=INDEX, column_calid_cualit=CUALIT,
+        column_calid_cuantit=CUANTIT, list_dic=LIST_DIC, output=output, parallel=parallel, max_workers=2,
+    )
+    esperado = {}
+    for cycle in partes:
+        filas = temporada[temporada['Ciclo'] == cycle].drop(columns='Ciclo')
+        esperado[cycle] = data_base_genetic(filas, **_kwargs(cycle))
+
+    if output == "dict":
+        assert list(result) == ["CI", "CIII", "CIV"]
+        for cycle, salidas in esperado.items():
+            _assert_salidas_iguales(result[cycle], salidas)
+    else:
+        pivots = [pivot_df for _, pivot_df, _ in esperado.values()]
+        unido = pivots[0].merge(pivots[1], on=INDEX, how="outer").merge(pivots[2], on=INDEX, how="outer")
+        pd.testing.assert_frame_equal(result, unido)
+    pd.testing.assert_frame_equal(temporada, original)
+
+
+def test_batch_ciclos_indicados():
+    temporada = pd.concat([_frame(seed=0).assign(Ciclo="CII"), _frame(seed=1).assign(Ciclo="CI")], ignore_index=True)
+    result = data_base_genetic_batch(temporada, cycles=["CII"], index_column=INDEX, column_calid_cualit=CUALIT,
+                                     column_calid_cuantit=CUANTIT, list_dic=LIST_DIC)
+    assert list(result) == ["CII"]
+    with pytest.raises(ValueError, match=r"\['CIII', 'CIV'\]"):
+        data_base_genetic_batch(temporada, cycles=["CI", "CIII", "CIV"], index_column=INDEX, column_calid_cualit=CUALIT,
+                                column_calid_cuantit=CUANTIT, list_dic=LIST_DIC)
+    with pytest.raises(ValueError, match=r"\['CV', 'X'\]"):
+        data_base_genetic_batch(temporada, cycles=["CV", "CI", "X"], index_column=INDEX, column_calid_cualit=CUALIT,
+                                list_dic=LIST_DIC)
+
+
+def test_batch_ciclos_ausentes_antes_de_procesar(monkeypatch):
+    dbg = importlib.import_module('FunctionsAP.utilities.data_base_genetic')
+    llamadas = []
+    monkeypatch.setattr(dbg, '_mapear_calidad', lambda *args, **kwargs: llamadas.append(args))
+    temporada = _frame().assign(Ciclo="CI")
+    with pytest.raises(ValueError, match='no tienen filas'):
+        data_base_genetic_batch(temporada, cycles=["CI", "CII"], index_column=INDEX, column_calid_cualit=CUALIT,
+                                list_dic=LIST_DIC)
+    assert llamadas == []
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'cycle_column': 'NoExiste'},
+    {'output': 'lista'},
+    {'cycles': ['CV']},
+])
+def test_batch_errores(kwargs):
+    temporada = _frame().assign(Ciclo="CI")
+    with pytest.raises(ValueError):
+        data_base_genetic_batch(temporada, index_column=INDEX, column_calid_cualit=CUALIT, list_dic=LIST_DIC, **kwargs)
+
+
+@pytest.mark.parametrize('cycle', ["CI", "CIII"])
+def test_low_memory_igual_y_sin_enlaces(cycle):
+    df = _frame(duplicados=True)
+    df['Lote'] = df['Lote'].astype('category')
+    df['Semana'] = df['Semana'].astype('Int64')
+    original = df.copy()
+    esperado = data_base_genetic(df, **_kwargs(cycle))
+    result = data_base_genetic(df, low_memory=True, **_kwargs(cycle))
+    _assert_salidas_iguales(result, esperado)
+
+    # Ni la entrada ni las salidas quedan enlazadas entre sí
+    dataframe = result[0]
+    dataframe.loc[dataframe.index[0], 'Semana'] = 999
+    dataframe.loc[dataframe.index[0], 'Firmeza-1' if cycle == "CIII" else 'Obs'] = -1
+    pd.testing.assert_frame_equal(df, original)
+    df.loc[df.index[1], 'Semana'] = 555
+    assert result[0].loc[result[0].index[1], 'Semana'] != 555
+
+
+def test_return_memory():
+    df = _frame(codigos=2000)
+    *salidas, memoria = data_base_genetic(df, return_memory=True, **_kwargs("CI"))
+    _assert_salidas_iguales(tuple(salidas), data_base_genetic(df, **_kwargs("CI")))
+    assert set(memoria) == {'pico_mb', 'entrada_mb', 'salida_mb'}
+    assert memoria['pico_mb'] >= 0 and memoria['salida_mb'] > 0
+
+
+@pytest.mark.parametrize('kwargs, error', [
+    ({'cycle': 'CV'}, ValueError),
+    ({'index_column': 'Codigo'}, TypeError),
+    ({'column_calid_cualit': ['NoExiste']}, ValueError),
+    ({'list_dic': {'Color': ['Alto']}}, TypeError),
+    ({'cycle': 'CIII', 'column_calid_cuantit': ['NoExiste-1']}, ValueError),
+])
+def test_errores(kwargs, error):
+    argumentos = _kwargs("CI")
+    argumentos.update(kwargs)
+    with pytest.raises(error):
+        data_base_genetic(_frame(), **argumentos)
@@ -0,0 +1,115 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip('matplotlib')
+pytest.importorskip('seaborn')
+
+from FunctionsAP import diseño_rcbd
+from FunctionsAP.statistics.diseño_rcbd import fp
+
+
+def diseño_rcbd_baseline(geno, nb, nc=None, serpentine='yes', alongside='no'):
+    """
+    Versión original, bloque por bloque y celda por celda. Devuelve (book, plan).
+    """
+    ng = len(geno)
+    if nc is None:
+        nc = int(np.ceil(np.sqrt(ng)))
+    nr = int(np.ceil(ng / nc))
+    plan_id = fp(nr, nc, serpentine)
+    plan = {}
+    records = []
+    for k in range(nb):
+        sg = np.random.permutation(geno)
+        sg_full = np.full(nr * nc, None, dtype=object)
+        sg_full[:len(sg)] = sg
+        block_plan = sg_full.reshape(nr, nc, order='F')
+        if serpentine == 'yes':
+            for i in range(nr):
+                if i % 2 != 0:
+                    block_plan[i, :] = block_plan[i, ::-1]
+        plan[k + 1] = pd.DataFrame(
+            block_plan,
+            index=[f'Fila {i+1}' for i in range(nr)],
+            columns=[f'Columna {j+1}' for j in range(nc)]
+        )
+        for i in range(nr):
+            for j in range(nc):
+                genotype = block_plan[i, j]
+                if genotype is not None:
+                    fila = i + 1
+                    columna = j + 1
+                    if alongside == 'rows':
+                        columna += k * nc
+                    elif alongside == 'columns':
+                        fila += k * nr
+                    records.append({'Plot': plan_id[i, j] + ng * k, 'bloque': k + 1, 'fila': fila,
+                                    'columna': columna, 'genotipo': genotype})
+    book = pd.DataFrame(records)
+    if serpentine == 'yes' and nr > 1:
+        book = book.sort_values(['Plot']).reset_index(drop=True)
+    else:
+        book = book.sort_values(['bloque', 'fila', 'columna']).reset_index(drop=True)
+    return book[['Plot', 'bloque', 'fila', 'columna', 'genotipo']], plan
+
+
+GENOTIPOS = {
+    'texto': [f'G{i}' for i in range(11)],
+    'enteros': list(range(1, 10)),
+    'dos': ['A', 'B'],
+    'con_na': ['A', pd.NA, 'C', 'D', np.nan],
+    'con_none': ['A', None, 'C', 'D', 'E'],
+}
+
+
+@pytest.mark.parametrize('alongside', ['no', 'rows', 'columns'])
+@pytest.mark.parametrize('serpentine', ['yes', 'no'])
+@pytest.mark.parametrize('nc', [None, 1, 4])
+@pytest.mark.parametrize('genotipos', list(GENOTIPOS))
+def test_igual_a_baseline(genotipos, nc, serpentine, alongside):
+    geno = GENOTIPOS[genotipos]
+    np.random.seed(0)
+    book_esperado, plan_esperado = diseño_rcbd_baseline(geno, 3, nc, serpentine, alongside)
+    np.random.seed(0)
+    layout = diseño_rcbd(geno, 3, nc, serpentine, alongside)
+
+    pd.testing.assert_frame_equal(layout.book, book_esperado)
+    assert list(layout.plan) == list(plan_esperado)
+    for bloque, plan_bloque in plan_esperado.items():
+        pd.testing.assert_frame_equal(layout.plan[bloque], plan_bloque)
+
+
+def test_plan_se_guarda_en_la_instancia():
+    layout = diseño_rcbd(GENOTIPOS['texto'], 4)
+    primero = layout._plan_bloque(3)
+    plan = layout.plan
+    assert list(plan) == [1, 2, 3, 4]
+    assert plan[3] is primero
+    assert layout.plan is plan
+    assert all(layout.plan[bloque] is plan[bloque] for bloque in plan)
+
+    # Los cambios en el plan se conservan entre accesos
+    plan[1].iloc[0, 0] = 'X'
+    del plan[4]
+    assert layout.plan[1].iloc[0, 0] == 'X'
+    assert list(layout.plan) == [1, 2, 3]
+
+
+def test_asignar_plan():
+    layout = diseño_rcbd(GENOTIPOS['dos'], 2)
+    nuevo = {1: pd.DataFrame([['A', 'B']])}
+    layout.plan = nuevo
+    assert list(layout.plan) == [1]
+    assert layout._plan_bloque(2) is None
+
+
+def test_mostrar_plan(capsys):
+    layout = diseño_rcbd(GENOTIPOS['texto'], 2)
+    layout.mostrar_plan(2)
+    assert 'Plan del Bloque 2' in capsys.readouterr().out
+    layout.mostrar_plan(5)
+    assert 'no existe' in capsys.readouterr().out
+    layout.mostrar_plan()
+    salida = capsys.readouterr().out
+    assert 'Plan del Bloque 1' in salida and 'Plan del Bloque 2' in salida
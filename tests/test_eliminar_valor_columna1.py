@@ -0,0 +1,92 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from FunctionsAP import eliminar_valor_columna1
+
+
+def eliminar_valor_columna1_baseline(df, Columna1, lista_columnas):
+    mask = pd.Series(True, index=df.index)
+    for columna in lista_columnas:
+        mask = mask & df[columna].isna()
+    df.loc[mask, Columna1] = np.nan
+    return df
+
+
+def datos():
+    return pd.DataFrame({
+        'Fruto1': [1.0, np.nan, np.nan, 4.0, np.nan],
+        'Fruto2': ['a', None, 'c', None, None],
+        'Peso': [10, 20, 30, 40, 50],
+        'Calibre': [1.5, 2.5, np.nan, 4.5, 5.5],
+        'Nota': ['x', 'y', None, 'w', 'v'],
+        'Fecha': pd.to_datetime(['2024-01-01', None, '2024-01-03', '2024-01-04', '2024-01-05']),
+        'Int64': pd.array([1, 2, None, 4, 5], dtype='Int64'),
+        'Flag': [True, False, True, False, True],
+    }, index=[10, 11, 12, 12, 14])
+
+
+OBJETIVOS = ['Peso', 'Calibre', 'Nota', 'Fecha', 'Int64', 'Flag']
+DEPENDENCIAS = [['Fruto1'], ['Fruto2'], ['Fruto1', 'Fruto2'], ['Calibre', 'Fruto1'], []]
+
+
+@pytest.mark.parametrize('dependencias', DEPENDENCIAS)
+@pytest.mark.parametrize('objetivo', OBJETIVOS)
+def test_igual_a_baseline(objetivo, dependencias):
+    df = datos()
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        expected = eliminar_valor_columna1_baseline(datos(), objetivo, dependencias)
+        result = eliminar_valor_columna1(df, objetivo, dependencias)
+    pd.testing.assert_frame_equal(result, expected)
+    pd.testing.assert_frame_equal(df, datos())
+
+
+def test_diccionario_igual_a_encadenar():
+    objetivos = {'Calibre': ['Fruto1', 'Fruto2'], 'Peso': ['Calibre'], 'Nota': ['Peso', 'Fruto1']}
+    expected = datos()
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        for objetivo, dependencias in objetivos.items():
+            expected = eliminar_valor_columna1_baseline(expected, objetivo, dependencias)
+        result, celdas = eliminar_valor_columna1(datos(), objetivos, return_count=True)
+    pd.testing.assert_frame_equal(result, expected)
+    assert celdas == 7
+
+
+def test_inplace():
+    df = datos()
+    result = eliminar_valor_columna1(df, 'Calibre', ['Fruto1', 'Fruto2'], inplace=True)
+    assert result is df
+    assert np.isnan(df['Calibre'].iloc[1])
+
+    df = datos()
+    result = eliminar_valor_columna1(df, 'Calibre', ['Fruto1', 'Fruto2'])
+    assert result is not df
+    assert df['Calibre'].iloc[1] == 2.5
+
+
+def test_return_count_no_cuenta_celdas_ya_vacias():
+    df, celdas = eliminar_valor_columna1(datos(), 'Calibre', ['Fruto1'], return_count=True)
+    # Fruto1 vacío en tres filas; Calibre ya estaba vacío en una de ellas
+    assert celdas == 2
+    assert df['Calibre'].isna().sum() == 3
+
+
+def test_none_pasa_a_nan():
+    result = eliminar_valor_columna1(datos(), 'Nota', ['Calibre'])
+    assert result['Nota'].iloc[2] is not None
+    assert np.isnan(result['Nota'].iloc[2])
+
+
+@pytest.mark.parametrize('args', [
+    ('Calibre', None),
+    ({'Calibre': ['Fruto1']}, ['Fruto2']),
+    ('Calibre', ['NoExiste']),
+    ({'NoExiste': ['Fruto1']}, None),
+])
+def test_errores(args):
+    with pytest.raises(ValueError):
+        eliminar_valor_columna1(datos(), *args)
@@ -0,0 +1,145 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from FunctionsAP import join_files
+
+pytest.importorskip('openpyxl')
+
+ENGINES = ['streaming', 'calamine']
+
+
+@pytest.fixture
+def carpeta(tmp_path):
+    folder = tmp_path / 'datos'
+    folder.mkdir()
+    for i in range(2):
+        with pd.ExcelWriter(folder / f'evaluacion_2024-04-0{i + 1}.xlsx') as writer:
+            pd.DataFrame({
+                'Codigo': [f'CS{i}{j}' for j in range(15)],
+                'Bayas': np.arange(15) + i,
+                'Peso': np.arange(15) * 1.5,
+            }).to_excel(writer, sheet_name='Campo', index=False)
+            pd.DataFrame({
+                'Codigo': [f'LB{i}{j}' for j in range(5)],
+                'Bayas': np.arange(5),
+                'Peso': np.arange(5) * 2.5,
+            }).to_excel(writer, sheet_name='Laboratorio', index=False)
+    return folder
+
+
+def _engine(engine):
+    if engine == 'calamine':
+        pytest.importorskip('python_calamine')
+    return engine
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_motores_igual_a_openpyxl(carpeta, engine):
+    expected = join_files(carpeta, include_date=True)
+    result = join_files(carpeta, include_date=True, excel_engine=_engine(engine))
+    pd.testing.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize('engine', ['openpyxl'] + ENGINES)
+def test_seleccion_de_hojas(carpeta, engine):
+    engine = _engine(engine)
+    laboratorio = join_files(carpeta, excel_engine=engine, sheet_name='Laboratorio')
+    assert len(laboratorio) == 10 and laboratorio['Codigo'].str.startswith('LB').all()
+
+    todas = join_files(carpeta, excel_engine=engine, sheet_name=None)
+    assert len(todas) == 40
+    assert todas.groupby('Hoja').size().to_dict() == {'Campo': 30, 'Laboratorio': 10}
+
+
+def test_motor_invalido(carpeta):
+    with pytest.raises(ValueError):
+        join_files(carpeta, excel_engine='xlrd')
+
+
+@pytest.fixture
+def libro_con_vacios(tmp_path):
+    from openpyxl import Workbook
+    libro = Workbook()
+    hoja = libro.active
+    hoja.append(['Codigo', 'Lote', 'Peso', 'Nota'])
+    hoja.append(['CS1', 10, 1.5, 'ok'])
+    hoja.append([None, 11, None, None])
+    hoja.append([1001, None, 2.0, True])
+    hoja.append(['CS3', 2.5, 3.25, None])
+    path = tmp_path / 'vacios.xlsx'
+    libro.save(path)
+    return path
+
+
+@pytest.mark.filterwarnings('error:Mismatched null-like values')
+@pytest.mark.parametrize('tipos', [
+    {'Codigo': str},
+    {'Codigo': 'str', 'Lote': str, 'Nota': str},
+    {'Codigo': str, 'Peso': float, 'Lote': 'string'},
+])
+@pytest.mark.parametrize('engine', ENGINES)
+def test_tipos_texto_conservan_vacios(libro_con_vacios, engine, tipos):
+    from FunctionsAP.utilities.excel_reader import read_excel_fast
+
+    expected = pd.read_excel(libro_con_vacios, dtype=tipos)
+    result = read_excel_fast(libro_con_vacios, engine=_engine(engine), column_types=tipos)
+    pd.testing.assert_frame_equal(result, expected)
+    assert result['Codigo'].isna().tolist() == [False, True, False, False]
+    assert result['Codigo'].dropna().tolist() == ['CS1', '1001', 'CS3']
+
+
+@pytest.fixture
+def libro_por_bloques(tmp_path):
+    from openpyxl import Workbook
+    libro = Workbook()
+    hoja = libro.active
+    hoja.append(['Codigo', 'Peso', 'Bayas', 'Nota', 'Fecha'])
+    for i in range(12):
+        hoja.append([
+            f'CS{i}',
+            None if i < 5 else i * 1.5,           # vacía en el primer bloque
+            i if i < 5 else i + 0.5,              # entera en el primer bloque, decimal después
+            'x' if i < 5 else (i if i % 2 else None),  # texto en el primer bloque, números después
+            None if 0 < i < 7 else pd.Timestamp('2024-04-01') + pd.Timedelta(days=i),
+        ])
+        if i in (3, 7):
+            hoja.append([None] * 5)  # filas vacías intermedias
+    hoja.append([None] * 5)  # fila vacía final
+    path = tmp_path / 'bloques.xlsx'
+    libro.save(path)
+    return path
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_bloques_con_los_tipos_del_primero(libro_por_bloques, engine):
+    from FunctionsAP.utilities.excel_reader import iter_excel_chunks
+
+    chunks = list(iter_excel_chunks(libro_por_bloques, engine=_engine(engine), chunksize=5))
+    assert [len(chunk) for chunk in chunks] == [5, 5, 4]
+    for chunk in chunks[1:]:
+        pd.testing.assert_series_equal(chunk.dtypes, chunks[0].dtypes)
+    assert chunks[0]['Peso'].dtype == np.float64 and chunks[0]['Bayas'].dtype == np.float64
+
+    # Unidos dan lo mismo que pd.read_excel, incluidas las filas vacías intermedias
+    expected = pd.read_excel(libro_por_bloques)
+    result = pd.concat(chunks, ignore_index=True)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_write_join_files_con_columna_vacia_en_el_primer_bloque(libro_por_bloques, engine, tmp_path):
+    pytest.importorskip('pyarrow')
+    from FunctionsAP import write_join_files
+
+    folder = libro_por_bloques.parent
+    output = tmp_path / 'salida.parquet'
+    # Nota mezcla texto y números, así que se fija como texto, como recomienda write_join_files
+    tipos = {'Nota': str}
+    rows = write_join_files(folder, output, excel_engine=_engine(engine), chunksize=5, column_types=tipos)
+    assert rows == 14
+    result = pd.read_parquet(output)
+    # Parquet devuelve los vacíos de texto como None
+    for col in ['Codigo', 'Nota']:
+        result[col] = result[col].where(result[col].notna(), np.nan)
+    pd.testing.assert_frame_equal(result, join_files(folder, column_types=tipos))
@@ -0,0 +1,77 @@
+import importlib
+import re
+
+import numpy as np
+import pytest
+import pytz
+from dateutil import parser
+from dateutil.parser import ParserError
+
+from FunctionsAP import extract_dates_from_filenames
+
+jf = importlib.import_module('FunctionsAP.utilities.join_files')
+
+NOMBRES = [
+    'cosecha_20240315.csv',
+    'cosecha_2024-03-15.csv',
+    'reporte 2024-03-15 10:20:30.csv',
+    'reporte_2024-03-15_23:59:00_campo.csv',
+    'lote_2024-075.csv',
+    'lote_20241399_2024-02-01.csv',
+    'fecha_20240230.csv',
+    'semana_12.csv',
+]
+
+
+def extract_date_baseline(file_name, default_timezone):
+    date_patterns = [
+        r'\d{4}[-/]\d{2}[-/]\d{2}(?:[-_\s]\d{2}[:]\d{2}[:]\d{2})?',
+        r'\d{8}',
+        r'\d{4}[-/]\d{3}'
+    ]
+    for pattern in date_patterns:
+        matches = re.findall(pattern, file_name)
+        if matches:
+            date_str = re.sub(r'[:]', '-', re.sub(r'[_\s]', '-', matches[0]))
+            try:
+                date_obj = parser.parse(date_str)
+                if date_obj.tzinfo is None:
+                    date_obj = pytz.timezone(default_timezone).localize(date_obj)
+                return date_obj
+            except ParserError:
+                continue
+    raise ParserError(f"No se encontró una fecha válida en el nombre del archivo '{file_name}'.")
+
+
+def _baseline_or_error(name, tz):
+    try:
+        return extract_date_baseline(name, tz)
+    except Exception as e:
+        return type(e)
+
+
+@pytest.mark.parametrize('tz', ['UTC', 'America/Lima'])
+@pytest.mark.parametrize('name', NOMBRES)
+def test_extract_date_igual_a_baseline(name, tz):
+    expected = _baseline_or_error(name, tz)
+    if isinstance(expected, type):
+        with pytest.raises(expected):
+            jf.extract_date_from_filename(name, tz)
+    else:
+        result = jf.extract_date_from_filename(name, tz)
+        assert result.replace(tzinfo=None) == expected.replace(tzinfo=None)
+        assert repr(result.tzinfo) == repr(expected.tzinfo)
+
+
+def test_extract_dates_from_filenames():
+    result = extract_dates_from_filenames(NOMBRES + NOMBRES[:2])
+    expected = []
+    for name in NOMBRES + NOMBRES[:2]:
+        value = _baseline_or_error(name, 'UTC')
+        expected.append(np.datetime64('NaT') if isinstance(value, type) else np.datetime64(value.replace(tzinfo=None)))
+    np.testing.assert_array_equal(result, np.array(expected, dtype='datetime64[ns]'))
+
+    with pytest.raises(ParserError):
+        extract_dates_from_filenames(['sin_fecha.csv'], errors='raise')
+    with pytest.raises(ValueError):
+        extract_dates_from_filenames(NOMBRES, errors='ignore')
@@ -0,0 +1,113 @@
+import importlib
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from FunctionsAP import join_files
+
+pytest.importorskip('pyarrow')
+
+fc = importlib.import_module('FunctionsAP.utilities.file_cache')
+jf = importlib.import_module('FunctionsAP.utilities.join_files')
+
+
+def _write_files(folder):
+    for i in range(3):
+        pd.DataFrame({
+            'Codigo': [f'CS{i}{j}' for j in range(10)],
+            'Peso': np.arange(10, dtype=float) * (i + 1),
+        }).to_csv(folder / f'lote_2024-02-0{i + 1}.csv', index=False)
+
+
+@pytest.mark.parametrize('cache_format', ['parquet', 'feather'])
+def test_cache_igual_a_lectura_directa(tmp_path, cache_format):
+    data = tmp_path / 'datos'
+    data.mkdir()
+    _write_files(data)
+    cache = tmp_path / 'cache'
+
+    expected = join_files(data, include_date=True)
+    first, report1 = join_files(data, include_date=True, cache_dir=cache, cache_format=cache_format, return_report=True)
+    second, report2 = join_files(data, include_date=True, cache_dir=cache, cache_format=cache_format, return_report=True)
+
+    pd.testing.assert_frame_equal(first, expected)
+    pd.testing.assert_frame_equal(second, expected)
+    assert (report1['cache'] == 'written').all()
+    assert (report2['cache'] == 'hit').all()
+
+
+def test_cache_detecta_cambios(tmp_path):
+    data = tmp_path / 'datos'
+    data.mkdir()
+    _write_files(data)
+    cache = tmp_path / 'cache'
+    join_files(data, cache_dir=cache)
+
+    # Archivo tocado sin cambiar el contenido: sigue siendo válido gracias al hash
+    touched = data / 'lote_2024-02-01.csv'
+    stat = touched.stat()
+    os.utime(touched, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    # Archivo modificado: se vuelve a leer
+    modified = data / 'lote_2024-02-02.csv'
+    pd.DataFrame({'Codigo': ['X'], 'Peso': [1.0]}).to_csv(modified, index=False)
+    # Archivo eliminado: su entrada se elimina del manifiesto
+    (data / 'lote_2024-02-03.csv').unlink()
+
+    df, report = join_files(data, cache_dir=cache, return_report=True)
+    estados = dict(zip(report['archivo'], report['cache']))
+    assert estados == {'lote_2024-02-01.csv': 'hit', 'lote_2024-02-02.csv': 'written'}
+    pd.testing.assert_frame_equal(df, join_files(data))
+    assert len(list(cache.glob('*.parquet'))) == 2
+
+    # Cambiar las opciones de lectura invalida la caché
+    _, report = join_files(data, cache_dir=cache, normalize_columns=True, return_report=True)
+    assert (report['cache'] == 'written').all()
+
+
+def test_hash_una_vez_por_archivo(tmp_path, monkeypatch):
+    data = tmp_path / 'datos'
+    data.mkdir()
+    _write_files(data)
+    cache = tmp_path / 'cache'
+    hashes = []
+    file_hash = fc.file_hash
+    monkeypatch.setattr(fc, 'file_hash', lambda path, *args: hashes.append(path.name) or file_hash(path, *args))
+
+    join_files(data, cache_dir=cache)
+    assert sorted(hashes) == sorted(path.name for path in data.iterdir())
+
+    # Archivo modificado con el mismo tamaño: el hash que calcula lookup se reutiliza al registrarlo
+    hashes.clear()
+    modified = data / 'lote_2024-02-02.csv'
+    modified.write_text(modified.read_text().replace('CS1', 'CX1'))
+    stat = modified.stat()
+    os.utime(modified, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    _, report = join_files(data, cache_dir=cache, return_report=True)
+    assert hashes == ['lote_2024-02-02.csv']
+    assert dict(zip(report['archivo'], report['cache']))['lote_2024-02-02.csv'] == 'written'
+
+
+def test_archivo_modificado_durante_la_lectura(tmp_path, monkeypatch):
+    data = tmp_path / 'datos'
+    data.mkdir()
+    _write_files(data)
+    cache = tmp_path / 'cache'
+    target = data / 'lote_2024-02-01.csv'
+    read_file = jf.read_file
+
+    def leer_y_modificar(file_path, **kwargs):
+        result = read_file(file_path=file_path, **kwargs)
+        if file_path == target:
+            pd.DataFrame({'Codigo': ['Nuevo'], 'Peso': [0.0]}).to_csv(target, index=False)
+        return result
+
+    monkeypatch.setattr(jf, 'read_file', leer_y_modificar)
+    join_files(data, cache_dir=cache)
+    monkeypatch.undo()
+
+    # La caché guardó el contenido anterior: no debe darse por válida para el archivo nuevo
+    df, report = join_files(data, cache_dir=cache, return_report=True)
+    assert dict(zip(report['archivo'], report['cache']))[target.name] == 'written'
+    pd.testing.assert_frame_equal(df, join_files(data))
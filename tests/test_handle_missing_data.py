@@ -0,0 +1,173 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from FunctionsAP import handle_missing_data
+
+COLUMNAS = ['Bayas', 'Peso', 'Color']
+
+
+def fill_baseline(df, columnas, codigo, semana, method):
+    """
+    Relleno de la versión original, fila por fila. La versión original llamaba a getattr(valores, 'media'),
+    que siempre fallaba; aquí se usan mean/median, que es lo que documenta la función.
+    """
+    stat = {'media': 'mean', 'mediana': 'median'}.get(method)
+    mask = df[columnas].apply(lambda col: col.map(lambda x: pd.isna(x) or x == ''))
+    filtered_mask = mask.any(axis=1) & ~mask.all(axis=1)
+    result = df.copy()
+    for idx in df.index[filtered_mask]:
+        row = df.loc[idx]
+        for col in columnas:
+            if pd.isna(row[col]) or row[col] == '':
+                filtro = (df[codigo] == row[codigo]) & (df[semana] != row[semana])
+                valores = df.loc[filtro, col].replace('', np.nan).dropna()
+                if valores.empty:
+                    continue
+                try:
+                    if method == 'moda':
+                        nuevo = valores.mode()[0]
+                    else:
+                        nuevo = getattr(pd.to_numeric(valores, errors='raise'), stat)()
+                except Exception:
+                    continue
+                if not pd.isna(nuevo):
+                    result.loc[idx, col] = nuevo
+    return result
+
+
+def _frame(rows: int = 400, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        'Codigo': rng.choice([f'CS{i}' for i in range(15)] + [None], rows),
+        'Semana': rng.choice([10, 11, 12, 13, np.nan], rows),
+        'Bayas': rng.integers(20, 60, rows).astype(float),
+        'Peso': rng.normal(8, 2, rows).round(3),
+        'Color': rng.choice(['verde', 'rojo', 'rosado'], rows).astype(object),
+    })
+    for col in COLUMNAS:
+        df.loc[rng.random(rows) < 0.2, col] = np.nan
+    df.loc[rng.random(rows) < 0.05, 'Color'] = ''
+    return df
+
+
+@pytest.mark.parametrize('seed', [0, 1, 2])
+def test_moda_igual_a_baseline(seed):
+    df = _frame(seed=seed)
+    expected = fill_baseline(df, COLUMNAS, 'Codigo', 'Semana', 'moda')
+    result = handle_missing_data(df, COLUMNAS, 'Codigo', 'Semana', mode='fill', method='moda', verbose=False)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize('method', ['moda', 'media'])
+def test_fill_inplace(method):
+    columnas = COLUMNAS if method == 'moda' else ['Bayas', 'Peso']
+    expected = handle_missing_data(_frame(), columnas, 'Codigo', 'Semana', mode='fill', method=method, verbose=False)
+    df = _frame()
+    result = handle_missing_data(df, columnas, 'Codigo', 'Semana', mode='fill', method=method, verbose=False,
+                                 inplace=True)
+    assert result is df
+    pd.testing.assert_frame_equal(df, expected)
+
+    # En modo 'detect' el DataFrame recibido nunca se modifica
+    df = _frame()
+    handle_missing_data(df, COLUMNAS, 'Codigo', 'Semana', inplace=True)
+    pd.testing.assert_frame_equal(df, _frame())
+
+
+@pytest.mark.parametrize('method', ['media', 'mediana'])
+@pytest.mark.parametrize('seed', [0, 1, 2])
+def test_media_y_mediana_rellenan(method, seed):
+    df = _frame(seed=seed)
+    numeric = ['Bayas', 'Peso']
+    expected = fill_baseline(df, numeric, 'Codigo', 'Semana', method)
+    result = handle_missing_data(df, numeric, 'Codigo', 'Semana', mode='fill', method=method, verbose=False)
+
+    pd.testing.assert_frame_equal(result, expected, check_exact=False, rtol=1e-12)
+    # Se rellenan celdas que antes quedaban vacías
+    assert result[numeric].isna().sum().sum() < df[numeric].isna().sum().sum()
+
+
+@pytest.mark.parametrize('method', ['media', 'mediana'])
+def test_media_y_mediana_con_valores_no_numericos(method, capsys):
+    df = pd.DataFrame({
+        'Codigo': ['A', 'A', 'A', 'B', 'B', 'B'],
+        'Semana': [1, 2, 3, 1, 2, 3],
+        'Peso': [np.nan, 'x', 4.0, np.nan, 2.0, 6.0],
+        'Bayas': [1, 2, 3, 4, 5, 6],
+    })
+    result = handle_missing_data(df, ['Peso', 'Bayas'], 'Codigo', 'Semana', mode='fill', method=method, verbose=False)
+
+    # El código A usa un valor no numérico y no se rellena; el código B sí
+    assert pd.isna(result.loc[0, 'Peso'])
+    assert result.loc[3, 'Peso'] == 4.0
+    assert 'Unable to parse string "x"' in capsys.readouterr().out
+
+
+def test_media_con_semana_nula():
+    df = pd.DataFrame({
+        'Codigo': ['A', 'A', 'A', 'A'],
+        'Semana': [1, np.nan, 1, 2],
+        'Peso': [np.nan, np.nan, 3.0, 5.0],
+        'Bayas': [1, 2, 3, 4],
+    })
+    result = handle_missing_data(df, ['Peso', 'Bayas'], 'Codigo', 'Semana', mode='fill', method='media', verbose=False)
+    # Semana 1: solo la semana 2; semana nula: todas las filas del código
+    assert result['Peso'].tolist() == [5.0, 4.0, 3.0, 5.0]
+
+
+def test_metodo_invalido():
+    with pytest.raises(ValueError):
+        handle_missing_data(_frame(), COLUMNAS, 'Codigo', 'Semana', mode='fill', method='promedio')
+
+
+def detect_baseline(df, columnas, codigo, semana, columnas_info=None):
+    mask = df[columnas].apply(lambda col: col.map(lambda x: pd.isna(x) or x == ''))
+    filtered_mask = mask.any(axis=1) & ~mask.all(axis=1)
+    missing_cols = mask.loc[filtered_mask].apply(lambda row: [col for col in row.index if row[col]], axis=1)
+    info_cols = (columnas_info or []) + [codigo, semana]
+    result = df.loc[filtered_mask, info_cols].copy()
+    result['missing_columns'] = missing_cols
+    result['missing_count'] = mask.sum(axis=1)
+    return result
+
+
+@pytest.mark.parametrize('seed', [0, 1])
+def test_detect_igual_a_baseline(seed):
+    df = _frame(seed=seed)
+    expected = detect_baseline(df, COLUMNAS, 'Codigo', 'Semana', columnas_info=['Peso'])
+    result = handle_missing_data(df, COLUMNAS, 'Codigo', 'Semana', columnas_info=['Peso'])
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_detect_bitmask_y_long():
+    df = _frame()
+    lista = handle_missing_data(df, COLUMNAS, 'Codigo', 'Semana')
+
+    bitmask = handle_missing_data(df, COLUMNAS, 'Codigo', 'Semana', detect_output='bitmask')
+    decoded = [[col for j, col in enumerate(COLUMNAS) if int(m) >> j & 1] for m in bitmask['missing_mask']]
+    assert decoded == lista['missing_columns'].tolist()
+    pd.testing.assert_series_equal(bitmask['missing_count'], lista['missing_count'])
+
+    long = handle_missing_data(df, COLUMNAS, 'Codigo', 'Semana', detect_output='long')
+    assert len(long) == lista['missing_count'].sum()
+    regrouped = long.groupby(level=0, sort=False)['columna'].agg(lambda s: s.astype(str).tolist())
+    assert regrouped.tolist() == lista['missing_columns'].tolist()
+
+    with pytest.raises(ValueError):
+        handle_missing_data(df, COLUMNAS, 'Codigo', 'Semana', detect_output='tabla')
+
+
+def test_detect_resumen():
+    df = _frame()
+    result, summary = handle_missing_data(df, COLUMNAS, 'Codigo', 'Semana', return_summary=True)
+    mask = df[COLUMNAS].isna() | df[COLUMNAS].eq('')
+
+    codigo = summary['codigo']
+    assert codigo['filas'].sum() == len(df)
+    assert codigo['filas_incompletas'].sum() == len(result)
+    assert codigo['filas_vacias'].sum() == mask.all(axis=1).sum()
+    assert codigo[COLUMNAS].sum().tolist() == mask.sum().tolist()
+    assert codigo['filas_incompletas'].is_monotonic_decreasing
+    semanas = summary['semana']
+    assert semanas.loc[10, 'filas'] == (df['Semana'] == 10).sum()
@@ -0,0 +1,153 @@
+import importlib
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from FunctionsAP import iter_join_files, join_files
+
+# El nombre join_files del paquete utilities es la función; el módulo se importa por su ruta
+jf = importlib.import_module('FunctionsAP.utilities.join_files')
+
+
+def _write_csvs(folder: Path, num_files: int = 4, rows: int = 20) -> None:
+    for i in range(num_files):
+        pd.DataFrame({
+            'Codigo': [f'CS{i}{j}' for j in range(rows)],
+            'Peso': np.arange(rows, dtype=float) + i,
+        }).to_csv(folder / f'cosecha_2024-01-0{i + 1}.csv', index=False)
+
+
+def test_parallel_igual_a_secuencial(tmp_path):
+    _write_csvs(tmp_path)
+    secuencial = join_files(tmp_path, include_date=True)
+    paralelo, report = join_files(tmp_path, include_date=True, parallel=True, max_workers=2, return_report=True)
+
+    pd.testing.assert_frame_equal(paralelo, secuencial)
+    assert list(report.columns) == jf.REPORT_COLUMNS
+    assert (report['estado'] == 'ok').all()
+    assert report['filas'].sum() == len(secuencial)
+
+
+def test_parallel_stop_on_error(tmp_path):
+    _write_csvs(tmp_path)
+    (tmp_path / 'roto.csv').write_bytes(b'\xff\xfe\x00')
+    with pytest.raises(ValueError):
+        join_files(tmp_path, parallel=True, max_workers=2, stop_on_error=True, encodings=['utf-8'])
+
+
+def test_stop_on_error_cancela_lecturas_pendientes(tmp_path, monkeypatch):
+    _write_csvs(tmp_path, num_files=9)
+    ejecutados = []
+
+    def lectura(file_path, *args):
+        if file_path.name.endswith('01.csv'):
+            raise ValueError('archivo dañado')
+        time.sleep(0.05)
+        ejecutados.append(file_path)
+        return pd.DataFrame(), {}
+
+    monkeypatch.setattr(jf, '_load_file', lectura)
+    files = sorted(tmp_path.iterdir())
+    monkeypatch.setattr(Path, 'iterdir', lambda self: iter(files))
+    start = time.perf_counter()
+    with pytest.raises(ValueError):
+        join_files(tmp_path, parallel=True, max_workers=1, stop_on_error=True)
+    # Se cancelan las lecturas pendientes sin esperar a que el generador se libere
+    assert time.perf_counter() - start < 0.3
+    time.sleep(0.3)
+    assert len(ejecutados) <= 1
+
+
+def _fallar_al_deserializar():
+    raise RuntimeError('no se puede deserializar')
+
+
+class _NoDeserializable:
+    def __reduce__(self):
+        return _fallar_al_deserializar, ()
+
+
+def _lectura_no_deserializable(file_path, *args):
+    if file_path.suffix == '.xlsx':
+        return _NoDeserializable(), {}
+    return pd.DataFrame({'Codigo': [file_path.stem]}), {}
+
+
+def test_parallel_error_del_pool_no_detiene_la_union(tmp_path, monkeypatch):
+    _write_csvs(tmp_path, num_files=3)
+    pd.DataFrame({'Codigo': ['X']}).to_excel(tmp_path / 'libro.xlsx', index=False)
+    monkeypatch.setattr(jf, '_load_file', _lectura_no_deserializable)
+
+    df, report = join_files(tmp_path, parallel=True, max_workers=2, return_report=True, excel_executor='process')
+    estados = dict(zip(report['archivo'], report['estado']))
+    assert estados.pop('libro.xlsx') == 'error'
+    assert set(estados.values()) == {'ok'}
+    assert sorted(df['Codigo']) == sorted(Path(name).stem for name in estados)
+
+
+def test_parallel_excel_en_hilos_por_defecto(tmp_path, monkeypatch):
+    for i in range(2):
+        pd.DataFrame({'Codigo': [f'X{i}'], 'Peso': [float(i)]}).to_excel(tmp_path / f'libro{i}.xlsx', index=False)
+    secuencial = join_files(tmp_path)
+
+    def sin_procesos(*args, **kwargs):
+        raise AssertionError('no se debe crear un pool de procesos')
+
+    monkeypatch.setattr(jf, 'ProcessPoolExecutor', sin_procesos)
+    pd.testing.assert_frame_equal(join_files(tmp_path, parallel=True, max_workers=2), secuencial)
+    with pytest.raises(ValueError):
+        join_files(tmp_path, parallel=True, excel_executor='hilos')
+
+
+def test_sniff_no_parte_caracteres_multibyte(tmp_path):
+    path = tmp_path / 'largo.csv'
+    path.write_text('Código,Descripción\n' * 3, encoding='utf-8')
+    # Prefijo sin salto de línea que termina en medio de la 'ó' (2 bytes en UTF-8)
+    sniff_bytes = len('Có'.encode('utf-8')) - 1
+    encoding, sep = jf.sniff_csv_dialect(path, ['utf-8', 'latin-1'], sniff_bytes=sniff_bytes)
+    assert (encoding, sep) == ('utf-8', ',')
+
+    df = jf.read_file(path, column_types=None, encodings=['utf-8', 'latin-1'], chunksize=None, sniff_bytes=sniff_bytes)
+    assert list(df.columns) == ['Código', 'Descripción']
+
+
+def test_sniff_descarta_codificacion_invalida(tmp_path):
+    path = tmp_path / 'latin.csv'
+    path.write_bytes('Código;Año\nuno;2024\n'.encode('latin-1'))
+    df, dialect = jf.read_file(
+        path, column_types=None, encodings=['utf-8', 'latin-1'], chunksize=None,
+        separators=[',', ';'], return_dialect=True
+    )
+    assert dialect == {'encoding': 'latin-1', 'separator': ';'}
+    assert list(df.columns) == ['Código', 'Año']
+
+
+def test_usecols_y_filtros_igual_a_filtrar_despues(tmp_path):
+    for i in range(3):
+        pd.DataFrame({
+            'Código ': [f'CS{j}' if j % 2 else f'EX{j}' for j in range(30)],
+            'Semana': np.arange(30) % 5 + 8,
+            'Peso': np.arange(30, dtype=float) + i,
+            'Notas': ['x'] * 30,
+        }).to_csv(tmp_path / f'lote_{i}.csv', index=False)
+
+    completo = join_files(tmp_path)
+    mask = completo['Semana'].isin([10, 11]) & completo['Código '].str.startswith('CS')
+    expected = completo.loc[mask, ['Código ', 'Peso']].reset_index(drop=True)
+
+    filtros = [('Semana', 'in', {10, 11}), ('codigo', 'startswith', 'CS')]
+    for kwargs in [{}, {'chunksize': 7}]:
+        df = join_files(tmp_path, usecols=['Codigo', 'peso'], filters=filtros, **kwargs)
+        pd.testing.assert_frame_equal(df.reset_index(drop=True), expected)
+
+    chunks = list(iter_join_files(tmp_path, usecols=['Codigo', 'peso'], filters=filtros, chunksize=7))
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), expected)
+
+
+def test_filtro_con_operador_invalido(tmp_path):
+    _write_csvs(tmp_path, num_files=1)
+    with pytest.raises(ValueError):
+        join_files(tmp_path, filters=[('Peso', '~', 1)])
@@ -0,0 +1,87 @@
+import importlib
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from FunctionsAP import join_files, normalize_and_merge_columns
+
+jf = importlib.import_module('FunctionsAP.utilities.join_files')
+
+
+def normalize_and_merge_baseline(df):
+    normalized_map = {col: jf.remove_accents(col.strip()).lower().capitalize() for col in df.columns}
+    groups = {}
+    for original, norm in normalized_map.items():
+        groups.setdefault(norm, []).append(original)
+    new_df = pd.DataFrame(index=df.index)
+    for norm_name, cols in groups.items():
+        if len(cols) == 1:
+            new_df[norm_name] = df[cols[0]]
+        else:
+            new_df[norm_name] = df[cols].bfill(axis=1).iloc[:, 0]
+    return new_df
+
+
+COLUMNAS = {
+    'entero': [1, 2, 3, 4],
+    'flotante': [1.5, np.nan, 3.0, np.nan],
+    'vacio': [np.nan] * 4,
+    'texto': ['a', None, 'c', None],
+    'texto_vacio': [None] * 4,
+    'booleano': [True, False, True, False],
+    'fecha': pd.to_datetime(['2024-01-01', None, '2024-01-03', None]),
+    'Int64': pd.array([1, None, 3, None], dtype='Int64'),
+    'categoria': pd.Categorical(['x', None, 'y', None]),
+}
+
+
+@pytest.mark.parametrize('segunda', list(COLUMNAS))
+@pytest.mark.parametrize('primera', list(COLUMNAS))
+def test_fusion_igual_a_baseline(primera, segunda):
+    df = pd.DataFrame({'Código': COLUMNAS[primera], ' codigo ': COLUMNAS[segunda], 'Peso': [1.0, 2.0, 3.0, 4.0]})
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        expected = normalize_and_merge_baseline(df)
+        result = normalize_and_merge_columns(df)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_plan_de_varios_encabezados():
+    df1 = pd.DataFrame({'Código': ['a', None], 'Peso ': [1.0, np.nan], 'peso': [5.0, 6.0]})
+    df2 = pd.DataFrame({'Variedad': ['v', 'w'], 'codigo': [None, 'b']})
+    plan = jf.ColumnPlan.from_headers([df1.columns, df2.columns])
+
+    assert plan.output_columns == ['Codigo', 'Peso', 'Variedad']
+    pd.testing.assert_frame_equal(plan.apply(df1), normalize_and_merge_baseline(df1))
+    pd.testing.assert_frame_equal(plan.apply(df2), normalize_and_merge_baseline(df2)[['Codigo', 'Variedad']])
+
+
+def test_join_files_con_plan_de_carpeta(tmp_path, monkeypatch):
+    pd.DataFrame({'Código': ['a', None], 'Peso ': [1, 2], 'peso': [5.5, 6.5]}).to_csv(tmp_path / 'a.csv', index=False)
+    pd.DataFrame({'Variedad': ['v', 'w'], 'CODIGO': ['b', 'c'], 'Código': ['x', None]}).to_csv(tmp_path / 'b.csv', index=False)
+    files = sorted(tmp_path.iterdir())
+    monkeypatch.setattr(type(tmp_path), 'iterdir', lambda self: iter(files))
+
+    expected = pd.concat(
+        [normalize_and_merge_baseline(jf.clean_quotes(pd.read_csv(path))) for path in files],
+        ignore_index=True
+    )
+    pd.testing.assert_frame_equal(join_files(tmp_path, normalize_columns=True), expected)
+    pd.testing.assert_frame_equal(join_files(tmp_path, normalize_columns=True, parallel=True), expected)
+    chunks = list(jf.iter_join_files(tmp_path, normalize_columns=True, chunksize=1))
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), expected)
+
+    # El plan de la carpeta se compila una sola vez con la unión de los encabezados
+    calls = []
+    original = jf.ColumnPlan.from_headers.__func__
+
+    def from_headers(cls, headers):
+        headers = list(headers)
+        calls.append(headers)
+        return original(cls, headers)
+
+    monkeypatch.setattr(jf.ColumnPlan, 'from_headers', classmethod(from_headers))
+    join_files(tmp_path, normalize_columns=True)
+    assert calls == [[['Código', 'Peso ', 'peso'], ['Variedad', 'CODIGO', 'Código']]]
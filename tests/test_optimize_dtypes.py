@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from FunctionsAP import join_files, optimize_dtypes
+
+
+def _frame(rows: int = 200) -> pd.DataFrame:
+    return pd.DataFrame({
+        'Variedad': np.array(['Sweet Globe', 'Allison', 'Timco'], dtype=object)[np.arange(rows) % 3],
+        'Codigo': [f'CS{i}' for i in range(rows)],
+        'Semana': np.arange(rows, dtype=np.int64) % 52,
+        'Cajas': (np.arange(rows) % 7).astype(float),
+        'Peso': np.arange(rows) * 0.1,
+        'Calibre': np.where(np.arange(rows) % 4 == 0, np.nan, 18.5),
+    })
+
+
+def test_optimize_dtypes_conserva_valores():
+    df = _frame()
+    result, info = optimize_dtypes(df, return_report=True)
+
+    assert result['Variedad'].dtype == 'category'
+    assert result['Codigo'].dtype == object
+    assert result['Semana'].dtype == np.int8
+    assert result['Cajas'].dtype == np.int8
+    assert result['Peso'].dtype == np.float64
+    assert result['Calibre'].dtype == np.float32
+    assert info['bytes_despues'] < info['bytes_antes']
+    assert set(info['columnas']) == {'Variedad', 'Semana', 'Cajas', 'Calibre'}
+    # Los valores no cambian, solo los tipos
+    pd.testing.assert_frame_equal(result.astype(df.dtypes.to_dict()), df)
+    # Sin inplace el DataFrame original no se modifica
+    assert df['Semana'].dtype == np.int64
+
+
+def test_optimize_dtypes_tipo_invalido():
+    with pytest.raises(TypeError):
+        optimize_dtypes([1, 2, 3])
+
+
+def test_join_files_informe_de_memoria(tmp_path):
+    _frame().to_csv(tmp_path / 'lote_2024-01-01_campo.csv', index=False)
+    expected = join_files(tmp_path, include_date=True, suffix_index=-1)
+    df, report = join_files(tmp_path, include_date=True, suffix_index=-1, optimize_memory=True, return_report=True)
+
+    info = report.attrs['memoria']
+    assert info['bytes_antes'] == expected.memory_usage(deep=True).sum()
+    assert info['bytes_despues'] == df.memory_usage(deep=True).sum()
+    assert df['Fecha'].dtype == 'category' and df['Suffix'].dtype == 'category'
+    pd.testing.assert_frame_equal(df.astype(expected.dtypes.to_dict()), expected)
+
+    _, report = join_files(tmp_path, return_report=True)
+    assert 'memoria' not in report.attrs
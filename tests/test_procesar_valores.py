@@ -0,0 +1,146 @@
+import itertools
+import logging
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from FunctionsAP import procesar_valores
+
+
+def procesar_valores_baseline(df, replace_map=None, columnas=None, convertir_vacios=False, fill_missing=False,
+                              fill_value=None, convertir_tipo=None, trim_strings=False):
+    """
+    Versión original paso a paso (sin raise_error), usada como referencia.
+    """
+    df_proc = df.copy()
+    columnas = df_proc.columns.tolist() if columnas is None else [col for col in columnas if col in df_proc.columns]
+    if isinstance(replace_map, dict):
+        for col in columnas:
+            try:
+                df_proc[col] = df_proc[col].replace(replace_map)
+            except Exception:
+                pass
+    if convertir_vacios:
+        for col in columnas:
+            try:
+                df_proc[col] = df_proc[col].replace(["", " ", "nan", "None", None], np.nan)
+            except Exception:
+                pass
+    if fill_missing:
+        try:
+            df_proc = df_proc.fillna(fill_value)
+        except Exception:
+            pass
+    for col, new_type in (convertir_tipo or {}).items():
+        if col in df_proc.columns:
+            try:
+                df_proc[col] = df_proc[col].astype(new_type)
+            except Exception:
+                pass
+    if trim_strings:
+        for col in columnas:
+            if pd.api.types.is_string_dtype(df_proc[col]):
+                try:
+                    df_proc[col] = df_proc[col].str.strip()
+                except Exception:
+                    pass
+    return df_proc
+
+
+def _frame(extension: bool = True) -> pd.DataFrame:
+    data = {
+        'obj': pd.Series(['x', '', ' ', 'None', None, 'a ', 'nan', 1, 0], dtype=object),
+        'int': pd.Series([0, 1, 2, 3, 4, 5, 6, 7, 8]),
+        'flt': pd.Series([0.0, 1.5, np.nan, 3, 4, 5, 6, 7, np.nan]),
+        'bool': pd.Series([True, False] * 4 + [True]),
+        'dt': pd.to_datetime(['2024-01-01', None] * 4 + ['2024-01-02']),
+        'Int': pd.array([0, 1, None, 3, 4, 5, 6, 7, 8], dtype='Int64'),
+    }
+    if extension:
+        data['cat'] = pd.Categorical(['x', '', 'None', None, 'y', 'x', ' ', 'a ', 'x'])
+        data['str'] = pd.array(['x', '', 'None', None, 'y ', 'x', ' ', 'nan', 'x'], dtype='string')
+    return pd.DataFrame(data)
+
+
+REPLACE_MAPS = [
+    None, {'x': 'z'}, {np.nan: -1}, {0: np.nan}, {'a ': ''}, {None: 'faltante'}, {1: 'uno'},
+    {'x': np.nan, 'y': 'w'}, {'None': 'N'},
+]
+
+
+@pytest.fixture(autouse=True)
+def _silenciar_log():
+    logging.disable(logging.CRITICAL)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+@pytest.mark.filterwarnings('ignore::FutureWarning')
+@pytest.mark.parametrize('parallel', [False, True])
+@pytest.mark.parametrize('replace_map,convertir_vacios,trim_strings',
+                         list(itertools.product(REPLACE_MAPS, [False, True], [False, True])))
+def test_igual_a_baseline(replace_map, convertir_vacios, trim_strings, parallel):
+    kwargs = dict(replace_map=replace_map, convertir_vacios=convertir_vacios, trim_strings=trim_strings)
+    expected = procesar_valores_baseline(_frame(), **kwargs)
+    result = procesar_valores(_frame(), parallel=parallel, **kwargs)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+@pytest.mark.filterwarnings('ignore::FutureWarning')
+@pytest.mark.parametrize('replace_map', REPLACE_MAPS)
+@pytest.mark.parametrize('fill_value', [0, 7])
+def test_relleno_igual_a_baseline(replace_map, fill_value):
+    kwargs = dict(replace_map=replace_map, convertir_vacios=True, fill_missing=True, fill_value=fill_value,
+                  convertir_tipo={'flt': 'float32'}, columnas=['obj', 'flt', 'Int'])
+    expected = procesar_valores_baseline(_frame(extension=False), **kwargs)
+    result = procesar_valores(_frame(extension=False), **kwargs)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_categoricas_y_string_convierten_vacios():
+    df = _frame()[['cat', 'str']]
+    result = procesar_valores(df, replace_map={'x': 'z'}, convertir_vacios=True)
+    assert result['cat'].tolist()[:5] == ['z', np.nan, np.nan, np.nan, 'y']
+    assert result['str'].isna().tolist() == [False, True, True, True, False, False, True, True, False]
+
+    result = procesar_valores(df, replace_map={np.nan: -1}, convertir_vacios=True)
+    assert result['str'].isna().sum() == 5
+    assert not (result['str'] == '').any()
+
+
+def test_relleno_por_columna():
+    # La versión original rellenaba todo el DataFrame de una vez y no rellenaba nada si una columna fallaba;
+    # ahora se rellena cada columna que admite fill_value y solo se registra el error de las demás
+    df = pd.DataFrame({'cat': pd.Categorical(['x', None]), 'flt': [np.nan, 1.0]})
+    result = procesar_valores(df, fill_missing=True, fill_value=0)
+    assert result['flt'].tolist() == [0.0, 1.0]
+    assert result['cat'].isna().tolist() == [False, True]
+    with pytest.raises(TypeError):
+        procesar_valores(df, fill_missing=True, fill_value=0, raise_error=True)
+
+
+def test_inplace():
+    df = _frame()
+    result = procesar_valores(df, convertir_vacios=True, inplace=True)
+    assert result is df and df['obj'].isna().sum() == 5
+
+
+@pytest.mark.parametrize('executor', ['thread', 'process'])
+def test_paralelo_igual_a_secuencial(executor):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        f'col_{j}': rng.choice(np.array([' a', 'b ', '', 'None', None, 'c'], dtype=object), 300) for j in range(12)
+    })
+    kwargs = dict(replace_map={'c': 'C'}, convertir_vacios=True, trim_strings=True)
+    expected = procesar_valores(df, **kwargs)
+    result = procesar_valores(df, parallel=True, max_workers=3, executor=executor, **kwargs)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_paralelo_relanza_el_primer_error():
+    df = pd.DataFrame({'a': ['1', '2'], 'b': ['x', 'y'], 'c': ['z', 'w']})
+    with pytest.raises(ValueError, match="'x'"):
+        procesar_valores(df, convertir_tipo={'b': int, 'c': int}, raise_error=True, parallel=True, max_workers=2)
+    with pytest.raises(ValueError):
+        procesar_valores(df, parallel=True, executor='gpu')
@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from FunctionsAP import iter_join_files, join_files, write_dataframe, write_join_files
+
+
+@pytest.fixture
+def carpeta(tmp_path):
+    folder = tmp_path / 'datos'
+    folder.mkdir()
+    for i in range(3):
+        pd.DataFrame({
+            'Codigo': [f'CS{i}{j}' for j in range(25)],
+            'Peso': np.arange(25, dtype=float) / (i + 1),
+        }).to_csv(folder / f'cosecha_2024-03-0{i + 1}_campo.csv', index=False)
+    return folder
+
+
+def test_iter_join_files_por_bloques(carpeta):
+    expected = join_files(carpeta, include_date=True, suffix_index=-1)
+    chunks = list(iter_join_files(carpeta, include_date=True, suffix_index=-1, chunksize=10))
+
+    assert max(len(chunk) for chunk in chunks) <= 10
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), expected)
+
+
+def test_iter_join_files_chunksize_invalido(carpeta):
+    with pytest.raises(ValueError):
+        list(iter_join_files(carpeta, chunksize=0))
+
+
+def test_write_join_files_csv(carpeta, tmp_path):
+    output = tmp_path / 'salida.csv'
+    rows = write_join_files(carpeta, output, chunksize=10)
+
+    expected = join_files(carpeta)
+    assert rows == len(expected)
+    pd.testing.assert_frame_equal(pd.read_csv(output), expected)
+
+
+def test_write_join_files_parquet(carpeta, tmp_path):
+    pytest.importorskip('pyarrow')
+    output = tmp_path / 'salida.parquet'
+    rows = write_join_files(carpeta, output, include_date=True, chunksize=10)
+
+    expected = join_files(carpeta, include_date=True)
+    assert rows == len(expected)
+    pd.testing.assert_frame_equal(pd.read_parquet(output), expected)
+
+
+def test_write_join_files_feather(carpeta, tmp_path):
+    pytest.importorskip('pyarrow')
+    output = tmp_path / 'salida.feather'
+    write_join_files(carpeta, output, include_date=True, chunksize=10)
+
+    expected = join_files(carpeta, include_date=True)
+    pd.testing.assert_frame_equal(pd.read_feather(output), expected)
+
+
+def test_write_join_files_particionado(carpeta, tmp_path):
+    pytest.importorskip('pyarrow')
+    output = tmp_path / 'dataset'
+    write_join_files(carpeta, output, partition_cols=['Fecha'], include_date=True, chunksize=10)
+
+    assert sorted(p.name for p in output.iterdir()) == [
+        'Fecha=2024-03-01', 'Fecha=2024-03-02', 'Fecha=2024-03-03'
+    ]
+    expected = join_files(carpeta, include_date=True)
+    result = pd.read_parquet(output)
+    # Los valores de partición se leen como categorías de texto
+    result['Fecha'] = pd.to_datetime(result['Fecha'].astype(str)).astype(expected['Fecha'].dtype)
+    result = result.sort_values('Codigo').reset_index(drop=True)[expected.columns]
+    pd.testing.assert_frame_equal(result, expected.sort_values('Codigo').reset_index(drop=True))
+
+
+@pytest.mark.parametrize('suffix', ['.csv', '.parquet', '.feather'])
+def test_write_dataframe(carpeta, tmp_path, suffix):
+    if suffix != '.csv':
+        pytest.importorskip('pyarrow')
+    df = join_files(carpeta)
+    output = tmp_path / f'salida{suffix}'
+    assert write_dataframe(df, output, chunksize=7) == len(df)
+
+    reader = {'.csv': pd.read_csv, '.parquet': pd.read_parquet, '.feather': pd.read_feather}[suffix]
+    pd.testing.assert_frame_equal(reader(output), df)
+
+
+def test_write_dataframe_formato_invalido(tmp_path):
+    with pytest.raises(ValueError):
+        write_dataframe(pd.DataFrame({'a': [1]}), tmp_path / 'salida.txt')